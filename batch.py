@@ -0,0 +1,181 @@
+# batch.py
+
+import sys
+import json
+import time
+import asyncio
+import argparse
+import statistics
+from langchain_core.messages import HumanMessage, AIMessage
+from main import create_event_planning_graph, make_session_config, is_awaiting_review
+from tool_prefetch import close_prefetch
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+DEFAULT_WORKERS = 10
+DEFAULT_DECISION = "proceed"   # Auto-decision applied at the first human_review interrupt
+MAX_REVIEW_ROUNDS = 3          # Later interrupts (after a modification) are approved
+
+PLAN_FIELDS = ("calendar_info", "finance_info", "health_info", "weather_info", "traffic_info",
+               "invitation_info", "whatsapp_status", "email_status")
+
+# ============================================================================
+# SINGLE REQUEST
+# ============================================================================
+
+async def _run_until_pause(app, payload, config, node_timings: dict) -> None:
+    """Run the graph until it ends or pauses, accumulating wall-clock time per node."""
+    last = time.perf_counter()
+    async for update in app.astream(payload, config, stream_mode="updates"):
+        now = time.perf_counter()
+        # The graph runs one node per step, so the gap between updates is that node's time.
+        for node in update:
+            if node.startswith("__"):  # "__interrupt__" marks the pause, it is not a node
+                continue
+            node_timings[node] = node_timings.get(node, 0.0) + (now - last)
+        last = now
+
+async def plan_request(app, record: dict, decision: str = DEFAULT_DECISION, max_reviews: int = MAX_REVIEW_ROUNDS) -> dict:
+    """
+    Run one batch record through the graph, auto-answering human review. Once the
+    result record is built, the session's speculative tool runs are cancelled and
+    its checkpoints deleted.
+    """
+    request = record["request"]
+    config = make_session_config()
+    node_timings = {}
+    reviews = 0
+    start = time.perf_counter()
+
+    initial_state = {
+        "messages": [HumanMessage(content=request)],
+        "current_agent": "orchestrator",
+        "next_action": "scheduler"
+    }
+    try:
+        await _run_until_pause(app, initial_state, config, node_timings)
+        state = await app.aget_state(config)
+
+        while is_awaiting_review(state) and reviews < max_reviews:
+            answer = record.get("decision", decision) if reviews == 0 else DEFAULT_DECISION
+            reviews += 1
+            await app.aupdate_state(config, {"messages": [HumanMessage(content=answer)]})
+            await _run_until_pause(app, None, config, node_timings)
+            state = await app.aget_state(config)
+
+        planning_data = config["configurable"]["planning_data"]
+        messages = state.values.get("messages", [])
+        return {
+            "id": record.get("id"),
+            "request": request,
+            "status": "awaiting_review" if is_awaiting_review(state) else "completed",
+            "plan": {field: planning_data[field] for field in PLAN_FIELDS if planning_data.get(field)},
+            "tool_calls": [call["name"] for msg in messages if isinstance(msg, AIMessage) for call in msg.tool_calls],
+            "reviews": reviews,
+            "node_timings_s": {node: round(seconds, 4) for node, seconds in node_timings.items()},
+            "latency_s": round(time.perf_counter() - start, 4),
+        }
+    finally:
+        close_prefetch(config)
+        await app.checkpointer.adelete_thread(config["configurable"]["thread_id"])
+
+# ============================================================================
+# BATCH RUNNER
+# ============================================================================
+
+async def run_batch(input_path: str, output_path: str, workers: int = DEFAULT_WORKERS,
+                    decision: str = DEFAULT_DECISION, max_reviews: int = MAX_REVIEW_ROUNDS, app=None) -> dict:
+    """
+    Stream requests from a JSONL file through a pool of concurrent sessions and
+    write one result record per request to `output_path` as soon as it finishes.
+    Each input line is {"request": "...", "id": optional, "decision": optional override}.
+    """
+    app = app or create_event_planning_graph()
+    queue = asyncio.Queue(maxsize=workers * 2)  # Bounded so huge inputs are not read up front
+    latencies = []
+    counts = {"completed": 0, "awaiting_review": 0, "error": 0}
+
+    with open(output_path, "w", encoding="utf-8") as out:
+
+        def write_result(result: dict):
+            out.write(json.dumps(result, ensure_ascii=False) + "\n")
+            out.flush()
+
+        async def worker():
+            while True:
+                record = await queue.get()
+                if record is None:
+                    return
+                try:
+                    result = await plan_request(app, record, decision, max_reviews)
+                    latencies.append(result["latency_s"])
+                except Exception as e:
+                    result = {"id": record.get("id"), "request": record.get("request"), "status": "error", "error": str(e)}
+                counts[result["status"]] += 1
+                write_result(result)
+
+        start = time.perf_counter()
+        tasks = [asyncio.create_task(worker()) for _ in range(workers)]
+
+        with open(input_path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    if isinstance(record, str):
+                        record = {"request": record}
+                    if not isinstance(record, dict) or "request" not in record:
+                        raise ValueError('expected an object with a "request" field')
+                    record.setdefault("id", line_number)
+                except ValueError as e:
+                    counts["error"] += 1
+                    write_result({"id": line_number, "status": "error", "error": f"Invalid input line: {e}"})
+                    continue
+                await queue.put(record)
+
+        for _ in tasks:
+            await queue.put(None)
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    total = sum(counts.values())
+    return {
+        "requests": total,
+        **counts,
+        "elapsed_s": round(elapsed, 3),
+        "requests_per_sec": round(total / elapsed, 3) if elapsed else 0.0,
+        "p50_latency_s": round(statistics.median(latencies), 4) if latencies else None,
+        "p95_latency_s": round(latencies[int(0.95 * (len(latencies) - 1))], 4) if latencies else None,
+    }
+
+# ============================================================================
+# ENTRY POINT
+# ============================================================================
+
+def main():
+    """Entry point for headless batch planning."""
+    parser = argparse.ArgumentParser(description="Run event planning requests from a JSONL file without a human in the loop.")
+    parser.add_argument("input", help="JSONL file with one {\"request\": ...} object per line")
+    parser.add_argument("output", help="JSONL file to write one result record per request")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="concurrent planning sessions")
+    parser.add_argument("--decision", default=DEFAULT_DECISION,
+                        help="auto-decision at human review: 'proceed' to approve, or modification text")
+    parser.add_argument("--max-reviews", type=int, default=MAX_REVIEW_ROUNDS)
+    args = parser.parse_args()
+
+    summary = asyncio.run(run_batch(args.input, args.output, args.workers, args.decision, args.max_reviews))
+
+    print("\n" + "="*60, file=sys.stderr)
+    print("📋 BATCH PLANNING SUMMARY", file=sys.stderr)
+    print("="*60, file=sys.stderr)
+    print(f"Requests: {summary['requests']} (completed {summary['completed']}, "
+          f"awaiting review {summary['awaiting_review']}, errors {summary['error']})", file=sys.stderr)
+    print(f"Throughput: {summary['requests_per_sec']} requests/sec over {summary['elapsed_s']}s", file=sys.stderr)
+    print(f"Latency: p50 {summary['p50_latency_s']}s | p95 {summary['p95_latency_s']}s", file=sys.stderr)
+    print("="*60, file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
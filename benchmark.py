@@ -0,0 +1,1249 @@
+# benchmark.py
+
+import io
+import os
+import re
+import sys
+import json
+import time
+import asyncio
+import random
+import resource
+import subprocess
+import argparse
+import platform
+import warnings
+import functools
+import statistics
+import contextvars
+import contextlib
+from collections import OrderedDict
+from pydantic import PrivateAttr
+from langchain_core.messages import HumanMessage, AIMessage, ToolMessage
+from langchain_core.runnables import Runnable
+from fake_model import FakeChatModel, EVENT_TYPES
+
+# ============================================================================
+# LOCAL FAKE MODEL
+# ============================================================================
+
+SCHEDULER_SCRIPT = [("calendar", ["query"]), ("finance", ["query"]), ("health", ["query"])]
+COMMUNICATION_SCRIPT = [("whatsapp_message", ["message"])]
+# FakeChatModel scripts with one tool round per agent whatever the event type; a bound
+# model only plays the calls of its own tools, so one script drives both agents.
+BENCH_SCRIPTS = {
+    event_type: [[(name, {arg: "{request}" for arg in args}) for name, args in script]
+                 for script in (SCHEDULER_SCRIPT, COMMUNICATION_SCRIPT)]
+    for event_type, _ in EVENT_TYPES
+}
+
+def bench_models(latency: float = 0.0, **kwargs) -> dict:
+    """
+    Scheduler and communication models for create_event_planning_graph(): one
+    FakeChatModel (`latency` seconds per call, plus `kwargs`) playing BENCH_SCRIPTS.
+    """
+    from main import scheduler_tools, communication_tools
+
+    fake = FakeChatModel(latency=latency, scripts=BENCH_SCRIPTS, **kwargs)
+    return {"scheduler_model": fake.bind_tools(scheduler_tools),
+            "communication_model": fake.bind_tools(communication_tools)}
+
+class PrefixCachingFakeModel(FakeChatModel):
+    """
+    FakeChatModel that models a serving engine with automatic prefix caching
+    (Ollama/llama.cpp, vLLM). The bound tool schema and the messages are rendered
+    to a token stream in order; full blocks of `block_size` tokens are identified
+    by a hash chained over everything before them, and a block is a cache hit only
+    if every block before it was one too. stats() gives the reuse rate; prefill
+    time (`prompt_token_latency`) is charged only for the uncached tokens.
+    """
+
+    block_size: int = 16
+    max_blocks: int = 65536
+    _blocks: OrderedDict = PrivateAttr(default_factory=OrderedDict)  # chained block hash -> None, in LRU order
+    _counters: dict = PrivateAttr(default_factory=lambda: {"calls": 0, "prompt_tokens": 0, "cached_tokens": 0})
+
+    def _render(self, messages, tools) -> list:
+        parts = [json.dumps(tools or [], sort_keys=True)]
+        for msg in messages:
+            parts.append(f"<{msg.type}>")
+            parts.append(str(msg.content))
+            for call in getattr(msg, "tool_calls", None) or []:
+                parts.append(json.dumps([call["name"], call["args"]], sort_keys=True))
+        return re.findall(r"\w+|[^\w\s]", "\n".join(parts))
+
+    def _lookup(self, tokens) -> int:
+        """Return the number of leading tokens served from cache and cache the rest."""
+        cached = 0
+        prefix_hit = True
+        chain = 0
+        for start in range(0, len(tokens) - self.block_size + 1, self.block_size):
+            chain = hash((chain, tuple(tokens[start:start + self.block_size])))
+            if prefix_hit and chain in self._blocks:
+                self._blocks.move_to_end(chain)
+                cached += self.block_size
+                continue
+            prefix_hit = False
+            self._blocks[chain] = None
+            if len(self._blocks) > self.max_blocks:
+                self._blocks.popitem(last=False)
+        return cached
+
+    def _prompt_latency(self, messages, tools, prompt_tokens: int) -> float:
+        tokens = self._render(messages, tools)
+        cached = self._lookup(tokens)
+        self._counters["calls"] += 1
+        self._counters["prompt_tokens"] += len(tokens)
+        self._counters["cached_tokens"] += cached
+        return (len(tokens) - cached) * self.prompt_token_latency
+
+    def stats(self) -> dict:
+        prompt_tokens = self._counters["prompt_tokens"]
+        return {**self._counters,
+                "reuse_rate": self._counters["cached_tokens"] / prompt_tokens if prompt_tokens else 0.0}
+
+# Per-session model timings; set by the e2e driver and inherited by the graph's tasks.
+_session_model_seconds = contextvars.ContextVar("session_model_seconds", default=None)
+
+class TimedModel(Runnable):
+    """Wraps a bound model and adds each call's duration to the current session's total."""
+
+    def __init__(self, model):
+        self.model = model
+
+    def _record(self, seconds: float):
+        timings = _session_model_seconds.get()
+        if timings is not None:
+            timings.append(seconds)
+
+    def invoke(self, input, config=None, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self.model.invoke(input, config, **kwargs)
+        finally:
+            self._record(time.perf_counter() - start)
+
+    async def ainvoke(self, input, config=None, **kwargs):
+        start = time.perf_counter()
+        try:
+            return await self.model.ainvoke(input, config, **kwargs)
+        finally:
+            self._record(time.perf_counter() - start)
+
+# ============================================================================
+# SESSION DRIVER
+# ============================================================================
+
+async def run_session(app, request: str, decision: str = "proceed") -> float:
+    """Drive one session through planning, human review and communication. Returns seconds."""
+    from main import make_session_config
+
+    start = time.perf_counter()
+    config = make_session_config()
+    initial_state = {
+        "messages": [HumanMessage(content=request)],
+        "current_agent": "orchestrator",
+        "next_action": "scheduler"
+    }
+    await app.ainvoke(initial_state, config)
+    await app.aupdate_state(config, {"messages": [HumanMessage(content=decision)]})
+    await app.ainvoke(None, config)
+    return time.perf_counter() - start
+
+async def run_sessions(app, sessions: int, concurrency: int) -> dict:
+    """Run `sessions` sessions with at most `concurrency` in flight and summarize latency."""
+    slots = asyncio.Semaphore(concurrency)
+
+    async def bounded(i):
+        async with slots:
+            return await run_session(app, f"Plan a birthday party at home for 20 people #{i}")
+
+    start = time.perf_counter()
+    latencies = sorted(await asyncio.gather(*(bounded(i) for i in range(sessions))))
+    elapsed = time.perf_counter() - start
+    return {
+        "sessions": sessions,
+        "concurrency": concurrency,
+        "sessions_per_sec": sessions / elapsed,
+        "p50_s": statistics.median(latencies),
+        "p95_s": latencies[int(0.95 * (len(latencies) - 1))],
+    }
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+
+async def bench_agent_modes(concurrencies, latency: float):
+    """Compare thread-pool agent wrappers against async-native agents."""
+    from main import create_event_planning_graph
+
+    print(f"Agent execution modes (fake model latency {latency * 1000:.0f} ms per call)")
+    print(f"{'mode':<10}{'concurrency':>12}{'sessions/s':>12}{'p50 ms':>10}{'p95 ms':>10}")
+    for native_async, label in ((False, "threaded"), (True, "native")):
+        app = create_event_planning_graph(
+            **bench_models(latency),
+            native_async=native_async,
+        )
+        for concurrency in concurrencies:
+            result = await run_sessions(app, sessions=max(concurrency * 2, 10), concurrency=concurrency)
+            print(f"{label:<10}{concurrency:>12}{result['sessions_per_sec']:>12.1f}"
+                  f"{result['p50_s'] * 1000:>10.0f}{result['p95_s'] * 1000:>10.0f}")
+
+async def bench_state_polling(history_sizes, runs: int):
+    """Per-run cost of reading the checkpoint on every streamed event versus once at the pause."""
+    from main import create_event_planning_graph, make_session_config, STREAM_EVENT_FILTERS
+
+    app = create_event_planning_graph(
+        **bench_models(),
+    )
+
+    print(f"State reads while streaming to the human_review pause ({runs} runs each)")
+    print(f"{'history':>8}{'events/run':>12}{'poll ms/run':>13}{'once ms/run':>13}{'saved':>8}")
+    for size in history_sizes:
+        history = [(HumanMessage if i % 2 == 0 else AIMessage)(content=f"Earlier turn {i} " * 20) for i in range(size)]
+        timings = {}
+        for poll_every_event in (True, False):
+            elapsed = 0.0
+            events = 0
+            for _ in range(runs):
+                config = make_session_config()
+                initial_state = {
+                    "messages": history + [HumanMessage(content="Plan a birthday party at home for 20 people")],
+                    "current_agent": "orchestrator",
+                    "next_action": "scheduler"
+                }
+                start = time.perf_counter()
+                async for event in app.astream_events(initial_state, config, version="v2", **STREAM_EVENT_FILTERS):
+                    events += 1
+                    if poll_every_event:
+                        app.get_state(config)
+                await app.aget_state(config)
+                elapsed += time.perf_counter() - start
+            timings[poll_every_event] = elapsed / runs * 1000
+        saved = 1 - timings[False] / timings[True]
+        print(f"{size:>8}{events // runs:>12}{timings[True]:>13.1f}{timings[False]:>13.1f}{saved:>8.0%}")
+
+def _timed(method, samples: list):
+    """Wrap an async checkpointer method so each call's latency lands in `samples`."""
+    async def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        result = await method(*args, **kwargs)
+        samples.append(time.perf_counter() - start)
+        return result
+    return wrapper
+
+def _percentile(samples, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[int(fraction * (len(ordered) - 1))] if ordered else 0.0
+
+async def bench_checkpointer_backend(backend: str, sessions: int, concurrency: int, path: str):
+    """Run `sessions` sessions up to the human_review pause on one checkpointer backend."""
+    from main import create_event_planning_graph, create_checkpointer, make_session_config
+
+    checkpointer = create_checkpointer(backend, path)
+    writes, reads = [], []
+    checkpointer.aput = _timed(checkpointer.aput, writes)
+    app = create_event_planning_graph(
+        **bench_models(),
+        checkpointer=checkpointer,
+    )
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    slots = asyncio.Semaphore(concurrency)
+    configs = [make_session_config() for _ in range(sessions)]
+
+    async def pause(i):
+        async with slots:
+            initial_state = {
+                "messages": [HumanMessage(content=f"Plan a birthday party at home for 20 people #{i}")],
+                "current_agent": "orchestrator",
+                "next_action": "scheduler"
+            }
+            await app.ainvoke(initial_state, configs[i])
+
+    start = time.perf_counter()
+    await asyncio.gather(*(pause(i) for i in range(sessions)))
+    elapsed = time.perf_counter() - start
+
+    # Latest-checkpoint lookup for every paused session, as a resume would do.
+    for config in configs:
+        read_start = time.perf_counter()
+        await checkpointer.aget_tuple({"configurable": {"thread_id": config["configurable"]["thread_id"]}})
+        reads.append(time.perf_counter() - read_start)
+
+    if backend == "sqlite":
+        checkpointer.close()
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"{backend:<8}{sessions:>9}{sessions / elapsed:>11.1f}"
+          f"{_percentile(writes, 0.5) * 1e3:>10.3f}{_percentile(writes, 0.99) * 1e3:>10.3f}"
+          f"{_percentile(reads, 0.5) * 1e3:>10.3f}{_percentile(reads, 0.99) * 1e3:>10.3f}"
+          f"{(rss_after - rss_before) / 1024:>11.1f}{rss_after / 1024:>10.1f}")
+
+def bench_checkpointers(sessions: int, concurrency: int, path: str):
+    """Compare MemorySaver and the SQLite checkpointer, each in a fresh process for clean RSS."""
+    print(f"Checkpointers: {sessions} sessions paused at human review (concurrency {concurrency})")
+    print(f"{'backend':<8}{'sessions':>9}{'sess/s':>11}{'put p50':>10}{'put p99':>10}"
+          f"{'get p50':>10}{'get p99':>10}{'RSS +MB':>11}{'RSS MB':>10}   (latencies in ms)")
+    sys.stdout.flush()
+    for backend in ("memory", "sqlite"):
+        if os.path.exists(path):
+            os.remove(path)
+        subprocess.run([sys.executable, __file__, "checkpointer", "--backend", backend,
+                        "--sessions", str(sessions), "--concurrency", str(concurrency), "--db", path], check=True)
+    print(f"SQLite file size: {os.path.getsize(path) / 2**20:.1f} MB ({path})")
+
+def _stored_checkpoint_bytes(checkpointer) -> int:
+    """Bytes held by a checkpointer: serialized payloads for memory, database pages for SQLite."""
+    if hasattr(checkpointer, "conn"):
+        checkpointer.flush()
+        page_count = checkpointer.conn.execute("PRAGMA page_count").fetchone()[0]
+        page_size = checkpointer.conn.execute("PRAGMA page_size").fetchone()[0]
+        return page_count * page_size
+    total = sum(len(blob) for _, blob in checkpointer.blobs.values())
+    total += sum(len(c[1]) + len(m[1]) for checkpoints in checkpointer.storage.values()
+                 for saved in checkpoints.values() for c, m, _ in saved.values())
+    total += sum(len(w[2][1]) for writes in checkpointer.writes.values() for w in writes.values())
+    return total
+
+def _checkpoint_count(checkpointer, config) -> int:
+    return sum(1 for _ in checkpointer.list({"configurable": {"thread_id": config["configurable"]["thread_id"]}}))
+
+async def bench_retention(rounds: int, keep_last: int, path: str):
+    """Checkpoint count and stored bytes over a long modify/re-plan session, with and without retention."""
+    from main import create_event_planning_graph, create_checkpointer, make_session_config
+
+    print(f"Checkpoint retention over one session with {rounds} modify/re-plan rounds")
+    print(f"{'backend':<8}{'keep_last':>10}{'round':>7}{'checkpoints':>13}{'stored KB':>11}")
+    for backend in ("memory", "sqlite"):
+        for keep in (None, keep_last):
+            if os.path.exists(path):
+                os.remove(path)
+            checkpointer = create_checkpointer(backend, path, keep_last=keep)
+            app = create_event_planning_graph(
+                **bench_models(),
+                checkpointer=checkpointer,
+                incremental_replanning=False,  # Every round is a full scheduler re-plan
+            )
+            config = make_session_config()
+            initial_state = {
+                "messages": [HumanMessage(content="Plan a birthday party at home for 20 people")],
+                "current_agent": "orchestrator",
+                "next_action": "scheduler"
+            }
+            await app.ainvoke(initial_state, config)
+            for round_number in range(1, rounds + 1):
+                await app.aupdate_state(config, {"messages": [HumanMessage(content=f"Please modify the budget, round {round_number}")]})
+                await app.ainvoke(None, config)
+                if round_number == 1 or round_number % max(1, rounds // 5) == 0:
+                    print(f"{backend:<8}{str(keep):>10}{round_number:>7}{_checkpoint_count(checkpointer, config):>13}"
+                          f"{_stored_checkpoint_bytes(checkpointer) / 1024:>11.1f}")
+            if backend == "sqlite":
+                checkpointer.close()
+
+async def bench_context_window(rounds: int, token_budget: int, per_token_ms: float):
+    """Scheduler prompt size and model time per re-planning round, unbounded vs token budget."""
+    from main import create_event_planning_graph, make_session_config
+
+    print(f"Scheduler prompt over {rounds} re-planning rounds (fake model: {per_token_ms} ms per 1k prompt tokens)")
+    print(f"{'budget':>8}{'round':>7}{'max prompt tokens':>19}{'scheduler model ms':>20}")
+    for budget in (None, token_budget):
+        app = create_event_planning_graph(
+            **bench_models(0.01, prompt_token_latency=per_token_ms / 1000 / 1000),
+            scheduler_token_budget=budget,
+            incremental_replanning=False,  # Measure the scheduler prompt on every round
+        )
+        config = make_session_config()
+        payload = {
+            "messages": [HumanMessage(content="Plan an outdoor birthday party downtown for 40 people with a $2000 budget")],
+            "current_agent": "orchestrator",
+            "next_action": "scheduler"
+        }
+        for round_number in range(rounds + 1):
+            if round_number:
+                await app.aupdate_state(config, {"messages": [HumanMessage(content=f"Please modify the plan: change the budget to ${1000 + 100 * round_number}")]})
+                payload = None
+            before = len((await app.aget_state(config)).values.get("messages", []))
+            start = time.perf_counter()
+            await app.ainvoke(payload, config)
+            elapsed = time.perf_counter() - start
+            # Only the scheduler runs until the pause; its prompt sizes are in the usage metadata
+            tokens = [msg.usage_metadata["input_tokens"] for msg in (await app.aget_state(config)).values["messages"][before:]
+                      if isinstance(msg, AIMessage) and msg.usage_metadata]
+            print(f"{str(budget):>8}{round_number:>7}{max(tokens, default=0):>19}{elapsed * 1000:>20.1f}")
+
+async def bench_prefix_cache(sessions: int, concurrency: int, per_token_ms: float):
+    """Prompt prefix reuse of the scheduler and communication models on a prefix-caching fake."""
+    from main import create_event_planning_graph, scheduler_tools, communication_tools
+
+    scheduler_model, communication_model = (
+        PrefixCachingFakeModel(latency=0.01, prompt_token_latency=per_token_ms / 1000 / 1000, scripts=BENCH_SCRIPTS)
+        for _ in range(2))
+    app = create_event_planning_graph(scheduler_model=scheduler_model.bind_tools(scheduler_tools),
+                                      communication_model=communication_model.bind_tools(communication_tools))
+    result = await run_sessions(app, sessions, concurrency)
+
+    print(f"Prompt prefix cache reuse over {sessions} sessions (concurrency {concurrency}, "
+          f"{scheduler_model.block_size}-token blocks)")
+    print(f"{'agent':<15}{'calls':>7}{'prompt tok':>12}{'cached tok':>12}{'reuse':>8}")
+    for label, model in (("scheduler", scheduler_model), ("communication", communication_model)):
+        stats = model.stats()
+        print(f"{label:<15}{stats['calls']:>7}{stats['prompt_tokens']:>12}{stats['cached_tokens']:>12}{stats['reuse_rate']:>8.0%}")
+    print(f"Throughput: {result['sessions_per_sec']:.1f} sessions/s | p50 {result['p50_s'] * 1000:.0f} ms")
+
+E2E_REQUESTS = [
+    "Plan a birthday party at home for 20 people",
+    "Plan an outdoor picnic in the park for the team",
+    "Organize a dinner at a downtown restaurant",
+    "Schedule a quarterly planning meeting",
+    "Plan a wedding reception for 120 guests",
+]
+TOOL_NODES = ("scheduler_tools", "communication_tools")
+
+async def bench_e2e_level(concurrency: int, sessions: int, latency: float, distribution: str) -> dict:
+    """Full pipeline at one concurrency level on the fake model; returns a result record."""
+    from main import create_event_planning_graph, scheduler_tools, communication_tools
+    from batch import plan_request
+
+    fake = FakeChatModel(latency=latency, latency_distribution=distribution)
+    app = create_event_planning_graph(
+        scheduler_model=TimedModel(fake.bind_tools(scheduler_tools)),
+        communication_model=TimedModel(fake.bind_tools(communication_tools)),
+    )
+    slots = asyncio.Semaphore(concurrency)
+    records = []
+
+    async def one(i):
+        async with slots:
+            model_seconds = []
+            _session_model_seconds.set(model_seconds)
+            record = await plan_request(app, {"id": i, "request": f"{E2E_REQUESTS[i % len(E2E_REQUESTS)]} #{i}"})
+            record["model_s"] = sum(model_seconds)
+            records.append(record)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(sessions)))
+    elapsed = time.perf_counter() - start
+
+    latencies = [r["latency_s"] for r in records]
+    model_time = [r["model_s"] for r in records]
+    tool_time = [sum(r["node_timings_s"].get(node, 0.0) for node in TOOL_NODES) for r in records]
+    overhead = [max(0.0, l - m - t) for l, m, t in zip(latencies, model_time, tool_time)]
+    nodes = {}
+    for record in records:
+        for node, seconds in record["node_timings_s"].items():
+            nodes.setdefault(node, []).append(seconds)
+
+    def ms(samples, fraction=None):
+        value = statistics.fmean(samples) if fraction is None else _percentile(samples, fraction)
+        return round(value * 1000, 3)
+
+    return {
+        "concurrency": concurrency,
+        "sessions": sessions,
+        "completed": sum(1 for r in records if r["status"] == "completed"),
+        "sessions_per_sec": round(sessions / elapsed, 2),
+        "latency_ms": {"p50": ms(latencies, 0.5), "p95": ms(latencies, 0.95), "p99": ms(latencies, 0.99)},
+        "model_ms_mean": ms(model_time),
+        "tool_ms_mean": ms(tool_time),
+        "graph_overhead_ms_mean": ms(overhead),
+        "graph_overhead_fraction": round(sum(overhead) / sum(latencies), 4),
+        "nodes": {node: {"mean_ms": ms(samples), "p50_ms": ms(samples, 0.5), "p95_ms": ms(samples, 0.95)}
+                  for node, samples in sorted(nodes.items())},
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+def bench_e2e(concurrencies, sessions_per_level: int, latency: float, distribution: str, output: str):
+    """
+    Drive orchestrator -> scheduler -> tools -> human_review -> communication -> tools
+    at each concurrency level (each in a fresh process, for a clean peak RSS) and
+    write all results to `output` as JSON.
+    """
+    import langgraph
+    from importlib.metadata import version
+
+    print(f"End-to-end pipeline on the fake model ({latency * 1000:.0f} ms {distribution} per call)")
+    print(f"{'conc':>6}{'sessions':>10}{'sess/s':>9}{'p50 ms':>9}{'p99 ms':>9}{'model ms':>10}"
+          f"{'tools ms':>10}{'graph ms':>10}{'graph %':>9}{'RSS MB':>9}")
+    levels = []
+    for concurrency in concurrencies:
+        sessions = max(sessions_per_level, concurrency)
+        proc = subprocess.run([sys.executable, __file__, "e2e", "--level", str(concurrency), "--sessions", str(sessions),
+                               "--latency", str(latency), "--distribution", distribution],
+                              check=True, capture_output=True, text=True)
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        levels.append(result)
+        print(f"{concurrency:>6}{sessions:>10}{result['sessions_per_sec']:>9.1f}{result['latency_ms']['p50']:>9.0f}"
+              f"{result['latency_ms']['p99']:>9.0f}{result['model_ms_mean']:>10.1f}{result['tool_ms_mean']:>10.1f}"
+              f"{result['graph_overhead_ms_mean']:>10.1f}{result['graph_overhead_fraction']:>9.1%}{result['peak_rss_mb']:>9.1f}")
+
+    print("\nPer-node latency at concurrency 1 (mean / p95 ms):")
+    for node, stats in levels[0]["nodes"].items():
+        print(f"  {node:<22}{stats['mean_ms']:>9.2f}{stats['p95_ms']:>9.2f}")
+
+    results = {
+        "benchmark": "e2e",
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "git_revision": subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                       cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None,
+        "python": platform.python_version(),
+        "langgraph": version("langgraph"),
+        "model": {"latency_s": latency, "distribution": distribution},
+        "levels": levels,
+    }
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to {output}")
+
+async def bench_streaming(sessions: int, latency: float, token_ms: float):
+    """
+    Time to first visible model output with token streaming, versus the end of the
+    model turn (the earliest a whole-message renderer could show anything).
+    Events go through main.handle_stream_event, so rendering cost is included.
+    """
+    from main import (create_event_planning_graph, make_session_config, handle_stream_event, scheduler_tools,
+                      communication_tools, STREAM_EVENT_FILTERS)
+
+    fake = FakeChatModel(latency=latency, token_latency=token_ms / 1000)
+    app = create_event_planning_graph(fake.bind_tools(scheduler_tools), fake.bind_tools(communication_tools))
+    first_output, turn_end = [], []
+
+    for i in range(sessions):
+        config = make_session_config()
+        initial_state = {
+            "messages": [HumanMessage(content=f"{E2E_REQUESTS[i % len(E2E_REQUESTS)]} #{i}")],
+            "current_agent": "orchestrator",
+            "next_action": "scheduler"
+        }
+        started, shown = {}, {}
+        with contextlib.redirect_stdout(io.StringIO()):
+            async for event in app.astream_events(initial_state, config, version="v2", **STREAM_EVENT_FILTERS):
+                await handle_stream_event(event)
+                run_id, kind = event.get("run_id"), event["event"]
+                now = time.perf_counter()
+                if kind == "on_chat_model_start":
+                    started[run_id] = now
+                elif kind == "on_chat_model_stream" and run_id not in shown and event["data"]["chunk"].content:
+                    shown[run_id] = now
+                elif kind == "on_chat_model_end" and run_id in shown:
+                    first_output.append(shown[run_id] - started[run_id])
+                    turn_end.append(now - started[run_id])
+
+    print(f"Time to first visible output per text-producing model turn ({len(first_output)} turns, "
+          f"fake model {latency * 1000:.0f} ms + {token_ms:.0f} ms/token)")
+    print(f"{'':<22}{'p50 ms':>9}{'p95 ms':>9}")
+    print(f"{'whole message':<22}{_percentile(turn_end, 0.5) * 1000:>9.1f}{_percentile(turn_end, 0.95) * 1000:>9.1f}")
+    print(f"{'token streaming':<22}{_percentile(first_output, 0.5) * 1000:>9.1f}{_percentile(first_output, 0.95) * 1000:>9.1f}")
+
+async def bench_event_streaming(runs: int):
+    """Events per run and CPU time per run: astream_events v1 unfiltered vs v2 unfiltered vs v2 filtered."""
+    from main import (create_event_planning_graph, make_session_config, handle_stream_event, scheduler_tools,
+                      communication_tools, STREAM_EVENT_FILTERS)
+
+    fake = FakeChatModel()
+    app = create_event_planning_graph(fake.bind_tools(scheduler_tools), fake.bind_tools(communication_tools))
+    variants = [("v1", "v1", {}), ("v2", "v2", {}), ("v2 filtered", "v2", STREAM_EVENT_FILTERS)]
+
+    print(f"Event streaming to the human_review pause, rendered with handle_stream_event ({runs} runs each)")
+    print(f"{'variant':<14}{'events/run':>12}{'CPU ms/run':>12}{'wall ms/run':>13}")
+    for label, version, filters in [("warm-up", "v2", {})] + variants:
+        events = 0
+        cpu_start, wall_start = time.process_time(), time.perf_counter()
+        for i in range(runs):
+            config = make_session_config()
+            initial_state = {
+                "messages": [HumanMessage(content=f"{E2E_REQUESTS[i % len(E2E_REQUESTS)]} #{i}")],
+                "current_agent": "orchestrator",
+                "next_action": "scheduler"
+            }
+            with warnings.catch_warnings(), contextlib.redirect_stdout(io.StringIO()):
+                warnings.simplefilter("ignore")  # v1 is deprecated; measured for comparison only
+                async for event in app.astream_events(initial_state, config, version=version, **filters):
+                    events += 1
+                    await handle_stream_event(event)
+        cpu = (time.process_time() - cpu_start) / runs
+        wall = (time.perf_counter() - wall_start) / runs
+        if label == "warm-up":
+            continue
+        print(f"{label:<14}{events / runs:>12.0f}{cpu * 1000:>12.2f}{wall * 1000:>13.2f}")
+
+class _CountingStream(io.StringIO):
+    """StringIO that counts write calls (each would be a syscall on a real terminal)."""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+def _render_samples(kb: int) -> dict:
+    """Multi-kilobyte tool outputs: plain text, emoji-heavy, CJK and one unbroken token."""
+    size = kb * 1024
+    sentence = "Venue rental $450.00, catering for 25 guests $612.50, decorations and supplies $95.25. "
+    emoji = "🎉 Party supplies 🎈 balloons 🎂 cake 🍕 pizza 🥤 drinks 🎁 gifts 🌤️ sunny, 24°C. "
+    cjk = "誕生日パーティーの予定 会場は東京都内 参加者二十五名 予算五万円 天気は晴れ "
+    return {
+        "ascii": "\n".join([sentence * 3] * (size // (len(sentence) * 3))),
+        "emoji": "\n".join([emoji * 3] * (size // (len(emoji.encode()) * 3))),
+        "cjk": "\n".join([cjk * 4] * (size // (len(cjk.encode()) * 4))),
+        "long token": "https://maps.example.com/route?" + "x" * size,
+    }
+
+def bench_render(sizes_kb, repeats: int):
+    """Time and write calls of rendering a tool output box through handle_stream_event's on_tool_end branch."""
+    from main import handle_stream_event
+    from langchain_core.messages import ToolMessage
+
+    print(f"Tool output box rendering (on_tool_end, best of {repeats})")
+    print(f"{'input':<12}{'KB':>5}{'lines out':>11}{'ms/box':>9}{'writes':>8}")
+    for kb in sizes_kb:
+        for label, content in _render_samples(kb).items():
+            event = {"event": "on_tool_end", "name": "finance",
+                     "data": {"output": ToolMessage(content=content, name="finance", tool_call_id="call_0")}}
+            best = float("inf")
+            for _ in range(repeats):
+                stream = _CountingStream()
+                with contextlib.redirect_stdout(stream):
+                    start = time.perf_counter()
+                    asyncio.run(handle_stream_event(event))
+                    best = min(best, time.perf_counter() - start)
+            print(f"{label:<12}{kb:>5}{stream.getvalue().count(chr(10)):>11}{best * 1000:>9.2f}{stream.writes:>8}")
+
+async def bench_hedging(calls: int, concurrency: int):
+    """Tail latency of a heavy-tailed primary backend alone versus hedged with a second backend."""
+    from main import scheduler_tools
+    from model_router import HedgedChatModel
+
+    # Primary: fast median, heavy tail (like a shared hosted API). Secondary: slower but steady.
+    primary = FakeChatModel(latency=0.1, latency_distribution="lognormal", latency_spread=1.0, seed=1).bind_tools(scheduler_tools)
+    secondary = FakeChatModel(latency=0.15, latency_distribution="lognormal", latency_spread=0.25, seed=2).bind_tools(scheduler_tools)
+    hedged = HedgedChatModel(primary, secondary, initial_delay=0.3)
+
+    print(f"Hedged requests: {calls} calls at concurrency {concurrency} "
+          f"(primary lognormal 100 ms sigma 1.0, secondary lognormal 150 ms sigma 0.25)")
+    print(f"{'router':<16}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}{'extra calls':>13}")
+    for label, model in (("primary only", primary), ("secondary only", secondary), ("hedged", hedged)):
+        slots = asyncio.Semaphore(concurrency)
+        latencies = []
+
+        async def call(i):
+            async with slots:
+                start = time.perf_counter()
+                await model.ainvoke([HumanMessage(content=f"Plan a birthday party at home #{i}")])
+                latencies.append(time.perf_counter() - start)
+
+        await asyncio.gather(*(call(i) for i in range(calls)))
+        extra = f"{hedged.stats()['hedge_rate']:.1%}" if model is hedged else "-"
+        print(f"{label:<16}{_percentile(latencies, 0.5) * 1000:>9.0f}{_percentile(latencies, 0.95) * 1000:>9.0f}"
+              f"{_percentile(latencies, 0.99) * 1000:>9.0f}{max(latencies) * 1000:>9.0f}{extra:>13}")
+    print(f"Hedge delay settled at {hedged.stats()['hedge_delay_s'] * 1000:.0f} ms; "
+          f"secondary won {hedged.counters['secondary_wins']} of {hedged.counters['hedged']} hedges")
+
+class OllamaStubServer:
+    """
+    Minimal Ollama-compatible HTTP server (/api/version, /api/generate, /api/chat)
+    with keep-alive connections. A new connection costs `connect_ms` (handshake and
+    network round trips of a remote host), the first request for a model that is
+    not resident costs `load_ms`, and every generation costs `gen_ms`. A model stays
+    resident for the `keep_alive` sent with the request (default 5 minutes).
+    """
+
+    def __init__(self, connect_ms: float, load_ms: float, gen_ms: float):
+        self.connect_s, self.load_s, self.gen_s = connect_ms / 1000, load_ms / 1000, gen_ms / 1000
+        self.connections = 0
+        self.loads = 0
+        self._resident_until = {}
+        self._writers = set()
+        self._server = None
+        self.url = None
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.url = f"http://127.0.0.1:{self._server.sockets[0].getsockname()[1]}"
+        return self
+
+    async def close(self):
+        self._server.close()
+        for writer in list(self._writers):
+            writer.close()  # Ends the idle keep-alive handlers
+        await self._server.wait_closed()
+
+    @staticmethod
+    def _seconds(keep_alive) -> float:
+        if isinstance(keep_alive, (int, float)):
+            return float(keep_alive)
+        units = {"s": 1, "m": 60, "h": 3600}
+        text = str(keep_alive or "5m")
+        return float(text[:-1]) * units[text[-1]] if text[-1] in units else float(text)
+
+    async def _generate(self, body: dict) -> dict:
+        model = body.get("model")
+        if self._resident_until.get(model, 0) < time.monotonic():
+            self.loads += 1
+            await asyncio.sleep(self.load_s)
+        self._resident_until[model] = time.monotonic() + self._seconds(body.get("keep_alive"))
+        await asyncio.sleep(self.gen_s)
+        return {"model": model, "created_at": "2024-01-01T00:00:00Z", "done": True, "done_reason": "stop",
+                "prompt_eval_count": 10, "eval_count": 1, "total_duration": int(self.gen_s * 1e9)}
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        self._writers.add(writer)
+        await asyncio.sleep(self.connect_s)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while (line := await reader.readline()).strip():
+                    key, _, value = line.decode("latin-1").partition(":")
+                    headers[key.strip().lower()] = value.strip()
+                raw = await reader.readexactly(int(headers.get("content-length", 0)))
+                body = json.loads(raw) if raw else {}
+                path = request_line.decode("latin-1").split()[1]
+                if path == "/api/version":
+                    payload = json.dumps({"version": "0.0.0-stub"})
+                elif path == "/api/generate":
+                    payload = json.dumps({**await self._generate(body), "response": "Hi"})
+                elif path == "/api/chat":
+                    # Streamed as NDJSON like the real server: one content chunk, then the final chunk.
+                    final = await self._generate(body)
+                    lines = [{"model": final["model"], "created_at": final["created_at"], "done": False,
+                              "message": {"role": "assistant", "content": "Planned."}},
+                             {**final, "message": {"role": "assistant", "content": ""}}]
+                    payload = "\n".join(json.dumps(line) for line in lines) + "\n"
+                else:
+                    payload = json.dumps({"error": "not found"})
+                data = payload.encode()
+                writer.write(f"HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\n"
+                             f"Content-Length: {len(data)}\r\n\r\n".encode() + data)
+                await writer.drain()
+        except (ConnectionResetError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+async def bench_ollama_pool(requests: int, idle: float, connect_ms: float, load_ms: float, gen_ms: float):
+    """First-request, steady-state and after-idle latency of ChatOllama: defaults vs pooled with warm-up."""
+    from langchain_ollama import ChatOllama
+    from main import scheduler_tools, communication_tools, OLLAMA_KEEP_ALIVE
+    from ollama_pool import OllamaConnectionPool
+
+    print(f"Ollama connection pooling and warm-up against a stub server "
+          f"(connect {connect_ms:.0f} ms, model load {load_ms:.0f} ms, generation {gen_ms:.0f} ms)")
+    print(f"{'client':<20}{'warm-up ms':>12}{'first ms':>10}{'steady ms':>11}{f'after {idle:.0f}s idle':>17}"
+          f"{'connections':>13}{'loads':>7}")
+    for label in ("default", "pooled + warm-up"):
+        stub = await OllamaStubServer(connect_ms, load_ms, gen_ms).start()
+        warmup_ms = 0.0
+        if label == "default":
+            model = ChatOllama(base_url=stub.url, model="stub")
+        else:
+            pool = OllamaConnectionPool(stub.url)
+            model = ChatOllama(base_url=stub.url, model="stub", keep_alive=OLLAMA_KEEP_ALIVE, **pool.client_kwargs())
+            start = time.perf_counter()
+            await pool.warm_up("stub", keep_alive=OLLAMA_KEEP_ALIVE)
+            warmup_ms = (time.perf_counter() - start) * 1000
+        # Both agents' models share one client, as in main.py.
+        bound = [model.bind_tools(scheduler_tools), model.bind_tools(communication_tools)]
+
+        latencies = []
+        for i in range(requests):
+            start = time.perf_counter()
+            await bound[i % 2].ainvoke([HumanMessage(content=f"Plan a birthday party #{i}")])
+            latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(idle)  # e.g. the user reading the plan at human review
+        start = time.perf_counter()
+        await bound[0].ainvoke([HumanMessage(content="Modify: make it on Sunday")])
+        after_idle = time.perf_counter() - start
+        await stub.close()
+        if label != "default":
+            await pool.aclose()
+
+        print(f"{label:<20}{warmup_ms:>12.0f}{latencies[0] * 1000:>10.0f}{statistics.mean(latencies[1:]) * 1000:>11.1f}"
+              f"{after_idle * 1000:>17.1f}{stub.connections:>13}{stub.loads:>7}")
+
+def _import_times(backend: str) -> dict:
+    """`python -X importtime -c "import main"`: {"total_ms", "packages": {top-level package: self ms}}."""
+    env = {**os.environ, "EVENT_PLANNER_BACKEND": backend}
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"], capture_output=True, text=True,
+                          env=env, cwd=os.path.dirname(os.path.abspath(__file__)), check=True)
+    packages, total_us = {}, 0
+    for line in proc.stderr.splitlines():
+        match = re.match(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)", line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, module = int(match[1]), int(match[2]), match[3], match[4]
+        package = module.split(".")[0]
+        packages[package] = packages.get(package, 0) + self_us
+        if module == "main" and len(indent) == 1:
+            total_us = cumulative_us
+    return {"total_ms": total_us / 1000,
+            "packages": {name: us / 1000 for name, us in sorted(packages.items(), key=lambda item: -item[1])}}
+
+def _time_to_prompt(backend: str) -> float:
+    """Seconds from launching the CLI to its first prompt on stdout."""
+    env = {**os.environ, "EVENT_PLANNER_BACKEND": backend, "PYTHONWARNINGS": "ignore"}
+    start = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, "main.py"], stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                            stderr=subprocess.DEVNULL, env=env, cwd=os.path.dirname(os.path.abspath(__file__)))
+    output = b""
+    while b"Describe the event" not in output:
+        chunk = os.read(proc.stdout.fileno(), 65536)
+        if not chunk:
+            raise RuntimeError("CLI exited before showing its prompt")
+        output += chunk
+    elapsed = time.perf_counter() - start
+    proc.communicate(b"quit\n", timeout=60)
+    return elapsed
+
+def _time_to_graph(backend: str) -> float:
+    """Seconds from launching Python to a compiled default graph (models and tools ready)."""
+    env = {**os.environ, "EVENT_PLANNER_BACKEND": backend, "PYTHONWARNINGS": "ignore"}
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "import main; main.get_event_planning_graph()"], env=env, check=True,
+                   stdout=subprocess.DEVNULL, cwd=os.path.dirname(os.path.abspath(__file__)))
+    return time.perf_counter() - start
+
+def bench_startup(backend: str, runs: int, top: int, output: str):
+    """CLI startup: import-time breakdown by package, wall clock to the first prompt and to a ready graph."""
+    from importlib.metadata import version
+
+    imports = _import_times(backend)
+    print(f"Startup with the {backend!r} backend")
+    print(f"\nimport main: {imports['total_ms']:.0f} ms (self time by top-level package, -X importtime)")
+    for name, ms in list(imports["packages"].items())[:top]:
+        print(f"  {name:<28}{ms:>9.1f} ms")
+
+    prompt_s = [_time_to_prompt(backend) for _ in range(runs)]
+    graph_s = [_time_to_graph(backend) for _ in range(runs)]
+    print(f"\n{'wall clock (median of ' + str(runs) + ')':<30}{'ms':>9}")
+    print(f"{'  to first prompt':<30}{statistics.median(prompt_s) * 1000:>9.0f}")
+    print(f"{'  to compiled graph':<30}{statistics.median(graph_s) * 1000:>9.0f}")
+
+    results = {
+        "benchmark": "startup",
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "git_revision": subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                       cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None,
+        "python": platform.python_version(),
+        "langgraph": version("langgraph"),
+        "backend": backend,
+        "import_main_ms": imports["total_ms"],
+        "import_packages_ms": imports["packages"],
+        "first_prompt_ms": [round(s * 1000, 1) for s in prompt_s],
+        "compiled_graph_ms": [round(s * 1000, 1) for s in graph_s],
+    }
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to {output}")
+
+def _synthetic_intents(count: int, seed: int = 7):
+    """Labelled requests from templates and vocabulary beyond the training corpus."""
+    rng = random.Random(seed)
+    events = ["birthday party", "wedding", "conference", "family reunion", "picnic", "baby shower", "graduation party",
+              "team offsite", "charity gala", "fundraiser", "housewarming", "barbecue", "retirement party",
+              "book club meetup", "music festival", "workshop", "board meeting", "anniversary dinner",
+              "bachelorette party", "game night", "school trip", "hackathon", "christmas dinner", "pool party",
+              "engagement dinner", "farewell lunch", "potluck", "class reunion", "product launch", "tea party"]
+    details = ["for 30 guests", "next Saturday", "in the park", "with a $2000 budget", "downtown", "on May 6", "",
+               "at the beach", "for the whole office", "this weekend", "at our place", "for about 50 people"]
+    days = ["Friday", "next Sunday", "the 14th", "tomorrow", "June 3", "next month"]
+    recipients = ["everyone", "the guests", "my team", "all attendees", "Sarah and Tom", "the family group",
+                  "my colleagues", "the neighbours", "the committee", "my friends", "the parents", "the speakers"]
+    status = ["is confirmed", "moved to 7pm", "is cancelled", "starts at noon", "is on {day}", "needs an RSVP by {day}"]
+    scheduler_templates = [
+        "{verb} a {event} {detail}", "{verb} our {event} {detail}", "{Event} {detail}",
+        "Move the {event} to {day}", "Change the {event} to a cheaper venue", "Reschedule our {event} for {day}",
+        "What will a {event} {detail} cost?", "Is {day} a good day for a {event}?",
+        "Could you look after the {event} {detail}?", "We want a {event} {detail}, can you help?",
+        "{verb} a {event} {detail} and then {comm} everyone",
+    ]
+    communication_templates = [
+        "Send a WhatsApp to {who} about the {event}", "Email {who} that the {event} {status}",
+        "Text {who}: the {event} {status}", "Let {who} know the {event} {status}",
+        "Remind {who} about the {event} {day}", "Invite {who} to the {event} {day}",
+        "Notify {who} that the {event} {status}", "Send out the invitations for the {event}",
+        "Tell {who} the {event} {status}", "Message {who} with the {event} details",
+        "Please inform {who} that the {event} {status}", "Drop {who} a note about the {event}",
+    ]
+    verbs = ["Plan", "Organize", "Help me plan", "Can you organise", "I'd like to host", "Set up", "Arrange",
+             "Put together", "We're throwing", "I need help with", "Sort out", "Prepare", "Coordinate", "Book"]
+    comms = ["email", "text", "message", "notify", "invite"]
+    requests = []
+    for _ in range(count):
+        label = rng.choice(("scheduler", "communication"))
+        template = rng.choice(scheduler_templates if label == "scheduler" else communication_templates)
+        event = rng.choice(events)
+        text = template.format(verb=rng.choice(verbs), event=event, Event=event.capitalize(),
+                               detail=rng.choice(details), day=rng.choice(days), comm=rng.choice(comms),
+                               who=rng.choice(recipients), status=rng.choice(status).format(day=rng.choice(days)))
+        requests.append((" ".join(text.split()), label))
+    return requests
+
+def bench_intent_router(count: int, threshold: float):
+    """Accuracy and latency of the orchestrator's routing: legacy keywords vs patterns vs classifier vs router."""
+    from intent_router import IntentRouter, match_patterns
+    from intent_corpus import INTENT_CORPUS
+
+    start = time.perf_counter()
+    router = IntentRouter().fit(INTENT_CORPUS)
+    train_ms = (time.perf_counter() - start) * 1000
+    requests = _synthetic_intents(count)
+
+    def legacy(text):
+        keywords = ["plan", "organize", "schedule", "birthday", "party", "meeting"]
+        return "scheduler" if any(keyword in text.lower() for keyword in keywords) else "communication"
+
+    def classifier(text):
+        probabilities = router.predict(text)
+        route = max(probabilities, key=probabilities.get)
+        return {"route": route, "confidence": probabilities[route]}
+
+    print(f"Intent routing on {count} synthetic requests (trained on {len(INTENT_CORPUS)} examples in {train_ms:.0f} ms)")
+    print(f"{'router':<22}{'accuracy':>10}{'decided':>9}{'acc. decided':>14}{'mean us':>9}{'p99 us':>8}")
+    variants = [
+        ("legacy keywords", lambda text: {"route": legacy(text), "confidence": 1.0}),
+        ("patterns only", lambda text: {"route": match_patterns(text), "confidence": 1.0}),
+        ("classifier only", classifier),
+        ("patterns + classifier", router.classify),
+    ]
+    for label, route in variants:
+        timings, correct, decided, decided_correct = [], 0, 0, 0
+        for text, expected in requests:
+            start = time.perf_counter()
+            result = route(text)
+            timings.append(time.perf_counter() - start)
+            # "decided": confident enough to route without the LLM fallback
+            confident = result["route"] is not None and result["confidence"] >= threshold
+            correct += result["route"] == expected
+            decided += confident
+            decided_correct += confident and result["route"] == expected
+        print(f"{label:<22}{correct / count:>10.1%}{decided / count:>9.1%}"
+              f"{(decided_correct / decided if decided else 0):>14.1%}"
+              f"{statistics.mean(timings) * 1e6:>9.1f}{_percentile(timings, 0.99) * 1e6:>8.1f}")
+    print(f"(decided = confidence >= {threshold}; the rest would go to the LLM fallback. "
+          f"Patterns only leave requests with cues for both or neither route undecided.)")
+
+# Requests that state a date or a budget: the scripted fake model only passes a
+# query, so prefetches that used the stated date/amount do not match its calls.
+PREFETCH_REQUESTS = E2E_REQUESTS + [
+    "Plan a birthday party on May 6th with a $2000 budget",
+    "Organize a beach barbecue on 7/14 for the neighbours",
+]
+# Per-tool latency of the slow tool copies (a remote calendar API, a pricing service, ...)
+SLOW_TOOL_DELAYS = {"calendar": 0.25, "finance": 0.3, "health": 0.15, "weather": 0.4, "traffic": 0.35}
+
+def _slow_tools(tools, delays: dict):
+    """Copies of `tools` with the same names and schemas that sleep `delays[name]` seconds first."""
+    from langchain_core.runnables import RunnableConfig
+    from langchain_core.tools import StructuredTool
+
+    def slow(tool, delay):
+        async def run(config: RunnableConfig, **kwargs):
+            await asyncio.sleep(delay)
+            return tool.func(config=config, **kwargs)
+        return StructuredTool(name=tool.name, description=tool.description, args_schema=tool.args_schema, coroutine=run,
+                              response_format=tool.response_format)
+    return [slow(tool, delays.get(tool.name, 0.0)) for tool in tools]
+
+async def bench_prefetch(sessions: int, concurrency: int, latency: float):
+    """Planning latency (request to human review) with and without speculative tool prefetch, on slow tools."""
+    from main import create_event_planning_graph, make_session_config, scheduler_tools, communication_tools
+    from tool_prefetch import prefetch_stats
+
+    fake = FakeChatModel(latency=latency)
+    slow_tools = _slow_tools(scheduler_tools, SLOW_TOOL_DELAYS)
+    delays = ", ".join(f"{name} {seconds * 1000:.0f}" for name, seconds in SLOW_TOOL_DELAYS.items())
+    print(f"Tool prefetch: {sessions} sessions at concurrency {concurrency}, model {latency * 1000:.0f} ms per call, "
+          f"tools ms: {delays}")
+    print(f"{'mode':<12}{'p50 ms':>9}{'p95 ms':>9}{'mean ms':>9}{'hit rate':>10}{'wasted':>8}{'tool ms saved':>15}")
+    for enabled in (False, True):
+        app = create_event_planning_graph(
+            scheduler_model=fake.bind_tools(scheduler_tools),
+            communication_model=fake.bind_tools(communication_tools),
+            tool_prefetch=enabled,
+            scheduler_tool_list=slow_tools,
+        )
+        slots = asyncio.Semaphore(concurrency)
+        latencies, stats = [], []
+
+        async def one(i):
+            async with slots:
+                config = make_session_config()
+                request = f"{PREFETCH_REQUESTS[i % len(PREFETCH_REQUESTS)]} #{i}"
+                start = time.perf_counter()
+                await app.ainvoke({"messages": [HumanMessage(content=request)], "current_agent": "orchestrator",
+                                   "next_action": "scheduler"}, config)
+                latencies.append(time.perf_counter() - start)
+                stats.append(prefetch_stats(config))
+
+        await asyncio.gather(*(one(i) for i in range(sessions)))
+        line = (f"{'prefetch' if enabled else 'baseline':<12}{_percentile(latencies, 0.5) * 1000:>9.0f}"
+                f"{_percentile(latencies, 0.95) * 1000:>9.0f}{statistics.fmean(latencies) * 1000:>9.0f}")
+        if enabled:
+            hits = sum(s["hits"] for s in stats)
+            calls = sum(s["hits"] + s["misses"] + s["failed"] for s in stats)
+            line += (f"{hits / calls:>10.1%}{sum(s['wasted'] for s in stats) / len(stats):>8.2f}"
+                     f"{statistics.fmean(s['saved_ms'] for s in stats):>15.0f}")
+        print(line)
+
+    print("\nPer request (prefetch):")
+    for request in PREFETCH_REQUESTS:
+        print(f"  {request[:55]:<57}", end="")
+        config = make_session_config()
+        await app.ainvoke({"messages": [HumanMessage(content=request)], "current_agent": "orchestrator",
+                           "next_action": "scheduler"}, config)
+        s = prefetch_stats(config) or {"hits": 0, "misses": 0, "wasted": 0}
+        print(f"{s['hits']} hit, {s['misses']} miss, {s['wasted']} wasted")
+
+REPLAN_MODIFICATIONS = [
+    "Please change the date to June 14th",
+    "Change the budget to $3000",
+    "Change the venue to a downtown hotel",
+    "Reschedule to Saturday and lower the budget to $800",
+    "Change the theme to pirates",          # no known facet: full re-plan in both modes
+]
+
+async def bench_replan(rounds: int, latency: float):
+    """Latency of a "modify" review round: targeted tool re-runs versus the full scheduler re-run."""
+    from main import create_event_planning_graph, make_session_config, scheduler_tools, communication_tools
+
+    fake = FakeChatModel(latency=latency)
+    slow_tools = _slow_tools(scheduler_tools, SLOW_TOOL_DELAYS)
+    request = "Plan a wedding reception for 120 guests"   # Uses all five scheduler tools
+    print(f"Re-planning on modify: \"{request}\", {rounds} rounds per modification, "
+          f"model {latency * 1000:.0f} ms per call, slow tools")
+    print(f"{'modification':<52}{'full ms':>9}{'incr ms':>9}{'speedup':>9}  tools re-run")
+    apps = {incremental: create_event_planning_graph(
+                scheduler_model=fake.bind_tools(scheduler_tools),
+                communication_model=fake.bind_tools(communication_tools),
+                scheduler_tool_list=slow_tools, incremental_replanning=incremental)
+            for incremental in (False, True)}
+    totals = {False: [], True: []}
+    for modification in REPLAN_MODIFICATIONS:
+        latencies, rerun = {False: [], True: []}, []
+        for incremental, app in apps.items():
+            for _ in range(rounds):
+                config = make_session_config()
+                await app.ainvoke({"messages": [HumanMessage(content=request)], "current_agent": "orchestrator",
+                                   "next_action": "scheduler"}, config)
+                await app.aupdate_state(config, {"messages": [HumanMessage(content=modification)]})
+                before = len((await app.aget_state(config)).values["messages"])
+                start = time.perf_counter()
+                await app.ainvoke(None, config)
+                latencies[incremental].append(time.perf_counter() - start)
+                if incremental and not rerun:
+                    messages = (await app.aget_state(config)).values["messages"][before:]
+                    rerun = [msg.name for msg in messages if isinstance(msg, ToolMessage)]
+            totals[incremental] += latencies[incremental]
+        full, incr = statistics.fmean(latencies[False]), statistics.fmean(latencies[True])
+        print(f"{modification:<52}{full * 1000:>9.0f}{incr * 1000:>9.0f}{full / incr:>8.1f}x  {', '.join(rerun)}")
+    print(f"{'all':<52}{statistics.fmean(totals[False]) * 1000:>9.0f}{statistics.fmean(totals[True]) * 1000:>9.0f}"
+          f"{statistics.fmean(totals[False]) / statistics.fmean(totals[True]):>8.1f}x")
+
+def _slow_memoized_tools(tools, delays: dict):
+    """Like _slow_tools, but the delay is inside the memoized function, so a cache hit skips it."""
+    from langchain_core.tools import StructuredTool
+    from tool_cache import memoized_tool
+
+    def slow(tool, delay):
+        original = tool.func.__wrapped__
+
+        @functools.wraps(original)
+        def run(*args, **kwargs):
+            time.sleep(delay)
+            return original(*args, **kwargs)
+        return StructuredTool.from_function(memoized_tool(run), name=tool.name, description=tool.description,
+                                            args_schema=tool.args_schema, response_format="content_and_artifact")
+    return [slow(tool, delays.get(tool.name, 0.0)) for tool in tools]
+
+async def bench_tool_cache(sessions: int, concurrency: int, latency: float):
+    """Planning latency and per-tool hit rates with the memoized tool cache on and off, on slow tools."""
+    from main import create_event_planning_graph, make_session_config, scheduler_tools, communication_tools
+    from main import TOOL_CACHE_MAX_ENTRIES, TOOL_CACHE_TTLS
+    from tool_cache import configure_tool_cache
+    from metrics import MetricsRegistry, MetricsCallbackHandler
+
+    fake = FakeChatModel(latency=latency)
+    app = create_event_planning_graph(
+        scheduler_model=fake.bind_tools(scheduler_tools),
+        communication_model=fake.bind_tools(communication_tools),
+        scheduler_tool_list=_slow_memoized_tools(scheduler_tools, SLOW_TOOL_DELAYS),
+    )
+    print(f"Tool cache: {sessions} sessions over {len(E2E_REQUESTS)} distinct requests at concurrency {concurrency}, "
+          f"model {latency * 1000:.0f} ms per call, slow tools")
+    print(f"{'cache':<8}{'p50 ms':>9}{'p95 ms':>9}{'tools ms':>10}{'hit rate':>10}")
+    for enabled in (False, True):
+        cache = configure_tool_cache(TOOL_CACHE_MAX_ENTRIES, TOOL_CACHE_TTLS if enabled else {})
+        registry = MetricsRegistry()
+        slots = asyncio.Semaphore(concurrency)
+        latencies = []
+
+        async def one(i):
+            async with slots:
+                config = make_session_config(callbacks=[MetricsCallbackHandler(registry)])
+                start = time.perf_counter()
+                await app.ainvoke({"messages": [HumanMessage(content=E2E_REQUESTS[i % len(E2E_REQUESTS)])],
+                                   "current_agent": "orchestrator", "next_action": "scheduler"}, config)
+                latencies.append(time.perf_counter() - start)
+
+        await asyncio.gather(*(one(i) for i in range(sessions)))
+        tools_ms = registry.summary()["nodes"]["scheduler_tools"]["wall_ms_mean"]
+        print(f"{'on' if enabled else 'off':<8}{_percentile(latencies, 0.5) * 1000:>9.0f}{_percentile(latencies, 0.95) * 1000:>9.0f}"
+              f"{tools_ms:>10.0f}{cache.stats()['hit_rate']:>10.1%}")
+    print("Per tool (cache on): " + ", ".join(f"{name} {tool['hit_rate']:.0%} of {tool['hits'] + tool['misses']}"
+                                          for name, tool in cache.stats()["tools"].items()))
+
+    # Lookup overhead on the bundled (instant) tools
+    configure_tool_cache(TOOL_CACHE_MAX_ENTRIES, TOOL_CACHE_TTLS)
+    for tool in scheduler_tools:
+        args = {"query": "Plan a birthday party at home for 20 people"}
+        raw = tool.func.__wrapped__
+        start = time.perf_counter()
+        for _ in range(1000):
+            raw(config={}, **args)
+        direct_us = (time.perf_counter() - start) * 1000
+        tool.func(config={}, **args)
+        start = time.perf_counter()
+        for _ in range(1000):
+            tool.func(config={}, **args)
+        cached_us = (time.perf_counter() - start) * 1000
+        print(f"  {tool.name:<10} direct {direct_us:>7.1f} us   cache hit {cached_us:>6.1f} us")
+    configure_tool_cache(TOOL_CACHE_MAX_ENTRIES, TOOL_CACHE_TTLS)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks for the event planning pipeline.")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    agents = subparsers.add_parser("agents", help="thread-pool vs async-native agents")
+    agents.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 50, 200])
+    agents.add_argument("--latency", type=float, default=0.2, help="fake model latency in seconds")
+
+    polling = subparsers.add_parser("state-polling", help="get_state per event vs once at the interrupt")
+    polling.add_argument("--history", type=int, nargs="+", default=[0, 50, 200, 1000])
+    polling.add_argument("--runs", type=int, default=10)
+
+    checkpoints = subparsers.add_parser("checkpointer", help="MemorySaver vs SQLite checkpointer write/read latency and RSS")
+    checkpoints.add_argument("--sessions", type=int, default=10000)
+    checkpoints.add_argument("--concurrency", type=int, default=100)
+    checkpoints.add_argument("--db", default="bench_checkpoints.sqlite")
+    checkpoints.add_argument("--backend", choices=["memory", "sqlite"], help="run a single backend in this process")
+
+    retention = subparsers.add_parser("retention", help="checkpoint growth over a long re-planning session")
+    retention.add_argument("--rounds", type=int, default=50)
+    retention.add_argument("--keep-last", type=int, default=10)
+    retention.add_argument("--db", default="bench_retention.sqlite")
+
+    context = subparsers.add_parser("context", help="scheduler prompt growth over re-planning rounds")
+    context.add_argument("--rounds", type=int, default=10)
+    context.add_argument("--token-budget", type=int, default=1500)
+    context.add_argument("--per-token-ms", type=float, default=50.0, help="fake model ms per 1k prompt tokens")
+
+    prefix = subparsers.add_parser("prefix-cache", help="prompt prefix reuse on a prefix-caching fake model")
+    prefix.add_argument("--sessions", type=int, default=50)
+    prefix.add_argument("--concurrency", type=int, default=10)
+    prefix.add_argument("--per-token-ms", type=float, default=50.0, help="fake model ms per 1k uncached prompt tokens")
+
+    e2e = subparsers.add_parser("e2e", help="full pipeline: per-node latency, graph overhead, throughput, peak RSS")
+    e2e.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 100, 1000])
+    e2e.add_argument("--sessions", type=int, default=200, help="sessions per level (at least the concurrency)")
+    e2e.add_argument("--latency", type=float, default=0.05, help="fake model mean latency in seconds")
+    e2e.add_argument("--distribution", default="lognormal", choices=["fixed", "uniform", "exponential", "lognormal"])
+    e2e.add_argument("--output", default="bench_e2e.json")
+    e2e.add_argument("--level", type=int, help="run a single concurrency level in this process and print JSON")
+
+    streaming = subparsers.add_parser("streaming", help="time to first visible output, streamed vs whole message")
+    streaming.add_argument("--sessions", type=int, default=20)
+    streaming.add_argument("--latency", type=float, default=0.3, help="fake model time to first token in seconds")
+    streaming.add_argument("--token-ms", type=float, default=30.0, help="fake model ms per streamed token")
+
+    events = subparsers.add_parser("events", help="astream_events v1 vs v2 vs v2 with include filters")
+    events.add_argument("--runs", type=int, default=50)
+
+    render = subparsers.add_parser("render", help="tool output box rendering on multi-kilobyte outputs")
+    render.add_argument("--kb", type=int, nargs="+", default=[4, 32])
+    render.add_argument("--repeats", type=int, default=5)
+
+    hedging = subparsers.add_parser("hedging", help="tail latency with hedged requests across two fake backends")
+    hedging.add_argument("--calls", type=int, default=2000)
+    hedging.add_argument("--concurrency", type=int, default=50)
+
+    ollama = subparsers.add_parser("ollama-pool", help="ChatOllama first-request and steady-state latency, pooled vs default")
+    ollama.add_argument("--requests", type=int, default=20)
+    ollama.add_argument("--idle", type=float, default=6.0, help="pause before the last request (httpx drops idle connections after 5 s)")
+    ollama.add_argument("--connect-ms", type=float, default=40.0)
+    ollama.add_argument("--load-ms", type=float, default=1500.0)
+    ollama.add_argument("--gen-ms", type=float, default=30.0)
+
+    startup = subparsers.add_parser("startup", help="CLI startup: import-time breakdown, time to first prompt and to a ready graph")
+    startup.add_argument("--backend", default="gemini", choices=["gemini", "ollama", "fake"])
+    startup.add_argument("--runs", type=int, default=5)
+    startup.add_argument("--top", type=int, default=12, help="packages listed in the import breakdown")
+    startup.add_argument("--output", default="bench_startup.json")
+
+    intents = subparsers.add_parser("intent-router", help="orchestrator routing accuracy and latency on synthetic requests")
+    intents.add_argument("--requests", type=int, default=3000)
+    intents.add_argument("--threshold", type=float, default=0.75, help="confidence below which the LLM decides")
+
+    prefetch = subparsers.add_parser("prefetch", help="planning latency with speculative tool prefetch on slow tools")
+    prefetch.add_argument("--sessions", type=int, default=70)
+    prefetch.add_argument("--concurrency", type=int, default=10)
+    prefetch.add_argument("--latency", type=float, default=0.3, help="fake model latency in seconds")
+
+    replan = subparsers.add_parser("replan", help="modify round latency: targeted tool re-runs vs full scheduler re-run")
+    replan.add_argument("--rounds", type=int, default=5)
+    replan.add_argument("--latency", type=float, default=0.3, help="fake model latency in seconds")
+
+    tool_cache = subparsers.add_parser("tool-cache", help="planning latency and hit rates of the memoized tool cache on slow tools")
+    tool_cache.add_argument("--sessions", type=int, default=100)
+    tool_cache.add_argument("--concurrency", type=int, default=10)
+    tool_cache.add_argument("--latency", type=float, default=0.3, help="fake model latency in seconds")
+
+    args = parser.parse_args()
+    if args.benchmark == "agents":
+        asyncio.run(bench_agent_modes(args.concurrency, args.latency))
+    elif args.benchmark == "state-polling":
+        asyncio.run(bench_state_polling(args.history, args.runs))
+    elif args.benchmark == "checkpointer":
+        if args.backend:
+            asyncio.run(bench_checkpointer_backend(args.backend, args.sessions, args.concurrency, args.db))
+        else:
+            bench_checkpointers(args.sessions, args.concurrency, args.db)
+    elif args.benchmark == "retention":
+        asyncio.run(bench_retention(args.rounds, args.keep_last, args.db))
+    elif args.benchmark == "context":
+        asyncio.run(bench_context_window(args.rounds, args.token_budget, args.per_token_ms))
+    elif args.benchmark == "prefix-cache":
+        asyncio.run(bench_prefix_cache(args.sessions, args.concurrency, args.per_token_ms))
+    elif args.benchmark == "streaming":
+        asyncio.run(bench_streaming(args.sessions, args.latency, args.token_ms))
+    elif args.benchmark == "events":
+        asyncio.run(bench_event_streaming(args.runs))
+    elif args.benchmark == "render":
+        bench_render(args.kb, args.repeats)
+    elif args.benchmark == "hedging":
+        asyncio.run(bench_hedging(args.calls, args.concurrency))
+    elif args.benchmark == "ollama-pool":
+        asyncio.run(bench_ollama_pool(args.requests, args.idle, args.connect_ms, args.load_ms, args.gen_ms))
+    elif args.benchmark == "startup":
+        bench_startup(args.backend, args.runs, args.top, args.output)
+    elif args.benchmark == "intent-router":
+        bench_intent_router(args.requests, args.threshold)
+    elif args.benchmark == "prefetch":
+        asyncio.run(bench_prefetch(args.sessions, args.concurrency, args.latency))
+    elif args.benchmark == "replan":
+        asyncio.run(bench_replan(args.rounds, args.latency))
+    elif args.benchmark == "tool-cache":
+        asyncio.run(bench_tool_cache(args.sessions, args.concurrency, args.latency))
+    elif args.benchmark == "e2e":
+        if args.level:
+            print(json.dumps(asyncio.run(bench_e2e_level(args.level, args.sessions, args.latency, args.distribution))))
+        else:
+            bench_e2e(args.concurrency, args.sessions, args.latency, args.distribution, args.output)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,423 @@
+# checkpointer.py
+
+import atexit
+import random
+import sqlite3
+import asyncio
+import threading
+from collections import defaultdict
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+from langgraph.checkpoint.memory import InMemorySaver
+
+# ============================================================================
+# RETENTION POLICY
+# ============================================================================
+
+def select_pruned_checkpoints(entries, keep_last: int = None, keep_review_points: int = 0) -> list:
+    """
+    Pick the checkpoints of one thread that fall outside the retention policy.
+
+    Args:
+        entries: (checkpoint_id, parent_checkpoint_id, source) tuples, newest first.
+        keep_last: Number of most recent checkpoints to keep. None keeps everything.
+        keep_review_points: Number of most recent human review points to keep beyond
+            the `keep_last` window. A review point is the checkpoint created by the
+            review decision (source "update") plus the paused checkpoint before it.
+
+    Returns:
+        The checkpoint ids to delete.
+    """
+    if keep_last is None or len(entries) <= keep_last:
+        return []
+    if keep_last < 1:
+        raise ValueError("keep_last must be at least 1 so the latest checkpoint survives.")
+
+    kept = {checkpoint_id for checkpoint_id, _, _ in entries[:keep_last]}
+    review_points = [(checkpoint_id, parent_checkpoint_id) for checkpoint_id, parent_checkpoint_id, source in entries if source == "update"]
+    for checkpoint_id, parent_checkpoint_id in review_points[:keep_review_points]:
+        kept.add(checkpoint_id)
+        kept.add(parent_checkpoint_id)
+    return [checkpoint_id for checkpoint_id, _, _ in entries if checkpoint_id not in kept]
+
+# ============================================================================
+# IN-MEMORY CHECKPOINTER WITH RETENTION
+# ============================================================================
+
+class RetainingMemorySaver(InMemorySaver):
+    """
+    MemorySaver that applies a retention policy on every put, so a long
+    modify/re-plan session keeps a bounded number of checkpoints in RAM.
+    Channel blobs no longer referenced by a retained checkpoint are dropped too;
+    they hold the message lists and make up most of the memory.
+
+    Args:
+        keep_last: Checkpoints kept per thread (see select_pruned_checkpoints). None keeps all.
+        keep_review_points: Recent human review points kept beyond the `keep_last` window.
+    """
+
+    def __init__(self, keep_last: int = None, keep_review_points: int = 0, serde=None):
+        super().__init__(serde=serde)
+        self.keep_last = keep_last
+        self.keep_review_points = keep_review_points
+        self._blob_keys = defaultdict(set)  # (thread_id, checkpoint_ns) -> blob keys written
+
+    def put(self, config: RunnableConfig, checkpoint, metadata, new_versions) -> RunnableConfig:
+        result = super().put(config, checkpoint, metadata, new_versions)
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        if self.keep_last is not None:
+            self._blob_keys[(thread_id, checkpoint_ns)].update(
+                (thread_id, checkpoint_ns, channel, version) for channel, version in new_versions.items()
+            )
+            self._prune(thread_id, checkpoint_ns)
+        return result
+
+    def _prune(self, thread_id: str, checkpoint_ns: str):
+        checkpoints = self.storage[thread_id][checkpoint_ns]
+        if len(checkpoints) <= self.keep_last:
+            return
+        entries = [
+            (checkpoint_id, parent_checkpoint_id, self.serde.loads_typed(metadata).get("source"))
+            for checkpoint_id, (_, metadata, parent_checkpoint_id) in sorted(checkpoints.items(), reverse=True)
+        ]
+        pruned = select_pruned_checkpoints(entries, self.keep_last, self.keep_review_points)
+        if not pruned:
+            return
+        for checkpoint_id in pruned:
+            del checkpoints[checkpoint_id]
+            self.writes.pop((thread_id, checkpoint_ns, checkpoint_id), None)
+
+        referenced = {
+            (thread_id, checkpoint_ns, channel, version)
+            for checkpoint, _, _ in checkpoints.values()
+            for channel, version in self.serde.loads_typed(checkpoint)["channel_versions"].items()
+        }
+        blob_keys = self._blob_keys[(thread_id, checkpoint_ns)]
+        for key in blob_keys - referenced:
+            self.blobs.pop(key, None)
+        blob_keys &= referenced
+
+    def delete_thread(self, thread_id: str) -> None:
+        super().delete_thread(thread_id)
+        for key in [key for key in self._blob_keys if key[0] == thread_id]:
+            del self._blob_keys[key]
+
+# ============================================================================
+# SQLITE CHECKPOINTER
+# ============================================================================
+
+DEFAULT_BATCH_SIZE = 64        # Pending statements that force a commit
+DEFAULT_FLUSH_INTERVAL = 0.05  # Seconds a write may stay uncommitted
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    parent_checkpoint_id TEXT,
+    source TEXT,
+    checkpoint_type TEXT,
+    checkpoint BLOB,
+    metadata_type TEXT,
+    metadata BLOB,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+);
+CREATE TABLE IF NOT EXISTS writes (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    channel TEXT NOT NULL,
+    value_type TEXT,
+    value BLOB,
+    task_path TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+);
+"""
+
+class SQLiteCheckpointer(BaseCheckpointSaver):
+    """
+    File-backed checkpointer built on the standard library sqlite3 module.
+
+    Checkpoints survive restarts, so sessions paused at human review can be
+    resumed by a new process. Writes are batched: statements accumulate in an
+    open transaction that is committed once `batch_size` statements are pending
+    or `flush_interval` seconds after the first uncommitted write, whichever
+    comes first. Reads use the same connection, so they always see pending
+    writes. The latest checkpoint of a thread is found through the primary key
+    index (checkpoint ids sort by creation time).
+
+    Args:
+        path: SQLite database file (":memory:" for a throwaway database).
+        batch_size: Pending statements that force a commit.
+        flush_interval: Maximum seconds a write stays uncommitted.
+        keep_last: Checkpoints kept per thread (see select_pruned_checkpoints). None keeps all.
+        keep_review_points: Recent human review points kept beyond the `keep_last` window.
+    """
+
+    def __init__(self, path: str, batch_size: int = DEFAULT_BATCH_SIZE,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL, keep_last: int = None,
+                 keep_review_points: int = 0, serde=None):
+        super().__init__(serde=serde)
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.keep_last = keep_last
+        self.keep_review_points = keep_review_points
+        self._lock = threading.RLock()
+        self._pending = 0
+        self._flush_handle = None
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self._closed = False
+        # A deferred commit may still be pending when the event loop shuts down.
+        atexit.register(self.flush)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # ------------------------------------------------------------------------
+    # Write batching
+    # ------------------------------------------------------------------------
+
+    def _begin_write(self):
+        if not self.conn.in_transaction:
+            self.conn.execute("BEGIN")
+
+    def _after_write(self, statements: int):
+        self._pending += statements
+        if self._pending >= self.batch_size:
+            self.flush()
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop to defer the commit to: keep synchronous callers durable.
+            self.flush()
+            return
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.flush_interval, self.flush)
+
+    def flush(self):
+        """Commit all pending writes."""
+        with self._lock:
+            if self._flush_handle is not None:
+                self._flush_handle.cancel()
+                self._flush_handle = None
+            if not self._closed and self.conn.in_transaction:
+                self.conn.execute("COMMIT")
+            self._pending = 0
+
+    def close(self):
+        """Flush pending writes and close the database."""
+        self.flush()
+        self._closed = True
+        self.conn.close()
+        atexit.unregister(self.flush)
+
+    # ------------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------------
+
+    def _load_writes(self, thread_id: str, checkpoint_ns: str, checkpoint_id: str):
+        rows = self.conn.execute(
+            "SELECT task_id, channel, value_type, value FROM writes "
+            "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? "
+            "ORDER BY task_path, task_id, idx",
+            (thread_id, checkpoint_ns, checkpoint_id),
+        ).fetchall()
+        return [(task_id, channel, self.serde.loads_typed((value_type, value))) for task_id, channel, value_type, value in rows]
+
+    def _row_to_tuple(self, row) -> CheckpointTuple:
+        thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, checkpoint_type, checkpoint, metadata_type, metadata = row
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            },
+            checkpoint=self.serde.loads_typed((checkpoint_type, checkpoint)),
+            metadata=self.serde.loads_typed((metadata_type, metadata)),
+            parent_config=(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": parent_checkpoint_id,
+                    }
+                }
+                if parent_checkpoint_id
+                else None
+            ),
+            pending_writes=self._load_writes(thread_id, checkpoint_ns, checkpoint_id),
+        )
+
+    def get_tuple(self, config: RunnableConfig):
+        """Get a specific checkpoint, or the latest one of the thread when no checkpoint_id is given."""
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        columns = ("SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, "
+                   "checkpoint_type, checkpoint, metadata_type, metadata FROM checkpoints ")
+        with self._lock:
+            if checkpoint_id := get_checkpoint_id(config):
+                row = self.conn.execute(
+                    columns + "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                    (thread_id, checkpoint_ns, checkpoint_id),
+                ).fetchone()
+            else:
+                row = self.conn.execute(
+                    columns + "WHERE thread_id = ? AND checkpoint_ns = ? ORDER BY checkpoint_id DESC LIMIT 1",
+                    (thread_id, checkpoint_ns),
+                ).fetchone()
+            return self._row_to_tuple(row) if row else None
+
+    def list(self, config, *, filter=None, before=None, limit=None):
+        """List checkpoints, newest first, optionally filtered by thread, metadata and `before`."""
+        query = ("SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, "
+                 "checkpoint_type, checkpoint, metadata_type, metadata FROM checkpoints")
+        clauses, params = [], []
+        if config:
+            clauses.append("thread_id = ?")
+            params.append(config["configurable"]["thread_id"])
+            if (checkpoint_ns := config["configurable"].get("checkpoint_ns")) is not None:
+                clauses.append("checkpoint_ns = ?")
+                params.append(checkpoint_ns)
+            if checkpoint_id := get_checkpoint_id(config):
+                clauses.append("checkpoint_id = ?")
+                params.append(checkpoint_id)
+        if before and (before_checkpoint_id := get_checkpoint_id(before)):
+            clauses.append("checkpoint_id < ?")
+            params.append(before_checkpoint_id)
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY checkpoint_id DESC"
+
+        with self._lock:
+            rows = self.conn.execute(query, params).fetchall()
+
+        for row in rows:
+            if limit is not None and limit <= 0:
+                break
+            with self._lock:
+                checkpoint_tuple = self._row_to_tuple(row)
+            if filter and not all(checkpoint_tuple.metadata.get(k) == v for k, v in filter.items()):
+                continue
+            if limit is not None:
+                limit -= 1
+            yield checkpoint_tuple
+
+    # ------------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------------
+
+    def put(self, config: RunnableConfig, checkpoint, metadata, new_versions) -> RunnableConfig:
+        """Save a checkpoint (batched)."""
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        checkpoint_type, checkpoint_blob = self.serde.dumps_typed(checkpoint)
+        metadata_type, metadata_blob = self.serde.dumps_typed(get_checkpoint_metadata(config, metadata))
+        with self._lock:
+            self._begin_write()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (thread_id, checkpoint_ns, checkpoint["id"], config["configurable"].get("checkpoint_id"),
+                 metadata.get("source"), checkpoint_type, checkpoint_blob, metadata_type, metadata_blob),
+            )
+            statements = 1 + self._prune(thread_id, checkpoint_ns)
+            self._after_write(statements)
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    def put_writes(self, config: RunnableConfig, writes, task_id: str, task_path: str = "") -> None:
+        """Save the pending writes of a task (batched)."""
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+        rows = []
+        for idx, (channel, value) in enumerate(writes):
+            value_type, value_blob = self.serde.dumps_typed(value)
+            rows.append((thread_id, checkpoint_ns, checkpoint_id, task_id, WRITES_IDX_MAP.get(channel, idx),
+                         channel, value_type, value_blob, task_path))
+        # Regular writes are idempotent per task; special writes (errors, interrupts) replace.
+        special = all(channel in WRITES_IDX_MAP for channel, _ in writes)
+        verb = "INSERT OR REPLACE" if special else "INSERT OR IGNORE"
+        with self._lock:
+            self._begin_write()
+            self.conn.executemany(f"{verb} INTO writes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self._after_write(len(rows))
+
+    def _prune(self, thread_id: str, checkpoint_ns: str) -> int:
+        """Apply the retention policy to one thread. Returns the number of statements issued."""
+        if self.keep_last is None:
+            return 0
+        entries = self.conn.execute(
+            "SELECT checkpoint_id, parent_checkpoint_id, source FROM checkpoints "
+            "WHERE thread_id = ? AND checkpoint_ns = ? ORDER BY checkpoint_id DESC",
+            (thread_id, checkpoint_ns),
+        ).fetchall()
+        pruned = select_pruned_checkpoints(entries, self.keep_last, self.keep_review_points)
+        if not pruned:
+            return 0
+        rows = [(thread_id, checkpoint_ns, checkpoint_id) for checkpoint_id in pruned]
+        self.conn.executemany("DELETE FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?", rows)
+        self.conn.executemany("DELETE FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?", rows)
+        return 2
+
+    def delete_thread(self, thread_id: str) -> None:
+        """Delete all checkpoints and writes of a thread."""
+        with self._lock:
+            self._begin_write()
+            self.conn.execute("DELETE FROM checkpoints WHERE thread_id = ?", (thread_id,))
+            self.conn.execute("DELETE FROM writes WHERE thread_id = ?", (thread_id,))
+            self.flush()
+
+    # ------------------------------------------------------------------------
+    # Async API: local SQLite calls are short, so they run inline on the loop
+    # and the commit is deferred by the batching above.
+    # ------------------------------------------------------------------------
+
+    async def aget_tuple(self, config: RunnableConfig):
+        return self.get_tuple(config)
+
+    async def alist(self, config, *, filter=None, before=None, limit=None):
+        for item in self.list(config, filter=filter, before=before, limit=limit):
+            yield item
+
+    async def aput(self, config: RunnableConfig, checkpoint, metadata, new_versions) -> RunnableConfig:
+        return self.put(config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(self, config: RunnableConfig, writes, task_id: str, task_path: str = "") -> None:
+        return self.put_writes(config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        return self.delete_thread(thread_id)
+
+    def get_next_version(self, current, channel) -> str:
+        if current is None:
+            current_v = 0
+        elif isinstance(current, int):
+            current_v = current
+        else:
+            current_v = int(current.split(".")[0])
+        return f"{current_v + 1:032}.{random.random():016}"
@@ -0,0 +1,91 @@
+# context_window.py
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langchain_core.messages.utils import count_tokens_approximately
+
+# ============================================================================
+# CONTEXT MANAGEMENT FOR THE SCHEDULER TOOL LOOP
+# ============================================================================
+
+ORCHESTRATOR_NAME = "orchestrator"  # AIMessage.name set by orchestrator_agent
+SUMMARY_CHARS = 160                 # Characters kept from a compacted tool result
+
+def count_tokens(messages) -> int:
+    """Approximate token count of a message list (no tokenizer dependency)."""
+    return count_tokens_approximately(messages)
+
+def _summarize_tool_message(msg: ToolMessage) -> ToolMessage:
+    """Shorten a tool result while keeping its pairing with the originating tool call."""
+    content = str(msg.content)
+    if len(content) <= SUMMARY_CHARS:
+        return msg
+    summary = f"{content[:SUMMARY_CHARS].rstrip()}... [older {msg.name} result trimmed, {len(content) - SUMMARY_CHARS} chars]"
+    return msg.model_copy(update={"content": summary})
+
+def _group_rounds(messages):
+    """Split a history into blocks: an AI tool-call turn plus its tool results, or a single message."""
+    blocks = []
+    for msg in messages:
+        if isinstance(msg, ToolMessage) and blocks and blocks[-1][0].type == "ai" and blocks[-1][0].tool_calls:
+            blocks[-1].append(msg)
+        else:
+            blocks.append([msg])
+    return blocks
+
+def compact_history(messages, token_budget: int = None):
+    """
+    Bound the history sent to the scheduler model.
+
+    Stages, each applied only while the history is over `token_budget` (the first
+    two always run, they only drop information that is duplicated elsewhere):
+      1. Drop orchestrator routing chatter.
+      2. Summarize tool results superseded by a later call of the same tool
+         (the latest result of every tool is also in the planning context).
+      3. Summarize all tool results outside the latest tool round.
+      4. Drop the oldest blocks, keeping the original request, the latest human
+         turn (with the review note answering it) and the latest round.
+
+    AI tool calls always stay paired with their tool results so the prompt remains
+    valid for providers that require it.
+
+    Args:
+        messages: Conversation history from the graph state.
+        token_budget: Approximate token budget for the history. None disables stages 3-4.
+    """
+    messages = [msg for msg in messages if not (isinstance(msg, AIMessage) and msg.name == ORCHESTRATOR_NAME)]
+
+    latest_by_tool = {}
+    for index, msg in enumerate(messages):
+        if isinstance(msg, ToolMessage):
+            latest_by_tool[msg.name] = index
+    messages = [
+        _summarize_tool_message(msg) if isinstance(msg, ToolMessage) and latest_by_tool[msg.name] != index else msg
+        for index, msg in enumerate(messages)
+    ]
+
+    if token_budget is None or count_tokens(messages) <= token_budget:
+        return messages
+
+    blocks = _group_rounds(messages)
+    last_round = max((i for i, block in enumerate(blocks) if len(block) > 1), default=len(blocks))
+    blocks = [
+        [_summarize_tool_message(msg) if isinstance(msg, ToolMessage) else msg for msg in block] if i < last_round else block
+        for i, block in enumerate(blocks)
+    ]
+
+    # Keep the first request and the latest human turn (e.g. a review modification) with
+    # the review note after it; drop the oldest other blocks until within budget.
+    humans = [i for i, block in enumerate(blocks) if isinstance(block[0], HumanMessage)]
+    protected = set(humans[:1] + humans[-1:])
+    if humans and humans[-1] + 1 < len(blocks):
+        note = blocks[humans[-1] + 1]
+        if len(note) == 1 and isinstance(note[0], AIMessage) and not note[0].tool_calls:
+            protected.add(humans[-1] + 1)
+    total = count_tokens([msg for block in blocks for msg in block])
+    index = 0
+    while total > token_budget and index < len(blocks) - 1:
+        if index not in protected and index < last_round:
+            total -= count_tokens(blocks[index])
+            blocks[index] = []
+        index += 1
+    return [msg for block in blocks for msg in block]
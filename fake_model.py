@@ -0,0 +1,224 @@
+# fake_model.py
+
+import re
+import json
+import time
+import random
+import asyncio
+import hashlib
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage, ToolMessage
+from langchain_core.messages.utils import count_tokens_approximately
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+# ============================================================================
+# SCRIPTS
+# ============================================================================
+
+# Event type detection on the original request, checked in order (first match wins).
+EVENT_TYPES = [
+    ("wedding", ("wedding", "marriage", "reception")),
+    ("meeting", ("meeting", "conference", "workshop", "seminar")),
+    ("outdoor", ("outdoor", "picnic", "festival", "park", "beach", "garden")),
+    ("downtown", ("downtown", "venue", "restaurant", "city")),
+    ("birthday", ("birthday", "party", "anniversary")),
+]
+DEFAULT_EVENT_TYPE = "birthday"
+
+# Tool-call rounds per event type. A bound model only sees the calls of the tools it
+# is bound to, so one script drives both the scheduler and the communication model.
+# "{request}" in an argument is replaced with the original request.
+_INVITE = [("invite_people", {"query": "Draft an invitation for: {request}"})]
+FAKE_SCRIPTS = {
+    "birthday": [
+        [("calendar", {"query": "Check weekend availability for: {request}"}),
+         ("finance", {"query": "Estimate the budget for: {request}"}),
+         ("health", {"query": "Dietary and safety guidelines for: {request}"})],
+        _INVITE,
+        [("whatsapp_message", {"message": "You're invited! {request}"})],
+    ],
+    "outdoor": [
+        [("calendar", {"query": "Check weekend availability for: {request}"}),
+         ("finance", {"query": "Estimate the budget for: {request}"}),
+         ("weather", {"query": "Forecast for: {request}"})],
+        _INVITE,
+        [("whatsapp_message", {"message": "You're invited! {request}"})],
+    ],
+    "downtown": [
+        [("calendar", {"query": "Check availability for: {request}"}),
+         ("finance", {"query": "Estimate the budget for: {request}"}),
+         ("traffic", {"query": "Parking and transit for: {request}"})],
+        _INVITE,
+        [("whatsapp_message", {"message": "You're invited! {request}"})],
+    ],
+    "meeting": [
+        [("calendar", {"query": "Find a weekday slot for: {request}"}),
+         ("traffic", {"query": "Commute and parking for: {request}"})],
+        _INVITE,
+        [("email_message", {"message": "Meeting invitation: {request}"})],
+    ],
+    "wedding": [
+        [("calendar", {"query": "Check availability for: {request}"}),
+         ("finance", {"query": "Estimate the budget for: {request}"}),
+         ("health", {"query": "Catering and safety guidelines for: {request}"}),
+         ("weather", {"query": "Forecast for: {request}"}),
+         ("traffic", {"query": "Guest parking for: {request}"})],
+        _INVITE,
+        [("whatsapp_message", {"message": "You're invited! {request}"}),
+         ("email_message", {"message": "Wedding invitation: {request}"})],
+    ],
+}
+
+def detect_event_type(request: str) -> str:
+    """Map a request to a script key by keyword."""
+    text = request.lower()
+    for event_type, keywords in EVENT_TYPES:
+        if any(keyword in text for keyword in keywords):
+            return event_type
+    return DEFAULT_EVENT_TYPE
+
+# ============================================================================
+# FAKE CHAT MODEL
+# ============================================================================
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "exponential", "lognormal")
+
+class FakeChatModel(BaseChatModel):
+    """
+    Deterministic offline chat model for running the graph without Gemini or Ollama.
+
+    Tool calls follow FAKE_SCRIPTS for the event type of the original request,
+    filtered to the tools the model is bound to (`bind_tools`). Each call answers
+    the next scripted round that has not been called since the latest human turn;
+    once the script is exhausted it answers with a short text summary.
+
+    Latency is sampled from `latency_distribution` around `latency` seconds (with
+    `latency_spread` as the relative spread / lognormal sigma) from a generator
+    seeded by `seed` and the prompt, so the same prompt always takes the same time.
+    `prompt_token_latency` adds prefill time per prompt token (see _prompt_latency,
+    which subclasses override to model e.g. prefix caching). When streamed, the
+    first chunk arrives after that latency and every further token after
+    `token_latency` seconds.
+    """
+
+    latency: float = 0.0
+    latency_distribution: str = "fixed"
+    latency_spread: float = 0.5
+    token_latency: float = 0.0
+    prompt_token_latency: float = 0.0
+    seed: int = 0
+    scripts: dict = FAKE_SCRIPTS
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-chat-model"
+
+    def bind_tools(self, tools, **kwargs):
+        return self.bind(tools=[convert_to_openai_tool(tool) for tool in tools], **kwargs)
+
+    # ------------------------------------------------------------------ script
+
+    def _next_message(self, messages, tools) -> AIMessage:
+        tool_names = {tool["function"]["name"] for tool in tools or []}
+        humans = [i for i, msg in enumerate(messages) if isinstance(msg, HumanMessage)]
+        request = messages[humans[0]].content if humans else ""
+
+        # Agents append their per-request context as a trailing human message;
+        # the turn being answered starts at the human message before it.
+        turn_start = humans[-1] if humans else 0
+        if len(humans) > 1 and humans[-1] == len(messages) - 1:
+            turn_start = humans[-2]
+        turn = messages[turn_start:]
+        done = sum(1 for msg in turn if isinstance(msg, AIMessage) and msg.tool_calls
+                   and all(call["name"] in tool_names for call in msg.tool_calls))
+
+        event_type = detect_event_type(str(request))
+        rounds = [[(name, args) for name, args in calls if name in tool_names] for calls in self.scripts[event_type]]
+        rounds = [calls for calls in rounds if calls]
+        digest = hashlib.sha256(json.dumps([m.content for m in messages], default=str).encode()).hexdigest()
+
+        if done < len(rounds):
+            return AIMessage(content="", tool_calls=[
+                {"name": name, "args": {key: value.format(request=request) for key, value in args.items()},
+                 "id": f"call_{digest[:12]}_{i}"}
+                for i, (name, args) in enumerate(rounds[done])
+            ])
+
+        used = [msg.name for msg in turn if isinstance(msg, ToolMessage)]
+        summary = f"Completed the {event_type} plan for: {request}."
+        if used:
+            summary += f" Tools used: {', '.join(dict.fromkeys(used))}."
+        return AIMessage(content=summary)
+
+    def _sample_latency(self, messages) -> float:
+        if self.latency <= 0:
+            return 0.0
+        rng = random.Random(f"{self.seed}:{json.dumps([m.content for m in messages], default=str)}")
+        if self.latency_distribution == "uniform":
+            return rng.uniform(self.latency * (1 - self.latency_spread), self.latency * (1 + self.latency_spread))
+        if self.latency_distribution == "exponential":
+            return rng.expovariate(1 / self.latency)
+        if self.latency_distribution == "lognormal":
+            return self.latency * rng.lognormvariate(0, self.latency_spread)
+        return self.latency
+
+    def _prompt_latency(self, messages, tools, prompt_tokens: int) -> float:
+        """Prefill time of the prompt: `prompt_token_latency` per prompt token."""
+        return prompt_tokens * self.prompt_token_latency
+
+    def _respond(self, messages, tools):
+        message = self._next_message(messages, tools)
+        tokens = re.findall(r"\S+\s*", message.content)
+        message.usage_metadata = {
+            "input_tokens": count_tokens_approximately(messages),
+            "output_tokens": len(tokens) + sum(len(json.dumps(call["args"])) // 4 for call in message.tool_calls),
+        }
+        message.usage_metadata["total_tokens"] = message.usage_metadata["input_tokens"] + message.usage_metadata["output_tokens"]
+        latency = self._sample_latency(messages) + self._prompt_latency(messages, tools, message.usage_metadata["input_tokens"])
+        return message, tokens, latency
+
+    # --------------------------------------------------------------- generation
+
+    def _generate(self, messages, stop=None, run_manager=None, tools=None, **kwargs) -> ChatResult:
+        message, tokens, latency = self._respond(messages, tools)
+        time.sleep(latency + len(tokens) * self.token_latency)
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, tools=None, **kwargs) -> ChatResult:
+        message, tokens, latency = self._respond(messages, tools)
+        await asyncio.sleep(latency + len(tokens) * self.token_latency)
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _chunks(self, message, tokens):
+        """Content tokens first, then tool calls and usage in a final chunk."""
+        for token in tokens:
+            yield ChatGenerationChunk(message=AIMessageChunk(content=token))
+        yield ChatGenerationChunk(message=AIMessageChunk(
+            content="",
+            tool_call_chunks=[
+                {"name": call["name"], "args": json.dumps(call["args"]), "id": call["id"], "index": i}
+                for i, call in enumerate(message.tool_calls)
+            ],
+            usage_metadata=message.usage_metadata,
+        ))
+
+    def _stream(self, messages, stop=None, run_manager=None, tools=None, **kwargs):
+        message, tokens, latency = self._respond(messages, tools)
+        time.sleep(latency)
+        for i, chunk in enumerate(self._chunks(message, tokens)):
+            if i and i < len(tokens):
+                time.sleep(self.token_latency)
+            if run_manager and chunk.message.content:
+                run_manager.on_llm_new_token(chunk.message.content, chunk=chunk)
+            yield chunk
+
+    async def _astream(self, messages, stop=None, run_manager=None, tools=None, **kwargs):
+        message, tokens, latency = self._respond(messages, tools)
+        await asyncio.sleep(latency)
+        for i, chunk in enumerate(self._chunks(message, tokens)):
+            if i and i < len(tokens):
+                await asyncio.sleep(self.token_latency)
+            if run_manager and chunk.message.content:
+                await run_manager.on_llm_new_token(chunk.message.content, chunk=chunk)
+            yield chunk
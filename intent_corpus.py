@@ -0,0 +1,154 @@
+# intent_corpus.py
+
+# Labelled requests for training the orchestrator's intent router (see intent_router.py).
+# "scheduler": the user wants an event planned or changed.
+# "communication": the details are settled and the user wants messages or invitations sent.
+INTENT_CORPUS = [
+    # --- scheduler -------------------------------------------------------------
+    ("Plan a birthday party for my daughter next Saturday", "scheduler"),
+    ("Help me organize a surprise party for 20 people", "scheduler"),
+    ("Schedule a team meeting for Thursday afternoon", "scheduler"),
+    ("I want to plan my wedding reception in June", "scheduler"),
+    ("Can you help me put together a family reunion this summer?", "scheduler"),
+    ("We're hosting a picnic in the park on Sunday", "scheduler"),
+    ("Organise a conference for 200 attendees downtown", "scheduler"),
+    ("Set up a workshop on data science for the engineering team", "scheduler"),
+    ("Arrange a farewell dinner for a colleague", "scheduler"),
+    ("I need to book a venue for a charity gala", "scheduler"),
+    ("Plan an outdoor barbecue for the neighbourhood", "scheduler"),
+    ("Help me with a graduation party at home", "scheduler"),
+    ("Put together a baby shower for my sister", "scheduler"),
+    ("Coordinate a product launch event in March", "scheduler"),
+    ("We need a holiday party for the office in December", "scheduler"),
+    ("Plan a weekend retreat in the mountains for 12 friends", "scheduler"),
+    ("Organize a fundraiser dinner with a $5000 budget", "scheduler"),
+    ("Can you plan an anniversary dinner for my parents?", "scheduler"),
+    ("I'd like to throw a housewarming party next month", "scheduler"),
+    ("Schedule a seminar on climate policy at the university", "scheduler"),
+    ("Help me arrange a kids' birthday at the zoo", "scheduler"),
+    ("Plan a retirement celebration for my father", "scheduler"),
+    ("Organize a company offsite for the sales team", "scheduler"),
+    ("Set up a book club meetup at the library", "scheduler"),
+    ("Plan a beach festival with food trucks", "scheduler"),
+    ("Arrange a garden tea party for 15 guests", "scheduler"),
+    ("I want to host a game night on Friday", "scheduler"),
+    ("Plan an engagement party at a rooftop restaurant", "scheduler"),
+    ("Help me plan a class reunion for the class of 2005", "scheduler"),
+    ("Organize a hackathon over two days", "scheduler"),
+    ("We are planning a bachelor party in Vegas", "scheduler"),
+    ("Plan a quinceanera for about 80 guests", "scheduler"),
+    ("Can you schedule a board meeting next week?", "scheduler"),
+    ("Put together a networking event for startups", "scheduler"),
+    ("Organize a charity run in the city park", "scheduler"),
+    ("Plan a christmas dinner for the whole family", "scheduler"),
+    ("I need an itinerary for a corporate conference in Berlin", "scheduler"),
+    ("Arrange a welcome lunch for new hires", "scheduler"),
+    ("Help me organize a music festival for local bands", "scheduler"),
+    ("Plan a small dinner party for six", "scheduler"),
+    ("Let's plan a camping trip with the scouts", "scheduler"),
+    ("Plan a memorial gathering for my grandmother", "scheduler"),
+    ("Organize a potluck at the community center", "scheduler"),
+    ("Set up a parent-teacher conference evening", "scheduler"),
+    ("Can you help me with my wedding? 150 guests, outdoor ceremony", "scheduler"),
+    ("Plan a reunion for the old football team", "scheduler"),
+    ("I want a birthday celebration with a magician", "scheduler"),
+    ("Schedule a yoga workshop for Saturday morning", "scheduler"),
+    ("Organize a picnic for the kindergarten class", "scheduler"),
+    ("Plan a team building day with outdoor activities", "scheduler"),
+    ("Help me prepare a cocktail party on the terrace", "scheduler"),
+    ("We want to celebrate our 10th anniversary with friends", "scheduler"),
+    ("Book a meeting room and plan an all-hands for Monday", "scheduler"),
+    ("Plan a bridal shower with a vintage theme", "scheduler"),
+    ("Organize a tech meetup with three speakers", "scheduler"),
+    ("Arrange a dinner cruise for the leadership team", "scheduler"),
+    ("Plan a street party for the whole block", "scheduler"),
+    ("Help me set up a charity auction", "scheduler"),
+    ("Plan a birthday brunch downtown for 10 people", "scheduler"),
+    ("Organize a wine tasting evening at a vineyard", "scheduler"),
+    ("Can you organise a sports day for the school?", "scheduler"),
+    ("Plan a lunch-and-learn session about security", "scheduler"),
+    ("Reschedule the party to Sunday and check the weather", "scheduler"),
+    ("Change the venue of the conference and update the budget", "scheduler"),
+    ("Move the reunion to July and find a cheaper place", "scheduler"),
+    ("What would a wedding for 100 guests cost?", "scheduler"),
+    ("Check if next Saturday works for a garden party", "scheduler"),
+    ("Find a date for our quarterly planning meeting", "scheduler"),
+    ("Is the weather good for an outdoor concert on May 6?", "scheduler"),
+    ("How much should I budget for a graduation party?", "scheduler"),
+    ("Figure out parking and traffic for the gala downtown", "scheduler"),
+    ("Plan the event and then send invitations to everyone", "scheduler"),
+    ("Organize a party and let my friends know once it is ready", "scheduler"),
+    ("I need to plan a conference and email the speakers later", "scheduler"),
+    ("Help me plan a picnic; we can message the group after", "scheduler"),
+    ("Throw a surprise birthday for Sam at the office", "scheduler"),
+    ("Get a festival ready for the summer solstice", "scheduler"),
+    ("We should have a get-together for the cousins", "scheduler"),
+    ("A small wedding in the garden, around 40 people", "scheduler"),
+    ("Family reunion at the lake house in August", "scheduler"),
+    ("Conference for 300 people with a keynote and workshops", "scheduler"),
+    ("Need a venue and catering for a retirement party", "scheduler"),
+
+    # --- communication ---------------------------------------------------------
+    ("Send a WhatsApp message to everyone about tomorrow", "communication"),
+    ("Email the invitation to all the guests", "communication"),
+    ("Text my friends that the party starts at 7", "communication"),
+    ("Send the invitations for the wedding now", "communication"),
+    ("Message the team that the meeting moved to 3pm", "communication"),
+    ("Let everyone know the reunion is confirmed", "communication"),
+    ("Notify the attendees that the conference venue changed", "communication"),
+    ("Remind the guests about the picnic on Sunday", "communication"),
+    ("Send an email to John with the event details", "communication"),
+    ("WhatsApp the family group about the dinner", "communication"),
+    ("Forward the invitation to my colleagues", "communication"),
+    ("Tell Sarah the birthday party is at my place", "communication"),
+    ("Send out the save-the-date for the wedding", "communication"),
+    ("Invite my coworkers to the offsite on Friday", "communication"),
+    ("Send a reminder to all speakers about the workshop", "communication"),
+    ("Email the board the agenda for next week's meeting", "communication"),
+    ("Share the party details with the whole class", "communication"),
+    ("Ping the group chat that we're meeting at noon", "communication"),
+    ("Send the RSVP link to the guest list", "communication"),
+    ("Inform the parents that the school trip is cancelled", "communication"),
+    ("Drop a message to the neighbours about the street party", "communication"),
+    ("Send thank-you notes to everyone who came to the gala", "communication"),
+    ("Write to the caterer and confirm the order", "communication"),
+    ("Send invitations for the baby shower via email", "communication"),
+    ("Text the volunteers the schedule for the charity run", "communication"),
+    ("Email all members the link to the book club meetup", "communication"),
+    ("Send a WhatsApp to mom that dinner is at 8", "communication"),
+    ("Let the team know the all-hands is cancelled", "communication"),
+    ("Notify everyone that the wedding starts an hour later", "communication"),
+    ("Send out the invitations, the plan is final", "communication"),
+    ("The details are settled, message all the guests", "communication"),
+    ("Please send the invite to alex@example.com", "communication"),
+    ("Shoot a quick text to the band about soundcheck", "communication"),
+    ("Send my friends the address of the venue", "communication"),
+    ("Mail the invitations to the reunion committee", "communication"),
+    ("Broadcast the festival line-up to subscribers", "communication"),
+    ("Send a message to the host saying we'll be late", "communication"),
+    ("Send the conference schedule to all attendees", "communication"),
+    ("Remind everyone to bring a dish to the potluck", "communication"),
+    ("Invite the cousins to the family reunion by WhatsApp", "communication"),
+    ("Reply to the guests and confirm the time", "communication"),
+    ("Contact the attendees and tell them about the parking", "communication"),
+    ("Send an update to the wedding party about the rehearsal", "communication"),
+    ("DM the organizers about the change of room", "communication"),
+    ("Notify the speakers their slots are confirmed", "communication"),
+    ("Send the final invitation message to my contacts", "communication"),
+    ("Email the invoice to the venue manager", "communication"),
+    ("Send a group email announcing the holiday party", "communication"),
+    ("Text Mike and Anna that the picnic is on", "communication"),
+    ("Announce the retirement party to the department", "communication"),
+    ("Send the guests directions to the beach", "communication"),
+    ("Message the parents about the graduation ceremony time", "communication"),
+    ("Let the committee know the budget was approved", "communication"),
+    ("Send out a reminder about tonight's game night", "communication"),
+    ("Send a WhatsApp invite for the housewarming", "communication"),
+    ("Email the seminar registration link to the students", "communication"),
+    ("Tell the guests the dress code for the gala", "communication"),
+    ("Send a quick note to the photographer", "communication"),
+    ("Send the invites", "communication"),
+    ("Message everyone", "communication"),
+    ("Email the guests", "communication"),
+    ("Go ahead and notify the attendees", "communication"),
+]
@@ -0,0 +1,144 @@
+# intent_router.py
+
+import re
+import math
+import zlib
+import random
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+ROUTES = ("scheduler", "communication")
+FEATURE_BITS = 16                     # 2**16 hashed feature buckets
+TRAINING_EPOCHS = 30
+LEARNING_RATE = 0.5
+L2_PENALTY = 1e-4
+DEFAULT_CONFIDENCE_THRESHOLD = 0.75   # Below this, callers should ask a model instead
+
+# ============================================================================
+# PATTERN FAST PATH
+# ============================================================================
+
+# High-precision cues for each route. A request that hits the patterns of exactly one
+# route is routed without the classifier; requests with cues for both routes
+# ("plan the party, then send invitations") or for neither go to the classifier.
+ROUTE_PATTERNS = {
+    "scheduler": re.compile(
+        r"\b(?:plan(?:s|ned|ning)?|organi[sz]e|schedule|reschedule|arrange|host(?:ing)?|book|coordinate"
+        r"|put together|set up|throw|move|postpone"
+        r"|birthday|party|wedding|reception|conference|meeting|reunion|picnic|festival|workshop|seminar"
+        r"|gala|fundraiser|shower|anniversary|retreat|offsite|barbecue|bbq|meetup|hackathon|celebration"
+        r"|ceremony|budget|venue|weather)\b"),
+    "communication": re.compile(
+        r"\b(?:send|sent|text|message|e-?mail|mail|whatsapp|sms|notify|remind|tell|inform|forward|ping|dm"
+        r"|announce|invite|invitations?|rsvp|let (?:\w+ ){1,3}know|drop (?:\w+ ){1,3}a (?:note|line)"
+        r"|share|reply|contact|broadcast)\b"),
+}
+
+def match_patterns(text: str):
+    """The single route whose patterns match `text`, or None if none or several match."""
+    lowered = text.lower()
+    hits = [route for route, pattern in ROUTE_PATTERNS.items() if pattern.search(lowered)]
+    return hits[0] if len(hits) == 1 else None
+
+# ============================================================================
+# HASHED N-GRAM CLASSIFIER
+# ============================================================================
+
+_TOKEN = re.compile(r"[a-z0-9']+")
+
+def extract_features(text: str, bits: int = FEATURE_BITS) -> dict:
+    """
+    Hashed, length-normalised feature vector {bucket: value}: word unigrams,
+    word bigrams and character trigrams (which cover plurals and spelling variants).
+    """
+    mask = (1 << bits) - 1
+    tokens = _TOKEN.findall(text.lower())
+    names = ["bias"]
+    names += [f"w:{token}" for token in tokens]
+    names += [f"b:{first} {second}" for first, second in zip(tokens, tokens[1:])]
+    for token in tokens:
+        padded = f"<{token}>"
+        names += [f"c:{padded[i:i + 3]}" for i in range(len(padded) - 2)]
+    features = {}
+    for name in names:
+        bucket = zlib.crc32(name.encode()) & mask  # Stable across processes, unlike hash()
+        features[bucket] = features.get(bucket, 0.0) + 1.0
+    norm = 1.0 / math.sqrt(len(names))
+    return {bucket: value * norm for bucket, value in features.items()}
+
+class IntentRouter:
+    """
+    Local intent classifier for the orchestrator: a multinomial logistic regression
+    over hashed n-gram features, with ROUTE_PATTERNS as a fast path in front of it.
+
+    `classify()` returns {"route", "confidence", "source"}; source is "pattern" for
+    the fast path (confidence 1.0) and "model" otherwise, confidence being the
+    probability of the chosen route.
+    """
+
+    def __init__(self, routes=ROUTES, bits: int = FEATURE_BITS):
+        self.routes = tuple(routes)
+        self.bits = bits
+        self.weights = {route: [0.0] * (1 << bits) for route in self.routes}
+
+    def fit(self, corpus, epochs: int = TRAINING_EPOCHS, learning_rate: float = LEARNING_RATE,
+            l2: float = L2_PENALTY, seed: int = 0):
+        """Train on (text, route) pairs with plain SGD (deterministic for a given seed)."""
+        samples = [(extract_features(text, self.bits), route) for text, route in corpus]
+        rng = random.Random(seed)
+        for epoch in range(epochs):
+            rng.shuffle(samples)
+            rate = learning_rate / (1 + epoch * 0.1)
+            for features, label in samples:
+                probabilities = self._probabilities(features)
+                for route in self.routes:
+                    gradient = probabilities[route] - (1.0 if route == label else 0.0)
+                    weights = self.weights[route]
+                    for bucket, value in features.items():
+                        weights[bucket] -= rate * (gradient * value + l2 * weights[bucket])
+        return self
+
+    def _probabilities(self, features: dict) -> dict:
+        scores = {route: sum(self.weights[route][bucket] * value for bucket, value in features.items())
+                  for route in self.routes}
+        top = max(scores.values())
+        exps = {route: math.exp(score - top) for route, score in scores.items()}
+        total = sum(exps.values())
+        return {route: exp / total for route, exp in exps.items()}
+
+    def predict(self, text: str) -> dict:
+        """Classifier only: route probabilities for `text`."""
+        return self._probabilities(extract_features(text, self.bits))
+
+    def classify(self, text: str) -> dict:
+        route = match_patterns(text)
+        if route is not None:
+            return {"route": route, "confidence": 1.0, "source": "pattern"}
+        probabilities = self.predict(text)
+        route = max(probabilities, key=probabilities.get)
+        return {"route": route, "confidence": probabilities[route], "source": "model"}
+
+_default_router = None
+
+def get_intent_router() -> IntentRouter:
+    """Router trained on the bundled INTENT_CORPUS, built on first use (a few hundred ms)."""
+    global _default_router
+    if _default_router is None:
+        from intent_corpus import INTENT_CORPUS
+        _default_router = IntentRouter().fit(INTENT_CORPUS)
+    return _default_router
+
+def classify_intent(text: str) -> dict:
+    """Route `text` with the default router: {"route", "confidence", "source"}."""
+    return get_intent_router().classify(text)
+
+# ============================================================================
+# LLM FALLBACK
+# ============================================================================
+
+def parse_model_route(content, default: str) -> str:
+    """Route named in a model's routing answer; `default` if it names none or both."""
+    text = content.lower() if isinstance(content, str) else str(content).lower()
+    named = [route for route in ROUTES if route in text]
+    return named[0] if len(named) == 1 else default
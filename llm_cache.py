@@ -0,0 +1,197 @@
+# llm_cache.py
+
+import json
+import time
+import uuid
+import sqlite3
+import hashlib
+import threading
+from langchain_core.messages import messages_from_dict, messages_to_dict
+from langchain_core.runnables import Runnable
+
+# ============================================================================
+# PERSISTENT RESPONSE STORE
+# ============================================================================
+
+DEFAULT_TTL_SECONDS = 24 * 3600
+DEFAULT_MAX_ENTRIES = 10000
+DEFAULT_MAX_BYTES = 256 * 2**20
+
+class LLMResponseCache:
+    """
+    Disk-backed store of model responses with TTL expiry and LRU eviction.
+
+    Entries older than `ttl_seconds` are treated as misses and removed. When the
+    store exceeds `max_entries` or `max_bytes`, the least recently used entries
+    are evicted. Hit/miss counters and cumulative latencies are kept per process
+    and reported by stats().
+
+    Args:
+        path: SQLite database file (":memory:" for a process-local cache).
+        ttl_seconds: Lifetime of an entry. None disables expiry.
+        max_entries: Maximum number of cached responses.
+        max_bytes: Maximum total size of cached responses.
+    """
+
+    def __init__(self, path: str, ttl_seconds: float = DEFAULT_TTL_SECONDS,
+                 max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, "
+            "created REAL NOT NULL, last_access REAL NOT NULL)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS responses_lru ON responses (last_access)")
+        self.counters = {"hits": 0, "misses": 0, "expired": 0, "evictions": 0,
+                         "hit_seconds": 0.0, "miss_seconds": 0.0}
+
+    def get(self, key: str):
+        """Return the cached response for `key`, or None on a miss."""
+        now = time.time()
+        with self._lock:
+            row = self.conn.execute("SELECT value, created FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            value, created = row
+            if self.ttl_seconds is not None and now - created > self.ttl_seconds:
+                self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.counters["expired"] += 1
+                return None
+            self.conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+        return messages_from_dict([json.loads(value)])[0]
+
+    def put(self, key: str, message) -> None:
+        """Store a response and evict least recently used entries beyond the limits."""
+        value = json.dumps(messages_to_dict([message])[0])
+        now = time.time()
+        with self._lock:
+            self.conn.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                              (key, value, len(value), now, now))
+            entries, total_bytes = self.conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+            while entries > self.max_entries or total_bytes > self.max_bytes:
+                oldest = self.conn.execute(
+                    "SELECT key, size FROM responses ORDER BY last_access LIMIT 1"
+                ).fetchone()
+                if oldest is None or oldest[0] == key:
+                    break
+                self.conn.execute("DELETE FROM responses WHERE key = ?", (oldest[0],))
+                self.counters["evictions"] += 1
+                entries -= 1
+                total_bytes -= oldest[1]
+
+    def record(self, hit: bool, seconds: float) -> None:
+        """Count a lookup and its end-to-end latency (including the model call on a miss)."""
+        with self._lock:
+            if hit:
+                self.counters["hits"] += 1
+                self.counters["hit_seconds"] += seconds
+            else:
+                self.counters["misses"] += 1
+                self.counters["miss_seconds"] += seconds
+
+    def stats(self) -> dict:
+        """Hit/miss counters, hit rate and mean latency of hits and misses."""
+        with self._lock:
+            counters = dict(self.counters)
+        hits, misses = counters["hits"], counters["misses"]
+        return {
+            **counters,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "mean_hit_ms": counters["hit_seconds"] / hits * 1000 if hits else 0.0,
+            "mean_miss_ms": counters["miss_seconds"] / misses * 1000 if misses else 0.0,
+        }
+
+    def close(self):
+        self.conn.close()
+
+# ============================================================================
+# CACHING MODEL WRAPPER
+# ============================================================================
+
+def _normalize_content(content):
+    if isinstance(content, str):
+        return " ".join(content.split())
+    return json.dumps(content, sort_keys=True, default=str)
+
+def _normalize_message(msg) -> dict:
+    """Reduce a message to what affects the model's answer (no ids, whitespace-normalized)."""
+    normalized = {"type": msg.type, "content": _normalize_content(msg.content)}
+    if msg.type == "ai" and msg.tool_calls:
+        normalized["tool_calls"] = [[call["name"], call["args"]] for call in msg.tool_calls]
+    if msg.type == "tool":
+        normalized["name"] = msg.name
+    return normalized
+
+def _model_fingerprint(model) -> str:
+    """
+    Identify the underlying model and the tool schema it is bound to. A hedged
+    model (model_router.HedgedChatModel) is identified by its primary.
+    """
+    while hasattr(model, "primary"):
+        model = model.primary
+    bound = getattr(model, "bound", model)
+    kwargs = getattr(model, "kwargs", {})
+    identity = {
+        "class": type(bound).__name__,
+        "model": getattr(bound, "model", None) or getattr(bound, "model_name", None),
+        "temperature": getattr(bound, "temperature", None),
+        "tools": kwargs.get("tools"),
+    }
+    return json.dumps(identity, sort_keys=True, default=str)
+
+class CachedChatModel(Runnable):
+    """
+    Wraps a tool-bound chat model with a persistent response cache.
+
+    The cache key is a hash of the normalized message list plus the model
+    identity and bound tool schema, so the scheduler and communication models
+    can share one store. Cached messages and their tool calls get fresh ids on
+    every hit.
+    """
+
+    def __init__(self, model, cache: LLMResponseCache):
+        self.model = model
+        self.cache = cache
+        self._fingerprint = _model_fingerprint(model)
+
+    def cache_key(self, messages) -> str:
+        payload = json.dumps([self._fingerprint, [_normalize_message(m) for m in messages]], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _from_cache(self, key: str):
+        response = self.cache.get(key)
+        if response is None:
+            return None
+        # add_messages de-duplicates by message id: a replayed id would replace the earlier message
+        response.id = str(uuid.uuid4())
+        if getattr(response, "tool_calls", None):
+            response.tool_calls = [{**call, "id": f"call_{uuid.uuid4().hex[:24]}"} for call in response.tool_calls]
+        return response
+
+    def invoke(self, input, config=None, **kwargs):
+        start = time.perf_counter()
+        key = self.cache_key(input)
+        response = self._from_cache(key)
+        hit = response is not None
+        if not hit:
+            response = self.model.invoke(input, config, **kwargs)
+            self.cache.put(key, response)
+        self.cache.record(hit, time.perf_counter() - start)
+        return response
+
+    async def ainvoke(self, input, config=None, **kwargs):
+        start = time.perf_counter()
+        key = self.cache_key(input)
+        response = self._from_cache(key)
+        hit = response is not None
+        if not hit:
+            response = await self.model.ainvoke(input, config, **kwargs)
+            self.cache.put(key, response)
+        self.cache.record(hit, time.perf_counter() - start)
+        return response
@@ -1,20 +1,32 @@
 # main.py
 
 import os
+import json
+import uuid
 import asyncio
+import contextlib
 from functools import partial
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, ToolMessage
-from langgraph.checkpoint.memory import MemorySaver
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph, END
-from langgraph.prebuilt import ToolNode
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_ollama import ChatOllama
 # Import agents, tools, and data from other files
-from data import event_planning_data, WEATHER_DATA
+# (model providers are imported in create_chat_model, for the selected backend only)
+from data import new_planning_data, get_planning_data
 from tools import calendar, finance, health, weather, traffic, invite_people, whatsapp_message, email_message
-from orchestrator import orchestrator_agent, AgentState
-from scheduler import scheduler_agent
-from messaging_agent import communication_agent
+from orchestrator import orchestrator_agent, aorchestrator_agent, AgentState
+from intent_router import get_intent_router
+from tool_prefetch import start_prefetch, close_prefetch, prefetch_stats
+from replanning import replan_message, is_complete_replan
+from tool_cache import configure_tool_cache
+from scheduler import scheduler_agent, ascheduler_agent
+from messaging_agent import communication_agent, acommunication_agent
+from parallel_tools import create_parallel_tool_node
+from checkpointer import RetainingMemorySaver, SQLiteCheckpointer
+from llm_cache import LLMResponseCache, CachedChatModel
+from model_router import HedgedChatModel
+from metrics import MetricsRegistry, MetricsCallbackHandler
+from renderer import render_tool_output, write_box
+from terminal_io import AsyncTerminal
 
 # ============================================================================
 # CONFIGURATION
@@ -24,9 +36,74 @@ GEMINI_MODEL = "gemini-1.5-flash"
 
 OLLAMA_BASE_URL = "http://localhost:11434"
 OLLAMA_MODEL = "hermes3:8b"
-
-if GEMINI_API_KEY == "YOUR_GEMINI_API_KEY" or not GEMINI_API_KEY:
-    raise ValueError("Please replace 'YOUR_GEMINI_API_KEY' with your actual Google Generative AI API key.")
+OLLAMA_KEEP_ALIVE = "30m"                # Keep the model loaded between requests
+OLLAMA_POOL_MAX_CONNECTIONS = 10         # Keep-alive connections shared by all Ollama models
+OLLAMA_POOL_KEEPALIVE_SECONDS = 300.0
+OLLAMA_WARMUP_ENABLED = True             # Pre-open connections and load the model at startup
+OLLAMA_WARMUP_CONNECTIONS = 4
+
+# Chat model backend: "gemini", "ollama" or "fake" (offline, scripted; see fake_model.py)
+MODEL_BACKEND = os.environ.get("EVENT_PLANNER_BACKEND", "gemini")
+FAKE_MODEL_LATENCY = 0.5                 # Seconds to the first token of a fake response
+FAKE_MODEL_LATENCY_DISTRIBUTION = "lognormal"
+FAKE_MODEL_TOKEN_LATENCY = 0.02          # Seconds between streamed tokens
+
+# Hedged requests: if MODEL_BACKEND has not answered within its recent p95 latency,
+# the same call is sent to this backend and the first valid response wins (None disables)
+HEDGE_BACKEND = None                     # e.g. "ollama" with MODEL_BACKEND = "gemini"
+HEDGE_QUANTILE = 0.95
+
+# Orchestrator routing: a local intent classifier (intent_router.py) decides; below this
+# confidence the chat model is asked instead (ROUTER_LLM_FALLBACK = False keeps it local)
+ROUTER_CONFIDENCE_THRESHOLD = 0.75
+ROUTER_LLM_FALLBACK = True
+
+# Scheduler tool execution: independent tool calls of one turn run concurrently
+SCHEDULER_TOOL_MAX_PARALLELISM = 5
+TOOL_TIMEOUT_SECONDS = 30.0
+TOOL_TIMEOUTS = {  # Per-tool overrides, in seconds
+    "weather": 10.0,
+    "traffic": 10.0,
+}
+
+# Speculative tool prefetch: once a request is routed to the scheduler, the tools it will
+# likely call run in parallel with the first scheduler model call (pays off with slow tools)
+TOOL_PREFETCH_ENABLED = False
+
+# On "modify", re-run only the tools of the plan facets the change touches (date, budget,
+# venue) and keep the rest of the plan; changes to anything else re-plan from scratch
+INCREMENTAL_REPLANNING_ENABLED = True
+
+# In-process memo of scheduler tool results, keyed on normalized arguments. TTLs in
+# seconds per tool; 0 keeps a tool's output always fresh. The memo is shared by all
+# sessions, so per-user answers (calendar availability) must stay at 0
+TOOL_CACHE_ENABLED = True
+TOOL_CACHE_MAX_ENTRIES = 1024
+TOOL_CACHE_TTLS = {
+    "calendar": 0,
+    "finance": 3600.0,
+    "health": 24 * 3600.0,
+    "weather": 600.0,
+    "traffic": 120.0,
+}
+
+# Approximate token budget for the scheduler's conversation history (None = unbounded)
+SCHEDULER_CONTEXT_TOKEN_BUDGET = 4000
+
+# Opt-in persistent cache of model responses (keyed on normalized messages + bound tools)
+LLM_CACHE_ENABLED = False
+LLM_CACHE_PATH = "llm_cache.sqlite"
+LLM_CACHE_TTL_SECONDS = 24 * 3600
+LLM_CACHE_MAX_ENTRIES = 10000
+
+# Per-node/per-tool timing, token and error metrics (JSON summary after each CLI session)
+METRICS_ENABLED = True
+
+# Checkpointing: "memory" (lost on restart) or "sqlite" (durable, file-backed)
+CHECKPOINT_BACKEND = "memory"
+CHECKPOINT_DB_PATH = "checkpoints.sqlite"
+CHECKPOINT_KEEP_LAST = 10            # Checkpoints kept per thread (None keeps the full history)
+CHECKPOINT_KEEP_REVIEW_POINTS = 3    # Recent human review points kept beyond that window
 
 # ============================================================================
 # TOOLS & MODELS SETUP
@@ -35,64 +112,175 @@ if GEMINI_API_KEY == "YOUR_GEMINI_API_KEY" or not GEMINI_API_KEY:
 # Tool lists
 scheduler_tools = [calendar, finance, health, weather, traffic ]
 communication_tools = [whatsapp_message, email_message, invite_people]
-
-# Tool nodes
-scheduler_tool_node = ToolNode(scheduler_tools)
-communication_tool_node = ToolNode(communication_tools)
+configure_tool_cache(TOOL_CACHE_MAX_ENTRIES, TOOL_CACHE_TTLS if TOOL_CACHE_ENABLED else {})
 
 # Model initialization
-model = ChatGoogleGenerativeAI(
-    model=GEMINI_MODEL,
-    google_api_key=GEMINI_API_KEY,
-    temperature=0.1,
-)
-
-# model=ChatOllama(
-#     base_url=OLLAMA_BASE_URL,
-#     model=OLLAMA_MODEL,
-# )
-
-# Bind tools to models
-scheduler_model = model.bind_tools(scheduler_tools)
-communication_model = model.bind_tools(communication_tools)
+_ollama_pool = None
+_chat_models = None
+_routing_model = None
+llm_cache = None
+
+def get_ollama_pool():
+    """Keep-alive connection pool shared by every Ollama model (created on first use)."""
+    global _ollama_pool
+    if _ollama_pool is None:
+        from ollama_pool import OllamaConnectionPool
+        _ollama_pool = OllamaConnectionPool(OLLAMA_BASE_URL,
+                                            max_connections=OLLAMA_POOL_MAX_CONNECTIONS,
+                                            keepalive_expiry=OLLAMA_POOL_KEEPALIVE_SECONDS)
+    return _ollama_pool
+
+def create_chat_model(backend: str = MODEL_BACKEND):
+    """
+    Create the chat model shared by the scheduler and communication agents.
+    Provider packages are imported here so startup only pays for the backend in use.
+    """
+    if backend == "gemini":
+        if GEMINI_API_KEY == "YOUR_GEMINI_API_KEY" or not GEMINI_API_KEY:
+            raise ValueError("Please replace 'YOUR_GEMINI_API_KEY' with your actual Google Generative AI API key.")
+        from langchain_google_genai import ChatGoogleGenerativeAI
+        return ChatGoogleGenerativeAI(
+            model=GEMINI_MODEL,
+            google_api_key=GEMINI_API_KEY,
+            temperature=0.1,
+        )
+    elif backend == "ollama":
+        from langchain_ollama import ChatOllama
+        return ChatOllama(
+            base_url=OLLAMA_BASE_URL,
+            model=OLLAMA_MODEL,
+            keep_alive=OLLAMA_KEEP_ALIVE,
+            **get_ollama_pool().client_kwargs(),
+        )
+    elif backend == "fake":
+        from fake_model import FakeChatModel
+        return FakeChatModel(
+            latency=FAKE_MODEL_LATENCY,
+            latency_distribution=FAKE_MODEL_LATENCY_DISTRIBUTION,
+            token_latency=FAKE_MODEL_TOKEN_LATENCY,
+        )
+    raise ValueError(f"Unknown model backend: {backend!r} (expected 'gemini', 'ollama' or 'fake')")
+
+def get_chat_models():
+    """
+    Return the tool-bound (scheduler_model, communication_model) pair, created on
+    first use and shared by every graph built with the default models.
+    Raises ValueError for a misconfigured backend (e.g. a missing Gemini key);
+    the offline fake model is only used when MODEL_BACKEND is "fake".
+    """
+    global _chat_models, _routing_model, llm_cache
+    if _chat_models is not None:
+        return _chat_models
+
+    model = create_chat_model()
+    _routing_model = model
+
+    # Bind tools to models
+    scheduler_model = model.bind_tools(scheduler_tools)
+    communication_model = model.bind_tools(communication_tools)
+
+    # Optional hedging against a second backend bound to the same tools
+    if HEDGE_BACKEND:
+        hedge_model = create_chat_model(HEDGE_BACKEND)
+        scheduler_model = HedgedChatModel(scheduler_model, hedge_model.bind_tools(scheduler_tools), quantile=HEDGE_QUANTILE)
+        communication_model = HedgedChatModel(communication_model, hedge_model.bind_tools(communication_tools), quantile=HEDGE_QUANTILE)
+
+    # Optional response cache shared by both bound models
+    if LLM_CACHE_ENABLED:
+        llm_cache = LLMResponseCache(LLM_CACHE_PATH, ttl_seconds=LLM_CACHE_TTL_SECONDS, max_entries=LLM_CACHE_MAX_ENTRIES)
+        scheduler_model = CachedChatModel(scheduler_model, llm_cache)
+        communication_model = CachedChatModel(communication_model, llm_cache)
+
+    _chat_models = (scheduler_model, communication_model)
+    return _chat_models
+
+def get_routing_model():
+    """The shared chat model without tools, asked by the orchestrator on low-confidence routes."""
+    get_chat_models()
+    return _routing_model
+
+async def warm_up_models(quiet: bool = False):
+    """
+    Pre-open pooled Ollama connections and load the model before the first request.
+    With `quiet`, only a failure is reported.
+    """
+    if not OLLAMA_WARMUP_ENABLED or "ollama" not in (MODEL_BACKEND, HEDGE_BACKEND):
+        return
+    try:
+        timings = await get_ollama_pool().warm_up(OLLAMA_MODEL, keep_alive=OLLAMA_KEEP_ALIVE,
+                                            connections=OLLAMA_WARMUP_CONNECTIONS)
+        if not quiet:
+            print(f"🔥 Ollama warm-up: {OLLAMA_WARMUP_CONNECTIONS} connections in {timings['connect_s'] * 1000:.0f} ms, "
+              f"{OLLAMA_MODEL} loaded in {timings['model_load_s']:.2f} s")
+    except Exception as e:
+        # Not fatal: the first request opens the connection and loads the model instead.
+        print(f"⚠️ Ollama warm-up failed ({e}); continuing without it.")
 
 # ============================================================================
 # ASYNC AGENT WRAPPERS
 # ============================================================================
 
-async def async_scheduler_agent(state: AgentState, scheduler_model=None) -> AgentState:
-    """Async wrapper for scheduler agent."""
-    # If your scheduler_agent is already async, just call it directly
-    # If not, run it in a thread pool
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, scheduler_agent, state, scheduler_model)
-
-async def async_communication_agent(state: AgentState, communication_model=None) -> AgentState:
-    """Async wrapper for communication agent."""
-    # If your communication_agent is already async, just call it directly
-    # If not, run it in a thread pool
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, communication_agent, state, communication_model)
-
-async def async_orchestrator_agent(state: AgentState) -> AgentState:
-    """Async wrapper for orchestrator agent."""
-    # If your orchestrator_agent is already async, just call it directly
-    # If not, run it in a thread pool
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, orchestrator_agent, state)
-
-# Partial function for agents to pass the model
-scheduler_agent_with_model = partial(async_scheduler_agent, scheduler_model=scheduler_model)
-communication_agent_with_model = partial(async_communication_agent, communication_model=communication_model)
+async def async_scheduler_agent(state: AgentState, config: RunnableConfig, scheduler_model=None,
+                                token_budget: int = SCHEDULER_CONTEXT_TOKEN_BUDGET) -> AgentState:
+    """Async-native scheduler agent node (awaits scheduler_model.ainvoke)."""
+    result = await ascheduler_agent(state, scheduler_model, config, token_budget)
+    return _close_prefetch_without_tools(result, config)
+
+async def async_communication_agent(state: AgentState, config: RunnableConfig, communication_model=None) -> AgentState:
+    """Async-native communication agent node (awaits communication_model.ainvoke)."""
+    return await acommunication_agent(state, communication_model, config)
+
+def _maybe_prefetch(result: AgentState, config: RunnableConfig, prefetch_tools) -> AgentState:
+    """Start speculative scheduler tool runs when the request was routed to the scheduler."""
+    if prefetch_tools and result["next_action"] == "scheduler":
+        start_prefetch(config, get_planning_data(config)["user_request"], prefetch_tools)
+    return result
+
+def _close_prefetch_without_tools(result: AgentState, config: RunnableConfig) -> AgentState:
+    """A scheduler turn without tool calls has nothing to serve: cancel the speculative runs."""
+    if result["next_action"] != "tools":
+        close_prefetch(config)
+    return result
+
+async def async_orchestrator_agent(state: AgentState, config: RunnableConfig, routing_model=None,
+                                   confidence_threshold: float = ROUTER_CONFIDENCE_THRESHOLD, prefetch_tools=None) -> AgentState:
+    """Async-native orchestrator agent node."""
+    result = await aorchestrator_agent(state, config, routing_model, confidence_threshold)
+    return _maybe_prefetch(result, config, prefetch_tools)
+
+# Thread-pool wrappers around the blocking agents. Every in-flight model call pins
+# a worker of the default executor; kept for comparison (see benchmark.py).
+
+async def threaded_scheduler_agent(state: AgentState, config: RunnableConfig, scheduler_model=None,
+                                   token_budget: int = SCHEDULER_CONTEXT_TOKEN_BUDGET) -> AgentState:
+    """Run the blocking scheduler agent in the default thread pool."""
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(None, scheduler_agent, state, scheduler_model, config, token_budget)
+    return _close_prefetch_without_tools(result, config)
+
+async def threaded_communication_agent(state: AgentState, config: RunnableConfig, communication_model=None) -> AgentState:
+    """Run the blocking communication agent in the default thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, communication_agent, state, communication_model, config)
+
+async def threaded_orchestrator_agent(state: AgentState, config: RunnableConfig, routing_model=None,
+                                      confidence_threshold: float = ROUTER_CONFIDENCE_THRESHOLD, prefetch_tools=None) -> AgentState:
+    """Run the blocking orchestrator agent in the default thread pool."""
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(None, orchestrator_agent, state, config, routing_model, confidence_threshold)
+    return _maybe_prefetch(result, config, prefetch_tools)
 
 # ============================================================================
 # HUMAN-IN-THE-LOOP NODE
 # ============================================================================
 
-async def human_review_node(state: AgentState) -> AgentState:
+async def human_review_node(state: AgentState, config: RunnableConfig, replan_tools=None) -> AgentState:
     """
     Human-in-the-loop node that waits for user input after scheduler execution.
     This node will be interrupted before execution to allow human input.
+    With `replan_tools`, a modification that touches known plan facets re-runs
+    only the affected tools (see replanning.py) first; the scheduler only runs
+    when the modification also asks for something the facet tools don't cover.
     """
     messages = state["messages"]
     
@@ -110,16 +298,23 @@ async def human_review_node(state: AgentState) -> AgentState:
         if any(keyword in user_input for keyword in ['proceed', 'continue', 'go ahead', 'yes', 'looks good', 'approve']):
             state["next_action"] = "communication"
             state["current_agent"] = "human_review"
-            event_planning_data["current_step"] = "scheduling_complete"
+            get_planning_data(config)["current_step"] = "scheduling_complete"
             
             # Add a system message to indicate approval
             state["messages"].append(AIMessage(content="✅ Plan approved by user. Proceeding to send invitations."))
         
         elif any(keyword in user_input for keyword in ['modify', 'change', 'update', 'revise', 'reschedule']):
-            state["next_action"] = "scheduler"
             state["current_agent"] = "human_review"
-            # Add a system message with the modification request
-            state["messages"].append(AIMessage(content=f"🔄 User requested modifications: {last_human_msg.content}. Returning to scheduler for updates."))
+            replan = replan_message(last_human_msg.content, get_planning_data(config), replan_tools) if replan_tools else None
+            if replan is not None:
+                # Targeted re-plan: the scheduler tool node runs these calls, then returns
+                # here or, for a partly covered change, hands over to the scheduler
+                state["next_action"] = "scheduler_tools"
+                state["messages"].append(replan)
+            else:
+                state["next_action"] = "scheduler"
+                # Add a system message with the modification request
+                state["messages"].append(AIMessage(content=f"🔄 User requested modifications: {last_human_msg.content}. Returning to scheduler for updates."))
         
         else:
             # Default to asking for clarification
@@ -152,8 +347,8 @@ def route_after_human_review(state: AgentState) -> str:
     """Route from human review node based on user decision."""
     next_action = state.get("next_action", "communication")
     
-    if next_action == "scheduler":
-        return "scheduler"
+    if next_action in ("scheduler", "scheduler_tools"):
+        return next_action
     else:
         return "communication"
 
@@ -166,7 +361,10 @@ def route_after_communication(state: AgentState) -> str:
 
 def route_after_scheduler_tools(state: AgentState) -> str:
     """Route after scheduler tools execution."""
-    # After tools execution, go back to scheduler for processing
+    # A targeted re-plan that covers the whole change goes straight back to review;
+    # otherwise the scheduler processes the results (and the rest of the change)
+    if is_complete_replan(state["messages"]):
+        return "human_review"
     return "scheduler"
 
 def route_after_communication_tools(state: AgentState) -> str:
@@ -177,17 +375,86 @@ def route_after_communication_tools(state: AgentState) -> str:
 # GRAPH CONSTRUCTION
 # ============================================================================
 
-def create_event_planning_graph():
-    """Create the multi-agent event planning graph."""
+def create_checkpointer(backend: str = CHECKPOINT_BACKEND, path: str = CHECKPOINT_DB_PATH,
+                        keep_last: int = CHECKPOINT_KEEP_LAST, keep_review_points: int = CHECKPOINT_KEEP_REVIEW_POINTS):
+    """
+    Create the checkpointer selected by `backend` ("memory" or "sqlite"), with the
+    retention policy applied on every checkpoint write.
+    """
+    if backend == "memory":
+        return RetainingMemorySaver(keep_last=keep_last, keep_review_points=keep_review_points)
+    elif backend == "sqlite":
+        return SQLiteCheckpointer(path, keep_last=keep_last, keep_review_points=keep_review_points)
+    raise ValueError(f"Unknown checkpoint backend: {backend!r} (expected 'memory' or 'sqlite')")
+
+def create_event_planning_graph(scheduler_model=None, communication_model=None, native_async: bool = True, checkpointer=None,
+                                scheduler_token_budget: int = SCHEDULER_CONTEXT_TOKEN_BUDGET, routing_model=None,
+                                tool_prefetch: bool = TOOL_PREFETCH_ENABLED, scheduler_tool_list=None,
+                                incremental_replanning: bool = INCREMENTAL_REPLANNING_ENABLED):
+    """
+    Create the multi-agent event planning graph.
+    
+    Args:
+        scheduler_model: Tool-bound chat model used by the scheduler agent.
+            Defaults to the shared model from get_chat_models().
+        communication_model: Tool-bound chat model used by the communication agent.
+            Defaults to the shared model from get_chat_models().
+        native_async: Use the async-native agents (ainvoke). When False, the blocking
+            agents run in the default thread pool instead.
+        checkpointer: Checkpoint saver to compile with. Defaults to create_checkpointer().
+        scheduler_token_budget: Approximate token budget for the scheduler's history.
+        routing_model: Chat model the orchestrator asks when the intent router is not
+            confident. Defaults to the shared model (if ROUTER_LLM_FALLBACK) only when
+            the default agent models are used; graphs built on custom models stay local.
+        tool_prefetch: Run the scheduler's likely tools speculatively (see tool_prefetch.py).
+        scheduler_tool_list: Tools of the scheduler tool node. Defaults to scheduler_tools;
+            the scheduler model must be bound to tools with the same names.
+        incremental_replanning: Re-run only the affected tools on "modify" (see replanning.py).
+    """
+    from langgraph.prebuilt import ToolNode
+
+    if scheduler_model is None and communication_model is None and routing_model is None and ROUTER_LLM_FALLBACK:
+        routing_model = get_routing_model()
+    if scheduler_model is None or communication_model is None:
+        default_scheduler_model, default_communication_model = get_chat_models()
+        scheduler_model = default_scheduler_model if scheduler_model is None else scheduler_model
+        communication_model = default_communication_model if communication_model is None else communication_model
+
+    # Tool nodes
+    if scheduler_tool_list is None:
+        scheduler_tool_list = scheduler_tools
+    scheduler_tool_node = create_parallel_tool_node(
+        scheduler_tool_list,
+        max_parallelism=SCHEDULER_TOOL_MAX_PARALLELISM,
+        timeouts=TOOL_TIMEOUTS,
+        default_timeout=TOOL_TIMEOUT_SECONDS,
+        prefetch=tool_prefetch,
+    )
+    prefetch_tools = scheduler_tool_list if tool_prefetch else None
+    communication_tool_node = ToolNode(communication_tools)
+
+    get_intent_router()  # Train the router now rather than on the first request
+    
+    if native_async:
+        orchestrator_node = partial(async_orchestrator_agent, routing_model=routing_model,
+                                    confidence_threshold=ROUTER_CONFIDENCE_THRESHOLD, prefetch_tools=prefetch_tools)
+        scheduler_node = partial(async_scheduler_agent, scheduler_model=scheduler_model, token_budget=scheduler_token_budget)
+        communication_node = partial(async_communication_agent, communication_model=communication_model)
+    else:
+        orchestrator_node = partial(threaded_orchestrator_agent, routing_model=routing_model,
+                                    confidence_threshold=ROUTER_CONFIDENCE_THRESHOLD, prefetch_tools=prefetch_tools)
+        scheduler_node = partial(threaded_scheduler_agent, scheduler_model=scheduler_model, token_budget=scheduler_token_budget)
+        communication_node = partial(threaded_communication_agent, communication_model=communication_model)
     
     # Create the graph
     graph = StateGraph(AgentState)
     
     # Add agent nodes (now async)
-    graph.add_node("orchestrator", async_orchestrator_agent)
-    graph.add_node("scheduler", scheduler_agent_with_model)
-    graph.add_node("human_review", human_review_node)
-    graph.add_node("communication", communication_agent_with_model)
+    graph.add_node("orchestrator", orchestrator_node)
+    graph.add_node("scheduler", scheduler_node)
+    graph.add_node("human_review", partial(human_review_node,
+                                           replan_tools=scheduler_tool_list if incremental_replanning else None))
+    graph.add_node("communication", communication_node)
     
     # Add tool nodes
     graph.add_node("scheduler_tools", scheduler_tool_node)
@@ -215,7 +482,14 @@ def create_event_planning_graph():
         }
     )
     
-    graph.add_edge("scheduler_tools", "scheduler")
+    graph.add_conditional_edges(
+        "scheduler_tools",
+        route_after_scheduler_tools,
+        {
+            "scheduler": "scheduler",
+            "human_review": "human_review"
+        }
+    )
     
     # Add human review routing
     graph.add_conditional_edges(
@@ -223,6 +497,7 @@ def create_event_planning_graph():
         route_after_human_review,
         {
             "scheduler": "scheduler",
+            "scheduler_tools": "scheduler_tools",
             "communication": "communication"
         }
     )
@@ -238,45 +513,58 @@ def create_event_planning_graph():
     
     graph.add_edge("communication_tools", "communication")
     
-    memory = MemorySaver()
+    if checkpointer is None:
+        checkpointer = create_checkpointer()
     
     # Interrupt before human_review to allow for user input
-    return graph.compile(interrupt_before=["human_review"], checkpointer=memory)
+    return graph.compile(interrupt_before=["human_review"], checkpointer=checkpointer)
 
-# ============================================================================
-# UTILITY FUNCTIONS FOR FORMATTING
-# ============================================================================
+_event_planning_graph = None
 
-def get_visual_length(text: str) -> int:
-    """
-    Calculates the visual length of a string in a terminal, accounting for common emojis
-    that are often double-width. This is a heuristic and may not be perfect for all
-    characters or terminal fonts.
-    """
-    visual_len = 0
-    for char in text:
-        # These Unicode ranges cover many common emojis. We assume they are double-width.
-        if ('\u2600' <= char <= '\u27BF' or          # Miscellaneous Symbols
-            '\U0001F300' <= char <= '\U0001F5FF' or  # Misc Symbols and Pictographs
-            '\U0001F600' <= char <= '\U0001F64F' or  # Emoticons
-            '\U0001F680' <= char <= '\U0001F6FF' or  # Transport and Map Symbols
-            '\U0001F900' <= char <= '\U0001F9FF'):   # Supplemental Symbols and Pictographs
-            visual_len += 2
-        else:
-            visual_len += 1
-    return visual_len
+def get_event_planning_graph():
+    """The default graph (default models and checkpointer), built once on first use."""
+    global _event_planning_graph
+    if _event_planning_graph is None:
+        _event_planning_graph = create_event_planning_graph()
+    return _event_planning_graph
+
+async def prepare_event_planning_graph():
+    """Build the default graph off the event loop and warm the model up; returns the graph."""
+    app = await asyncio.to_thread(get_event_planning_graph)
+    await warm_up_models(quiet=True)
+    return app
 
 # ============================================================================
 # ASYNC EVENT STREAMING HANDLERS
 # ============================================================================
 
+# Model runs whose tokens are being printed (their header line is already out)
+_streaming_runs = set()
+
 async def handle_stream_event(event):
     """Handle individual stream events from astream_events."""
     event_type = event.get("event")
     name = event.get("name", "")
     data = event.get("data", {})
     
-    if event_type == "on_chain_start":
+    if event_type == "on_chat_model_stream":
+        # Print model tokens as they arrive instead of waiting for the whole turn
+        chunk = data.get("chunk")
+        text = chunk.content if isinstance(getattr(chunk, "content", None), str) else ""
+        if text:
+            run_id = event.get("run_id")
+            if run_id not in _streaming_runs:
+                _streaming_runs.add(run_id)
+                node = event.get("metadata", {}).get("langgraph_node", name)
+                print(f"\n💬 {node.upper()}: ", end="")
+            print(text, end="", flush=True)
+    
+    elif event_type == "on_chat_model_end":
+        if event.get("run_id") in _streaming_runs:
+            _streaming_runs.discard(event.get("run_id"))
+            print()
+    
+    elif event_type == "on_chain_start":
         if name == "orchestrator":
             print(f"\n🎯 Orchestrator started...")
         elif name == "scheduler":  
@@ -296,19 +584,6 @@ async def handle_stream_event(event):
         elif name == "human_review":
             print(f"✅ Human review completed")
             
-    elif event_type == "on_chain_stream":
-        # Handle streaming outputs from agents
-        if "messages" in data:
-            messages = data["messages"]
-            if messages:
-                last_msg = messages[-1]
-                if isinstance(last_msg, AIMessage) and last_msg.content:
-                    print(f"\n� {name.upper()}: {last_msg.content}")
-                elif isinstance(last_msg, ToolMessage):
-                    print(f"\n🛠️ TOOL RESULT ({last_msg.name}):")
-                    print(f"📄 {last_msg.content}")
-                    print("-" * 50)
-                    
     elif event_type == "on_tool_start":
         tool_name = name
         tool_input = data.get("input", {})
@@ -396,110 +671,49 @@ async def handle_stream_event(event):
         print(f"\n✅ Tool completed: {tool_name}")
         
         if content:
-            print(f"\n╭{'─' * 60}╮")
-            
-            # --- HEADER ---
-            titles = {
-                "finance": " 💰 BUDGET ANALYSIS",
-                "calendar": " 📅 CALENDAR AVAILABILITY",
-                "health": " 🏥 HEALTH & SAFETY GUIDELINES",
-                "weather": " 🌤️  WEATHER FORECAST",
-                "traffic": " 🚗 TRAFFIC INFORMATION",
-                "invite_people": " 👥 INVITATION DETAILS",
-                "whatsapp_message": " 📱 WHATSAPP STATUS",
-                "email_message": " 📧 EMAIL STATUS",
-            }
-            title_text = titles.get(tool_name, f" 🔧 {tool_name.upper()} RESULT")
-            
-            # Calculate padding based on visual length
-            padding = 60 - get_visual_length(title_text)
-            print(f"│{title_text}{' ' * max(0, padding)}│")
-            
-            print(f"├{'─' * 60}┤")
-            
-            # --- CONTENT ---
-            content_lines = content.split('\n')
-            for line in content_lines:
-                # If line is short enough, print with padding
-                if get_visual_length(line) <= 58:
-                    padding = 58 - get_visual_length(line)
-                    print(f"│ {line}{' ' * max(0, padding)} │")
-                else:
-                    # Wrap long lines based on visual length
-                    words = line.split(' ')
-                    current_line = ""
-                    current_visual_len = 0
-                    for word in words:
-                        word_visual_len = get_visual_length(word)
-                        
-                        # Handle case where a single word is longer than the line
-                        if word_visual_len > 58:
-                            if current_line: # Print any existing line content first
-                                padding = 58 - current_visual_len
-                                print(f"│ {current_line}{' ' * max(0, padding)} │")
-                                current_line = ""
-                                current_visual_len = 0
-                            
-                            # Break the long word itself character by character
-                            temp_word = ""
-                            temp_len = 0
-                            for char in word:
-                                char_len = get_visual_length(char)
-                                if temp_len + char_len > 58:
-                                    padding = 58 - temp_len
-                                    print(f"│ {temp_word}{' ' * max(0, padding)} │")
-                                    temp_word = char
-                                    temp_len = char_len
-                                else:
-                                    temp_word += char
-                                    temp_len += char_len
-                            current_line = temp_word # The remainder becomes the new current_line
-                            current_visual_len = temp_len
-                            continue
-
-                        space_len = 1 if current_line else 0
-                        if current_visual_len + space_len + word_visual_len > 58 and current_line:
-                            padding = 58 - current_visual_len
-                            print(f"│ {current_line}{' ' * max(0, padding)} │")
-                            current_line = word
-                            current_visual_len = word_visual_len
-                        else:
-                            current_line += (' ' if current_line else '') + word
-                            current_visual_len += space_len + word_visual_len
-                    
-                    # Print the last remaining line
-                    if current_line:
-                        padding = 58 - current_visual_len
-                        print(f"│ {current_line}{' ' * max(0, padding)} │")
-            
-            print(f"╰{'─' * 60}╯")
+            write_box(render_tool_output(tool_name, content))
 
 
-async def stream_graph_execution(app, initial_state, thread):
-    """Stream graph execution using astream_events."""
+# Only the events handle_stream_event renders are produced: the agent and review
+# nodes, tools and chat models. Routing functions, tool wrappers and other inner
+# runnables are filtered out while the stream is generated, not after.
+STREAM_EVENT_FILTERS = {
+    "include_names": ["orchestrator", "scheduler", "communication", "human_review"],
+    "include_types": ["tool", "chat_model"],
+}
+
+def is_awaiting_review(state) -> bool:
+    """Check whether a graph state snapshot is paused before the human_review node."""
+    return bool(state.next) and state.next[0] == 'human_review'
+
+async def stream_graph_execution(app, initial_state, thread, terminal: AsyncTerminal = None):
+    """
+    Stream graph execution using astream_events.
+    The graph is compiled with interrupt_before=["human_review"], so the event stream
+    itself ends at the pause point; the checkpoint is read only once, afterwards.
+    With a `terminal`, rendering only waits for it when its output buffer is full.
+    """
     # print(f"🚀 Starting event stream...")
     
-    async for event in app.astream_events(initial_state, thread, version="v1"):
+    async for event in app.astream_events(initial_state, thread, version="v2", **STREAM_EVENT_FILTERS):
         await handle_stream_event(event)
-        
-        # Check if we're at an interrupt point
-        current_state = app.get_state(thread)
-        if current_state.next and current_state.next[0] == 'human_review':
-            print(f"\n⏸️ Stream paused for human review")
-            break
+        if terminal is not None:
+            await terminal.drain()
     
-    return app.get_state(thread)
+    state = await app.aget_state(thread)
+    if is_awaiting_review(state):
+        print(f"\n⏸️ Stream paused for human review")
+    return state
 
-async def continue_after_human_input(app, thread, user_decision):
-    """Continue streaming after human input."""
+async def continue_after_human_input(app, thread, user_decision, terminal: AsyncTerminal = None):
+    """Continue streaming after human input. Returns the state at the next pause or the end."""
     # Update state with user decision
-    app.update_state(thread, {"messages": [HumanMessage(content=user_decision)]})
+    await app.aupdate_state(thread, {"messages": [HumanMessage(content=user_decision)]})
     
     print(f"🔄 Resuming stream after user input...")
     
     # Continue streaming
-    async for event in app.astream_events(None, thread, version="v1"):
-        await handle_stream_event(event)
+    return await stream_graph_execution(app, None, thread, terminal)
 
 # ============================================================================
 # UTILITY & MAIN EXECUTION
@@ -515,23 +729,26 @@ def print_messages(messages):
         elif isinstance(message, HumanMessage): 
             print(f"\n👤 USER: {message.content}")
 
-def reset_planning_data():
-    """Reset the global planning data for a new session."""
-    global event_planning_data
-    event_planning_data = {
-        "user_request": "",
-        "calendar_info": "",
-        "finance_info": "",
-        "health_info": "",
-        "weather_info": "",
-        "traffic_info": "",
-        "invitation_info": "",
-        "whatsapp_status": "",
-        "email_status": "",
-        "current_step": "start"
+def make_session_config(thread_id: str = None, planning_data: dict = None, callbacks: list = None) -> dict:
+    """
+    Build the graph config for one planning session. The session's planning
+    context travels with the config so tools and agents never share state
+    with other sessions running in the same process. `callbacks` (e.g. a
+    MetricsCallbackHandler) are attached to every run of the session.
+    The "tool_prefetch" slot holds the session's speculative tool runs, if any.
+    """
+    config = {
+        "configurable": {
+            "thread_id": thread_id or uuid.uuid4().hex,
+            "planning_data": planning_data if planning_data is not None else new_planning_data(),
+            "tool_prefetch": {},
+        }
     }
+    if callbacks:
+        config["callbacks"] = callbacks
+    return config
 
-def display_current_plan():
+def display_current_plan(event_planning_data):
     """Display the current planning information for user review."""
     print("\n" + "="*60)
     print("📋 CURRENT PLAN SUMMARY")
@@ -552,8 +769,10 @@ def display_current_plan():
     
     print("="*60)
 
-async def get_user_input_async(prompt):
-    """Get user input asynchronously."""
+async def get_user_input_async(prompt, terminal: AsyncTerminal = None):
+    """Get user input asynchronously (from the terminal's stdin reader when given)."""
+    if terminal is not None:
+        return await terminal.readline(prompt)
     loop = asyncio.get_event_loop()
     return await loop.run_in_executor(None, input, prompt)
 
@@ -570,22 +789,37 @@ async def run_event_planning_system():
     print("📱 Communication: Sends invitations via WhatsApp & Email")
     print("="*80)
     
-    # Create the graph
-    app = create_event_planning_graph()
+    # Models and graph are built (and the model warmed up) while the first prompt is shown
+    app = asyncio.create_task(prepare_event_planning_graph())
     
+    # Terminal I/O runs on the event loop: prints are queued for a writer task
+    terminal = await AsyncTerminal().start()
+    with contextlib.redirect_stdout(terminal):
+        try:
+            await planning_loop(app, terminal)
+        finally:
+            app.cancel()
+            await terminal.close()
+
+async def planning_loop(app, terminal: AsyncTerminal = None):
+    """
+    Interactive request / review loop of the CLI. `app` is the compiled graph,
+    or a task building it that is awaited once the first request comes in.
+    """
     while True:
+        thread = None
         try:
-            # Reset data for new planning session
-            reset_planning_data()
-            
             # Get user input
-            user_input = await get_user_input_async("\n👤 Describe the event you'd like to plan (or 'quit' to exit): ")
+            user_input = await get_user_input_async("\n👤 Describe the event you'd like to plan (or 'quit' to exit): ", terminal)
             print()
             
             if user_input.lower() in ['quit', 'exit', 'done', 'finish']:
                 print("👋 Thank you for using the Multi-Agent Event Planning System!")
                 break
             
+            if isinstance(app, asyncio.Future):
+                app = await app
+            
             # Initial state
             initial_state = {
                 "messages": [HumanMessage(content=user_input)],
@@ -596,16 +830,18 @@ async def run_event_planning_system():
             print(f"🚀 Processing request: '{user_input}'")
             print("-" * 60)
             
-            # Run the graph with astream_events
-            thread = {"configurable": {"thread_id": "123"}}
+            # Run the graph with astream_events under a fresh session context
+            session_metrics = MetricsRegistry()
+            thread = make_session_config(callbacks=[MetricsCallbackHandler(session_metrics)] if METRICS_ENABLED else None)
+            event_planning_data = thread["configurable"]["planning_data"]
             
             # Stream until we hit the interrupt (human_review)
-            state = await stream_graph_execution(app, initial_state, thread)
+            state = await stream_graph_execution(app, initial_state, thread, terminal)
             
             # Handle human review loop
-            while app.get_state(thread).next and app.get_state(thread).next[0] == 'human_review':
+            while is_awaiting_review(state):
                 # Display current plan for review
-                display_current_plan()
+                display_current_plan(event_planning_data)
                 
                 print("\n🤔 HUMAN REVIEW REQUIRED")
                 print("Please review the plan above and choose your action:")
@@ -613,20 +849,15 @@ async def run_event_planning_system():
                 print("• Type 'modify', 'change', or describe what you want to update")
                 print("• Type specific changes you want to make")
                 
-                user_decision = await get_user_input_async("\n👤 Your decision: ")
+                user_decision = await get_user_input_async("\n👤 Your decision: ", terminal)
                 print()
                 
                 if user_decision.lower().strip() in ['quit', 'exit', 'cancel']:
                     print("❌ Event planning cancelled.")
                     break
                 
-                # Continue execution with user decision
-                await continue_after_human_input(app, thread, user_decision)
-                
-                # Check if we're still at human review or if execution completed
-                current_state = app.get_state(thread)
-                if not (current_state.next and current_state.next[0] == 'human_review'):
-                    break
+                # Continue execution with user decision; the loop re-checks the returned state
+                state = await continue_after_human_input(app, thread, user_decision, terminal)
             
             # Show final summary
             print("\n" + "="*60)
@@ -647,12 +878,26 @@ async def run_event_planning_system():
             print("\n✅ Event planning completed successfully!")
             print("="*60)
             
+            if METRICS_ENABLED:
+                print("📈 SESSION METRICS")
+                print(json.dumps(session_metrics.summary(), indent=2))
+            prefetch = prefetch_stats(thread)
+            if prefetch:
+                print(f"🔮 Tool prefetch: {prefetch['hits']}/{prefetch['hits'] + prefetch['misses'] + prefetch['failed']} calls served "
+                      f"({prefetch['hit_rate']:.0%}), {prefetch['wasted']} wasted, {prefetch['saved_ms']:.0f} ms saved")
+            
         except KeyboardInterrupt:
             print("\n\n👋 Session interrupted. Goodbye!")
             break
+        except EOFError:
+            print("\n👋 End of input. Goodbye!")
+            break
         except Exception as e:
             print(f"\n❌ An error occurred: {e}")
             print("Let's try again...")
+        finally:
+            if thread is not None:
+                close_prefetch(thread)  # The session is over; stop any speculative tool runs
 
 def main():
     """Entry point that runs the async event loop."""
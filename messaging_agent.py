@@ -1,22 +1,17 @@
 # messaging_agent.py
 
-from langchain_core.messages import SystemMessage, AIMessage
+from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
+from langchain_core.runnables import RunnableConfig
 from orchestrator import AgentState
-from data import event_planning_data
+from data import get_planning_data
 
-def communication_agent(state: AgentState, communication_model) -> AgentState:
-    """
-    Enhanced communication agent that intelligently drafts and sends invitations. Uses the 'invite_people' tool for drafting invitations and the 'whatsapp_message' tool for sending informal invitations via WhatsApp. For formal events, it uses the 'email_message' tool.
-    """
-    messages = state["messages"]
-    user_request = event_planning_data.get("user_request", "")
-    invitation_content = event_planning_data.get("invitation_info", "No invitation has been drafted yet.")
-    
-    # Updated system prompt to include the 'invite_people' tool.
-    system_prompt = SystemMessage(content=f"""You are the Communication Agent. Your role is to handle all outgoing messages and invitations for the event.
+# ============================================================================
+# PROMPT
+# ============================================================================
 
-Original user request: "{user_request}"
-Current invitation content prepared by the scheduler: "{invitation_content}"
+# Static so it forms a cacheable prefix with the bound tool schema; the request
+# and the drafted invitation are appended after the history instead.
+COMMUNICATION_SYSTEM_PROMPT = SystemMessage(content="""You are the Communication Agent. Your role is to handle all outgoing messages and invitations for the event.
 
 You have 3 tools at your disposal:
 1.  **invite_people**: To generate or refine the text and details of an invitation. This should be your first step.
@@ -28,25 +23,66 @@ Your workflow is as follows:
 2.  Once you have the final invitation text, decide on the best channel. Use `whatsapp_message` for casual events and `email_message` for formal ones. For events like weddings, you might use both.
 3.  Execute the sending tool(s) with the generated message.
 
-After sending, summarize the communication actions taken. If messages have already been sent, simply state that communication is complete.""")
+After sending, summarize the communication actions taken. If messages have already been sent, simply state that communication is complete.
+
+The original user request and the current invitation content are given in the last message.""")
+
+def build_communication_messages(state: AgentState, config: RunnableConfig):
+    """
+    Build the prompt for the next communication model call: the static system
+    prompt, the history, and the request and invitation content last.
+    Returns None when invitations have already been sent.
+    """
+    messages = state["messages"]
+    event_planning_data = get_planning_data(config)
+    user_request = event_planning_data.get("user_request", "")
+    invitation_content = event_planning_data.get("invitation_info", "No invitation has been drafted yet.")
     
     # Check if communication tasks have already been completed in a previous step.
     if event_planning_data.get("whatsapp_status") or event_planning_data.get("email_status"):
-        summary = "📱 COMMUNICATION COMPLETED: Invitations have already been sent."
-        return {
-            "messages": [AIMessage(content=summary)],
-            "current_agent": "communication",
-            "next_action": "end"
-        }
+        return None
     
-    all_messages = [system_prompt] + list(messages)
-    
-    # Invoke the model to get the response, which may include tool calls.
-    response = communication_model.invoke(all_messages)
+    event_context = HumanMessage(content=(
+        f'Original user request: "{user_request}"\n'
+        f'Current invitation content prepared by the scheduler: "{invitation_content}"'
+    ))
+    return [COMMUNICATION_SYSTEM_PROMPT] + list(messages) + [event_context]
 
+def communication_complete_result() -> AgentState:
+    """State update used when invitations have already been sent."""
+    summary = "📱 COMMUNICATION COMPLETED: Invitations have already been sent."
+    return {
+        "messages": [AIMessage(content=summary)],
+        "current_agent": "communication",
+        "next_action": "end"
+    }
+
+def communication_result(response) -> AgentState:
+    """State update for a communication model response."""
     return {
         "messages": [response],
         "current_agent": "communication", 
         # If the model's response includes tool calls, the next action is 'tools', otherwise the process ends.
         "next_action": "tools" if response.tool_calls else "end"
     }
+
+def communication_agent(state: AgentState, communication_model, config: RunnableConfig) -> AgentState:
+    """
+    Enhanced communication agent that intelligently drafts and sends invitations. Uses the 'invite_people' tool for drafting invitations and the 'whatsapp_message' tool for sending informal invitations via WhatsApp. For formal events, it uses the 'email_message' tool.
+    """
+    all_messages = build_communication_messages(state, config)
+    if all_messages is None:
+        return communication_complete_result()
+    
+    # Invoke the model to get the response, which may include tool calls.
+    response = communication_model.invoke(all_messages, config)
+    return communication_result(response)
+
+async def acommunication_agent(state: AgentState, communication_model, config: RunnableConfig) -> AgentState:
+    """Async-native communication agent: same logic as communication_agent, using ainvoke."""
+    all_messages = build_communication_messages(state, config)
+    if all_messages is None:
+        return communication_complete_result()
+    
+    response = await communication_model.ainvoke(all_messages, config)
+    return communication_result(response)
@@ -0,0 +1,280 @@
+# metrics.py
+
+import time
+import asyncio
+import threading
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import ToolMessage
+
+# ============================================================================
+# METRICS REGISTRY
+# ============================================================================
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+METRIC_PREFIX = "event_planner"
+
+class MetricsRegistry:
+    """
+    Thread-safe per-node and per-tool metrics.
+
+    Every series is keyed by (kind, name), kind being "node" or "tool", and holds
+    call and error counts, wall-clock and queue-wait totals, a wall-clock
+    histogram, prompt/completion tokens of the model calls made inside it, and
+    for memoized tools the result cache hits and misses.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._series = {}
+
+    def _get(self, kind: str, name: str) -> dict:
+        series = self._series.get((kind, name))
+        if series is None:
+            series = self._series[(kind, name)] = {
+                "count": 0, "errors": 0, "wall_s": 0.0, "max_wall_s": 0.0, "queue_wait_s": 0.0,
+                "prompt_tokens": 0, "completion_tokens": 0, "cache_hits": 0, "cache_misses": 0,
+                "buckets": [0] * len(self.buckets),
+            }
+        return series
+
+    def observe(self, kind: str, name: str, wall_s: float, queue_wait_s: float = 0.0) -> None:
+        """Record one finished execution."""
+        with self._lock:
+            series = self._get(kind, name)
+            series["count"] += 1
+            series["wall_s"] += wall_s
+            series["max_wall_s"] = max(series["max_wall_s"], wall_s)
+            series["queue_wait_s"] += queue_wait_s
+            for i, bound in enumerate(self.buckets):
+                if wall_s <= bound:
+                    series["buckets"][i] += 1
+
+    def add_error(self, kind: str, name: str) -> None:
+        with self._lock:
+            self._get(kind, name)["errors"] += 1
+
+    def add_tokens(self, kind: str, name: str, prompt_tokens: int, completion_tokens: int) -> None:
+        with self._lock:
+            series = self._get(kind, name)
+            series["prompt_tokens"] += prompt_tokens
+            series["completion_tokens"] += completion_tokens
+
+    def add_cache_lookup(self, kind: str, name: str, hit: bool) -> None:
+        with self._lock:
+            self._get(kind, name)["cache_hits" if hit else "cache_misses"] += 1
+
+    def summary(self) -> dict:
+        """JSON-friendly summary: {"nodes": {name: {...}}, "tools": {name: {...}}}."""
+        result = {"nodes": {}, "tools": {}}
+        with self._lock:
+            for (kind, name), series in sorted(self._series.items()):
+                count = series["count"]
+                result[f"{kind}s"][name] = {
+                    "count": count,
+                    "errors": series["errors"],
+                    "wall_ms_total": round(series["wall_s"] * 1000, 3),
+                    "wall_ms_mean": round(series["wall_s"] / count * 1000, 3) if count else 0.0,
+                    "wall_ms_max": round(series["max_wall_s"] * 1000, 3),
+                    "queue_wait_ms_mean": round(series["queue_wait_s"] / count * 1000, 3) if count else 0.0,
+                }
+                if kind == "node":
+                    result["nodes"][name]["prompt_tokens"] = series["prompt_tokens"]
+                    result["nodes"][name]["completion_tokens"] = series["completion_tokens"]
+                lookups = series["cache_hits"] + series["cache_misses"]
+                if lookups:
+                    result[f"{kind}s"][name]["cache_hits"] = series["cache_hits"]
+                    result[f"{kind}s"][name]["cache_hit_rate"] = round(series["cache_hits"] / lookups, 4)
+        return result
+
+    def prometheus_text(self) -> str:
+        """Render all series in the Prometheus text exposition format (0.0.4)."""
+        p = METRIC_PREFIX
+        lines = [
+            f"# HELP {p}_duration_seconds Wall-clock time of graph nodes and tools.",
+            f"# TYPE {p}_duration_seconds histogram",
+        ]
+        with self._lock:
+            series_items = sorted(self._series.items())
+            for (kind, name), series in series_items:
+                labels = f'kind="{kind}",name="{name}"'
+                for bound, count in zip(self.buckets, series["buckets"]):
+                    lines.append(f'{p}_duration_seconds_bucket{{{labels},le="{bound}"}} {count}')
+                lines.append(f'{p}_duration_seconds_bucket{{{labels},le="+Inf"}} {series["count"]}')
+                lines.append(f"{p}_duration_seconds_sum{{{labels}}} {series['wall_s']:.6f}")
+                lines.append(f"{p}_duration_seconds_count{{{labels}}} {series['count']}")
+
+            lines += [f"# HELP {p}_queue_wait_seconds_total Time spent waiting before starting (nodes: since the previous step, tools: for a parallelism slot).",
+                      f"# TYPE {p}_queue_wait_seconds_total counter"]
+            lines += [f'{p}_queue_wait_seconds_total{{kind="{kind}",name="{name}"}} {series["queue_wait_s"]:.6f}'
+                      for (kind, name), series in series_items]
+
+            lines += [f"# HELP {p}_errors_total Failed node executions and error tool results.",
+                      f"# TYPE {p}_errors_total counter"]
+            lines += [f'{p}_errors_total{{kind="{kind}",name="{name}"}} {series["errors"]}'
+                      for (kind, name), series in series_items]
+
+            lines += [f"# HELP {p}_tokens_total Model tokens used inside a node.",
+                      f"# TYPE {p}_tokens_total counter"]
+            for (kind, name), series in series_items:
+                if kind == "node":
+                    lines.append(f'{p}_tokens_total{{name="{name}",type="prompt"}} {series["prompt_tokens"]}')
+                    lines.append(f'{p}_tokens_total{{name="{name}",type="completion"}} {series["completion_tokens"]}')
+
+            lines += [f"# HELP {p}_tool_cache_lookups_total Memoized tool result lookups.",
+                      f"# TYPE {p}_tool_cache_lookups_total counter"]
+            for (kind, name), series in series_items:
+                if series["cache_hits"] + series["cache_misses"]:
+                    lines.append(f'{p}_tool_cache_lookups_total{{name="{name}",result="hit"}} {series["cache_hits"]}')
+                    lines.append(f'{p}_tool_cache_lookups_total{{name="{name}",result="miss"}} {series["cache_misses"]}')
+        return "\n".join(lines) + "\n"
+
+# ============================================================================
+# GRAPH INSTRUMENTATION
+# ============================================================================
+
+_MISSING = object()
+
+class MetricsCallbackHandler(BaseCallbackHandler):
+    """
+    Callback handler that feeds a MetricsRegistry from graph execution.
+
+    Pass it in the session config (make_session_config(callbacks=[...])).
+    Node queue wait is the time since the previous node of the same thread
+    finished (checkpointing and scheduling); tool queue wait is the time from
+    the tool node's start to the tool's start (waiting for a parallelism slot).
+    Tool errors are counted from the error ToolMessages a tool node returns, so
+    timeouts and exceptions handled by the node are included.
+    """
+
+    run_inline = True  # Record on the event loop thread instead of the executor
+
+    def __init__(self, registry: MetricsRegistry):
+        self.registry = registry
+        self._lock = threading.Lock()
+        self._runs = {}      # run_id -> (kind, name, started_at, queue_wait_s)
+        self._models = {}    # model run_id -> node name
+        self._last_end = {}  # thread_id -> time the previous node finished
+        self._roots = {}     # graph run_id -> thread_id
+        self._node_threads = {}  # node run_id -> thread_id
+
+    def _start(self, run_id, kind: str, name: str, queue_wait_s: float = 0.0):
+        with self._lock:
+            self._runs[run_id] = (kind, name, time.perf_counter(), queue_wait_s)
+
+    def _finish(self, run_id, error: bool = False):
+        with self._lock:
+            run = self._runs.pop(run_id, None)
+        if run is None:
+            return None
+        kind, name, started_at, queue_wait_s = run
+        self.registry.observe(kind, name, time.perf_counter() - started_at, queue_wait_s)
+        if error:
+            self.registry.add_error(kind, name)
+        return run
+
+    def on_chain_start(self, serialized, inputs, *, run_id, parent_run_id=None, tags=None, metadata=None, **kwargs):
+        metadata = metadata or {}
+        thread_id = metadata.get("thread_id")
+        now = time.perf_counter()
+        if parent_run_id is None:
+            # A new graph invocation; time spent paused for human review is not queue wait.
+            with self._lock:
+                self._roots[run_id] = thread_id
+            self._last_end[thread_id] = now
+        elif metadata.get("langgraph_node") and metadata["langgraph_node"] == kwargs.get("name"):
+            with self._lock:
+                self._node_threads[run_id] = thread_id
+            self._start(run_id, "node", kwargs["name"], now - self._last_end.get(thread_id, now))
+
+    def _end_chain(self, outputs, run_id, error: bool):
+        with self._lock:
+            root_thread = self._roots.pop(run_id, _MISSING)
+            thread_id = self._node_threads.pop(run_id, _MISSING)
+        if root_thread is not _MISSING:
+            self._last_end.pop(root_thread, None)
+            return
+        if self._finish(run_id, error) is None:
+            return
+        messages = outputs.get("messages", []) if isinstance(outputs, dict) else []
+        for message in messages if isinstance(messages, list) else []:
+            if isinstance(message, ToolMessage) and message.status == "error":
+                self.registry.add_error("tool", message.name)
+        if thread_id is not _MISSING:
+            self._last_end[thread_id] = time.perf_counter()
+
+    def on_chain_end(self, outputs, *, run_id, **kwargs):
+        self._end_chain(outputs, run_id, error=False)
+
+    def on_chain_error(self, error, *, run_id, **kwargs):
+        self._end_chain(None, run_id, error=True)
+
+    def on_tool_start(self, serialized, input_str, *, run_id, parent_run_id=None, **kwargs):
+        name = (serialized or {}).get("name") or kwargs.get("name") or "tool"
+        with self._lock:
+            parent = self._runs.get(parent_run_id)
+        queue_wait_s = time.perf_counter() - parent[2] if parent else 0.0
+        self._start(run_id, "tool", name, queue_wait_s)
+
+    def on_tool_end(self, output, *, run_id, **kwargs):
+        run = self._finish(run_id)
+        # Memoized tools (tool_cache.py) report the lookup in the ToolMessage artifact
+        artifact = getattr(output, "artifact", None)
+        lookup = artifact.get("cache") if isinstance(artifact, dict) else None
+        if run is not None and lookup and lookup.get("enabled", True):
+            self.registry.add_cache_lookup("tool", run[1], lookup["hit"])
+
+    def on_tool_error(self, error, *, run_id, **kwargs):
+        # Counted as an error from the node's error ToolMessage; only record the time here.
+        self._finish(run_id)
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, parent_run_id=None, metadata=None, **kwargs):
+        node = (metadata or {}).get("langgraph_node")
+        if node:
+            with self._lock:
+                self._models[run_id] = node
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        with self._lock:
+            node = self._models.pop(run_id, None)
+        if node is None:
+            return
+        usage = {}
+        for generations in response.generations:
+            for generation in generations:
+                usage = getattr(getattr(generation, "message", None), "usage_metadata", None) or usage
+        self.registry.add_tokens("node", node, usage.get("input_tokens", 0), usage.get("output_tokens", 0))
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        with self._lock:
+            self._models.pop(run_id, None)
+
+# ============================================================================
+# PROMETHEUS ENDPOINT
+# ============================================================================
+
+async def serve_prometheus(registry: MetricsRegistry, host: str, port: int):
+    """Serve `GET /metrics` over plain HTTP until cancelled."""
+
+    async def handle(reader, writer):
+        try:
+            request_line = await reader.readline()
+            while (await reader.readline()).strip():
+                pass  # Skip headers
+            parts = request_line.decode("latin-1").split()
+            if len(parts) >= 2 and parts[0] == "GET" and parts[1].split("?")[0] == "/metrics":
+                status, body = "200 OK", registry.prometheus_text().encode()
+            else:
+                status, body = "404 Not Found", b"Not found\n"
+            writer.write(f"HTTP/1.1 {status}\r\nContent-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+                         f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body)
+            await writer.drain()
+        except (ConnectionResetError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, host, port)
+    print(f"📈 Prometheus metrics on http://{host}:{port}/metrics")
+    async with server:
+        await server.serve_forever()
@@ -0,0 +1,166 @@
+# model_router.py
+
+import time
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import Runnable
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+DEFAULT_HEDGE_QUANTILE = 0.95      # Hedge once the primary is slower than this share of its recent calls
+DEFAULT_INITIAL_HEDGE_DELAY = 2.0  # Seconds, until enough primary latencies have been observed
+DEFAULT_MIN_SAMPLES = 20
+DEFAULT_WINDOW = 200               # Recent primary latencies kept for the quantile
+
+# ============================================================================
+# HEDGED MODEL ROUTER
+# ============================================================================
+
+def is_valid_response(response) -> bool:
+    """A usable model turn: an AI message with tool calls or text and no malformed tool calls."""
+    return (isinstance(response, AIMessage)
+            and not getattr(response, "invalid_tool_calls", None)
+            and bool(response.tool_calls or response.content))
+
+class HedgedChatModel(Runnable):
+    """
+    Sends a call to `primary` and, if it has not answered within the hedge delay,
+    a second copy to `secondary` (e.g. Gemini and Ollama bound to the same tools).
+    The first valid response wins and the other call is cancelled.
+
+    The hedge delay is the `quantile` of the primary's recent latencies, so only
+    about 1 - quantile of calls are duplicated. Calls cut short by a hedge count
+    as at least as slow as their elapsed time. Until `min_samples` latencies
+    are known, `initial_delay` is used.
+
+    Only the primary call reports to the caller's callbacks (token streaming,
+    metrics); the hedge runs silently and its response is returned whole.
+    """
+
+    def __init__(self, primary, secondary, quantile: float = DEFAULT_HEDGE_QUANTILE,
+                 initial_delay: float = DEFAULT_INITIAL_HEDGE_DELAY, min_samples: int = DEFAULT_MIN_SAMPLES,
+                 window: int = DEFAULT_WINDOW):
+        self.primary = primary
+        self.secondary = secondary
+        self.quantile = quantile
+        self.initial_delay = initial_delay
+        self.min_samples = min_samples
+        self.latencies = deque(maxlen=window)
+        self.counters = {"calls": 0, "hedged": 0, "secondary_wins": 0, "primary_errors": 0, "secondary_errors": 0}
+        self._executor = None
+
+    def hedge_delay(self) -> float:
+        if len(self.latencies) < self.min_samples:
+            return self.initial_delay
+        ordered = sorted(self.latencies)
+        return ordered[int(self.quantile * (len(ordered) - 1))]
+
+    def stats(self) -> dict:
+        calls = self.counters["calls"]
+        return {**self.counters,
+                "hedge_rate": self.counters["hedged"] / calls if calls else 0.0,
+                "hedge_delay_s": round(self.hedge_delay(), 4)}
+
+    @staticmethod
+    def _silent(config):
+        return {**(config or {}), "callbacks": []}
+
+    def _accept(self, is_primary: bool, error, response) -> bool:
+        """Count the outcome of a finished call; True if its response should be returned."""
+        if error is None and is_valid_response(response):
+            if not is_primary:
+                self.counters["secondary_wins"] += 1
+            return True
+        self.counters["primary_errors" if is_primary else "secondary_errors"] += 1
+        return False
+
+    async def ainvoke(self, input, config=None, **kwargs):
+        self.counters["calls"] += 1
+        start = time.perf_counter()
+        primary = asyncio.ensure_future(self.primary.ainvoke(input, config, **kwargs))
+        secondary = None
+        pending = {primary}
+
+        def hedge():
+            nonlocal secondary
+            self.counters["hedged"] += 1
+            secondary = asyncio.ensure_future(self.secondary.ainvoke(input, self._silent(config), **kwargs))
+            pending.add(secondary)
+
+        try:
+            done, _ = await asyncio.wait(pending, timeout=self.hedge_delay())
+            if not done:
+                hedge()
+            errors = []
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    pending.discard(task)
+                    is_primary = task is primary
+                    if is_primary:
+                        self.latencies.append(time.perf_counter() - start)
+                    error = task.exception()
+                    if self._accept(is_primary, error, None if error else task.result()):
+                        return task.result()
+                    errors.append(error)
+                    if is_primary and secondary is None:
+                        hedge()  # Failed or unusable primary answer: fall back right away
+            error = next((e for e in errors if e is not None), None)
+            if error is not None:
+                raise error
+            return primary.result()
+        finally:
+            if primary in pending:
+                self.latencies.append(time.perf_counter() - start)
+            for task in pending:
+                task.cancel()
+
+    def invoke(self, input, config=None, **kwargs):
+        """
+        Blocking variant on a small thread pool. A losing call cannot be cancelled
+        mid-request; its result is discarded when it finishes.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="hedge")
+        self.counters["calls"] += 1
+        start = time.perf_counter()
+        primary = self._executor.submit(self.primary.invoke, input, config, **kwargs)
+        secondary = None
+        pending = {primary}
+
+        def hedge():
+            nonlocal secondary
+            self.counters["hedged"] += 1
+            secondary = self._executor.submit(self.secondary.invoke, input, self._silent(config), **kwargs)
+            pending.add(secondary)
+
+        try:
+            done, _ = wait(pending, timeout=self.hedge_delay())
+            if not done:
+                hedge()
+            errors = []
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.discard(future)
+                    is_primary = future is primary
+                    if is_primary:
+                        self.latencies.append(time.perf_counter() - start)
+                    error = future.exception()
+                    if self._accept(is_primary, error, None if error else future.result()):
+                        return future.result()
+                    errors.append(error)
+                    if is_primary and secondary is None:
+                        hedge()
+            error = next((e for e in errors if e is not None), None)
+            if error is not None:
+                raise error
+            return primary.result()
+        finally:
+            if primary in pending:
+                self.latencies.append(time.perf_counter() - start)
+            for future in pending:
+                future.cancel()
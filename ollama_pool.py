@@ -0,0 +1,75 @@
+# ollama_pool.py
+
+import time
+import asyncio
+import httpx
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+DEFAULT_MAX_CONNECTIONS = 10
+DEFAULT_KEEPALIVE_EXPIRY = 300.0   # Seconds an idle connection stays open (httpx default: 5)
+DEFAULT_MODEL_KEEP_ALIVE = "30m"   # How long Ollama keeps the model loaded after a request
+DEFAULT_WARMUP_CONNECTIONS = 4
+WARMUP_PROMPT = "Hi"
+
+# ============================================================================
+# POOLED OLLAMA CONNECTIONS
+# ============================================================================
+
+class OllamaConnectionPool:
+    """
+    Keep-alive HTTP connections to one Ollama server, shared by every ChatOllama
+    built with `client_kwargs()`.
+
+    ChatOllama creates its own sync and async httpx clients; handing them the
+    same transports makes them draw from one connection pool, and the long
+    keep-alive expiry keeps connections open across the pause for human review.
+    The async transport belongs to the event loop that first uses it.
+    """
+
+    def __init__(self, base_url: str, max_connections: int = DEFAULT_MAX_CONNECTIONS,
+                 keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY):
+        self.base_url = base_url.rstrip("/")
+        self.limits = httpx.Limits(max_connections=max_connections,
+                                   max_keepalive_connections=max_connections,
+                                   keepalive_expiry=keepalive_expiry)
+        self.sync_transport = httpx.HTTPTransport(limits=self.limits)
+        self.async_transport = httpx.AsyncHTTPTransport(limits=self.limits)
+
+    def client_kwargs(self) -> dict:
+        """Keyword arguments for ChatOllama that route it through this pool."""
+        return {
+            "sync_client_kwargs": {"transport": self.sync_transport},
+            "async_client_kwargs": {"transport": self.async_transport},
+        }
+
+    async def warm_up(self, model: str, keep_alive: str = DEFAULT_MODEL_KEEP_ALIVE,
+                      connections: int = DEFAULT_WARMUP_CONNECTIONS) -> dict:
+        """
+        Pre-open `connections` pooled connections, then load `model` with a
+        one-token generation so the first user request finds it resident.
+        Returns the time taken by each step in seconds.
+        """
+        # Not closed: closing the client would close the shared transport.
+        client = httpx.AsyncClient(base_url=self.base_url, transport=self.async_transport, timeout=None)
+        start = time.perf_counter()
+        # Concurrent requests force separate connections; all go back to the pool.
+        await asyncio.gather(*(client.get("/api/version") for _ in range(connections)))
+        connect_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        response = await client.post("/api/generate", json={
+            "model": model,
+            "prompt": WARMUP_PROMPT,
+            "stream": False,
+            "keep_alive": keep_alive,
+            "options": {"num_predict": 1},
+        })
+        response.raise_for_status()
+        load_s = time.perf_counter() - start
+        return {"connect_s": connect_s, "model_load_s": load_s}
+
+    async def aclose(self):
+        await self.async_transport.aclose()
+        self.sync_transport.close()
@@ -3,46 +3,79 @@
 from langchain_core.messages import HumanMessage, SystemMessage, AIMessage
 from typing import TypedDict, Annotated, Sequence
 from langchain_core.messages import BaseMessage
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph.message import add_messages
-from data import event_planning_data
+from data import get_planning_data
+from intent_router import classify_intent, parse_model_route, DEFAULT_CONFIDENCE_THRESHOLD
 
 class AgentState(TypedDict):
     messages: Annotated[Sequence[BaseMessage], add_messages]
     current_agent: str 
     next_action: str
 
-def orchestrator_agent(state: AgentState) -> AgentState:
-    """Main orchestrator agent that routes requests to appropriate agents."""
-    messages = state["messages"]
-    
-    user_message = next((msg.content for msg in reversed(messages) if isinstance(msg, HumanMessage)), None)
-    if user_message:
-        event_planning_data["user_request"] = user_message
-    
-    system_prompt = SystemMessage(content="""You are the Orchestrator Agent. Your job is to analyze user requests and route them to the correct specialist agent (scheduler or communication).
+# Used only when the local intent router is not confident enough (see intent_router.py)
+ROUTING_SYSTEM_PROMPT = SystemMessage(content="""You are the Orchestrator Agent. Your job is to analyze user requests and route them to the correct specialist agent (scheduler or communication).
 
 - Route to SCHEDULER for: event planning, organizing, coordinating.
 - Route to COMMUNICATION for: sending messages or invitations when details are known.
 
-Provide a brief analysis and specify the next agent.""")
-    
-    if user_message and any(keyword in user_message.lower() for keyword in ["plan", "organize", "schedule", "birthday", "party", "meeting"]):
-        next_agent = "scheduler"
+Answer with the name of the next agent only: scheduler or communication.""")
+
+def _latest_request(state: AgentState, config: RunnableConfig):
+    user_message = next((msg.content for msg in reversed(state["messages"]) if isinstance(msg, HumanMessage)), None)
+    if user_message:
+        get_planning_data(config)["user_request"] = user_message
+    return user_message
+
+def _needs_model(intent: dict, user_message, routing_model, confidence_threshold: float) -> bool:
+    return routing_model is not None and bool(user_message) and intent["confidence"] < confidence_threshold
+
+def _model_intent(intent: dict, response) -> dict:
+    return {"route": parse_model_route(response.content, intent["route"]),
+            "confidence": intent["confidence"], "source": "llm"}
+
+def _routing_update(user_message, intent: dict) -> AgentState:
+    next_agent = intent["route"]
+    if next_agent == "scheduler":
         response_content = f"""🎯 ORCHESTRATOR ANALYSIS:
 
 Request: "{user_message}"
 
 This is an EVENT PLANNING request. Routing to Scheduler Agent."""
     else:
-        next_agent = "communication"
         response_content = f"""🎯 ORCHESTRATOR ANALYSIS:
 
 Request: "{user_message}"
 
 This is a COMMUNICATION request. Routing to Communication Agent."""
+    response_content += f"\n(Routed by {intent['source']}, confidence {intent['confidence']:.0%})"
     
     return {
-        "messages": [AIMessage(content=response_content)],
+        "messages": [AIMessage(content=response_content, name="orchestrator")],
         "current_agent": next_agent,
         "next_action": next_agent
     }
+
+def orchestrator_agent(state: AgentState, config: RunnableConfig, routing_model=None,
+                       confidence_threshold: float = DEFAULT_CONFIDENCE_THRESHOLD) -> AgentState:
+    """
+    Main orchestrator agent that routes requests to appropriate agents.
+    The local intent router decides; `routing_model` (if given) is asked only when
+    the router's confidence is below `confidence_threshold`.
+    """
+    user_message = _latest_request(state, config)
+    intent = classify_intent(user_message or "")
+    if _needs_model(intent, user_message, routing_model, confidence_threshold):
+        response = routing_model.invoke([ROUTING_SYSTEM_PROMPT, HumanMessage(content=user_message)], config)
+        intent = _model_intent(intent, response)
+    return _routing_update(user_message, intent)
+
+async def aorchestrator_agent(state: AgentState, config: RunnableConfig, routing_model=None,
+                              confidence_threshold: float = DEFAULT_CONFIDENCE_THRESHOLD) -> AgentState:
+    """Async-native orchestrator agent. Routing runs inline on the event loop; only a low-confidence fallback awaits the model."""
+    user_message = _latest_request(state, config)
+    intent = classify_intent(user_message or "")
+    if _needs_model(intent, user_message, routing_model, confidence_threshold):
+        response = await routing_model.ainvoke([ROUTING_SYSTEM_PROMPT, HumanMessage(content=user_message)], config)
+        intent = _model_intent(intent, response)
+    return _routing_update(user_message, intent)
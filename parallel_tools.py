@@ -0,0 +1,114 @@
+# parallel_tools.py
+
+import time
+import asyncio
+from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.runnables import RunnableConfig
+from orchestrator import AgentState
+from tool_prefetch import get_prefetcher
+
+# ============================================================================
+# PARALLEL TOOL NODE
+# ============================================================================
+
+DEFAULT_MAX_PARALLELISM = 5
+DEFAULT_TOOL_TIMEOUT = 30.0  # seconds
+
+def create_parallel_tool_node(tools, max_parallelism: int = DEFAULT_MAX_PARALLELISM,
+                              timeouts: dict = None, default_timeout: float = DEFAULT_TOOL_TIMEOUT,
+                              prefetch: bool = False):
+    """
+    Create a graph node that runs all tool calls of the last AI message concurrently.
+
+    Results are returned in the order the model issued the calls. Each tool writes
+    to a copy of the session's planning_data that is merged back only when it
+    finishes in time, so a timed-out tool still running in its executor thread
+    can't change the plan afterwards. Each ToolMessage
+    carries timing metadata in response_metadata["timing"]:
+        queue_wait_s: time spent waiting for a free parallelism slot
+        duration_s:   wall-clock time of the tool itself
+    and the node adds a "batch" entry with the wall-clock time of the whole batch
+    versus the serial sum, so the parallel win is visible per turn.
+
+    Args:
+        tools: The tools the node can execute.
+        max_parallelism: Maximum number of tool calls running at the same time.
+        timeouts: Optional per-tool timeouts in seconds, keyed by tool name.
+        default_timeout: Timeout for tools not listed in `timeouts`.
+        prefetch: Serve matching calls from the session's speculative tool runs
+            (tool_prefetch.ToolPrefetcher) when there are any.
+    """
+    tools_by_name = {t.name: t for t in tools}
+    timeouts = timeouts or {}
+
+    def scratch_config(config: RunnableConfig):
+        """Config whose planning_data is a copy of the session's, plus that copy's starting point."""
+        planning_data = config.get("configurable", {}).get("planning_data")
+        if planning_data is None:
+            return config, None, None
+        snapshot = dict(planning_data)
+        scratch = dict(snapshot)
+        return {**config, "configurable": {**config["configurable"], "planning_data": scratch}}, snapshot, scratch
+
+    async def run_tool_call(tool_call: dict, slots: asyncio.Semaphore, config: RunnableConfig, prefetcher=None) -> ToolMessage:
+        if prefetcher is not None:
+            message = await prefetcher.serve(tool_call, config)
+            if message is not None:
+                return message
+        name = tool_call["name"]
+        queued_at = time.perf_counter()
+        async with slots:
+            started_at = time.perf_counter()
+            timeout = timeouts.get(name, default_timeout)
+            tool = tools_by_name.get(name)
+            tool_config, snapshot, scratch = scratch_config(config)
+            try:
+                if tool is None:
+                    raise ValueError(f"{name} is not a valid tool, try one of [{', '.join(tools_by_name)}].")
+                # Passing the full tool call makes the tool return a ToolMessage with the right id.
+                message = await asyncio.wait_for(tool.ainvoke({**tool_call, "type": "tool_call"}, tool_config), timeout)
+                if scratch is not None:
+                    config["configurable"]["planning_data"].update(
+                        {key: value for key, value in scratch.items() if snapshot.get(key) != value})
+            except asyncio.TimeoutError:
+                message = ToolMessage(content=f"Error: {name} timed out after {timeout:.1f}s.", name=name,
+                                      tool_call_id=tool_call["id"], status="error")
+            except Exception as e:
+                message = ToolMessage(content=f"Error: {e!r}\n Please fix your mistakes.", name=name,
+                                      tool_call_id=tool_call["id"], status="error")
+            finished_at = time.perf_counter()
+
+        message.response_metadata["timing"] = {
+            "queue_wait_s": round(started_at - queued_at, 6),
+            "duration_s": round(finished_at - started_at, 6),
+        }
+        return message
+
+    async def parallel_tool_node(state: AgentState, config: RunnableConfig) -> AgentState:
+        """Execute the tool calls of the last AI message with bounded parallelism."""
+        last_message = state["messages"][-1]
+        tool_calls = last_message.tool_calls if isinstance(last_message, AIMessage) else []
+        if not tool_calls:
+            return {"messages": []}
+
+        prefetcher = get_prefetcher(config) if prefetch else None
+        if prefetcher is not None and not prefetcher.open:
+            prefetcher = None
+
+        slots = asyncio.Semaphore(max_parallelism)
+        batch_start = time.perf_counter()
+        messages = await asyncio.gather(*(run_tool_call(call, slots, config, prefetcher) for call in tool_calls))
+        batch_wall = time.perf_counter() - batch_start
+        if prefetcher is not None:
+            prefetcher.close()  # Later batches answer re-planning rounds; never serve them stale guesses
+
+        serial_sum = sum(m.response_metadata["timing"]["duration_s"] for m in messages)
+        for message in messages:
+            message.response_metadata["timing"]["batch"] = {
+                "tool_calls": len(messages),
+                "wall_s": round(batch_wall, 6),
+                "serial_sum_s": round(serial_sum, 6),
+            }
+        return {"messages": list(messages)}
+
+    return parallel_tool_node
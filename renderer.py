@@ -0,0 +1,158 @@
+# renderer.py
+
+import sys
+from bisect import bisect_right
+from functools import lru_cache
+
+# ============================================================================
+# DISPLAY WIDTH
+# ============================================================================
+
+# Non-overlapping (first, last, width) code point ranges, sorted by first code point.
+# Everything not listed is one column wide. Covers combining marks and variation
+# selectors (zero width), East Asian Wide/Fullwidth blocks and the emoji blocks.
+_WIDTH_RANGES = (
+    (0x0300, 0x036F, 0),    # Combining diacritical marks
+    (0x1100, 0x115F, 2),    # Hangul Jamo initials
+    (0x200B, 0x200F, 0),    # Zero-width space/joiners, direction marks
+    (0x20D0, 0x20FF, 0),    # Combining marks for symbols
+    (0x231A, 0x231B, 2),    # Watch, hourglass
+    (0x2329, 0x232A, 2),    # Angle brackets
+    (0x23E9, 0x23EC, 2),    # Media controls
+    (0x23F0, 0x23F0, 2),    # Alarm clock
+    (0x23F3, 0x23F3, 2),    # Hourglass with flowing sand
+    (0x2600, 0x27BF, 2),    # Miscellaneous symbols, dingbats
+    (0x2B1B, 0x2B1C, 2),    # Large squares
+    (0x2B50, 0x2B50, 2),    # Star
+    (0x2B55, 0x2B55, 2),    # Circle
+    (0x2E80, 0x303E, 2),    # CJK radicals, Kangxi, CJK symbols and punctuation
+    (0x3041, 0x33FF, 2),    # Hiragana, Katakana, Bopomofo, Hangul compatibility, CJK compatibility
+    (0x3400, 0x4DBF, 2),    # CJK unified ideographs extension A
+    (0x4E00, 0x9FFF, 2),    # CJK unified ideographs
+    (0xA000, 0xA4CF, 2),    # Yi
+    (0xA960, 0xA97F, 2),    # Hangul Jamo extended A
+    (0xAC00, 0xD7A3, 2),    # Hangul syllables
+    (0xF900, 0xFAFF, 2),    # CJK compatibility ideographs
+    (0xFE00, 0xFE0F, 0),    # Variation selectors
+    (0xFE10, 0xFE19, 2),    # Vertical forms
+    (0xFE20, 0xFE2F, 0),    # Combining half marks
+    (0xFE30, 0xFE6F, 2),    # CJK compatibility forms, small form variants
+    (0xFF00, 0xFF60, 2),    # Fullwidth forms
+    (0xFFE0, 0xFFE6, 2),    # Fullwidth signs
+    (0x1F004, 0x1F004, 2),  # Mahjong tile
+    (0x1F0CF, 0x1F0CF, 2),  # Playing card
+    (0x1F18E, 0x1F18E, 2),  # AB button
+    (0x1F191, 0x1F19A, 2),  # Squared words
+    (0x1F200, 0x1F2FF, 2),  # Enclosed ideographic supplement
+    (0x1F300, 0x1F64F, 2),  # Misc symbols and pictographs, emoticons
+    (0x1F680, 0x1F6FF, 2),  # Transport and map symbols
+    (0x1F7E0, 0x1F7EB, 2),  # Colored circles and squares
+    (0x1F900, 0x1F9FF, 2),  # Supplemental symbols and pictographs
+    (0x1FA70, 0x1FAFF, 2),  # Symbols and pictographs extended A
+    (0x20000, 0x2FFFD, 2),  # CJK extensions B-F
+    (0x30000, 0x3FFFD, 2),  # CJK extension G
+    (0xE0100, 0xE01EF, 0),  # Variation selectors supplement
+)
+_RANGE_STARTS = [first for first, _, _ in _WIDTH_RANGES]
+
+@lru_cache(maxsize=4096)
+def char_width(char: str) -> int:
+    """Terminal columns taken by one character."""
+    code = ord(char)
+    if code < 0x300:
+        return 1
+    i = bisect_right(_RANGE_STARTS, code) - 1
+    if i >= 0 and code <= _WIDTH_RANGES[i][1]:
+        return _WIDTH_RANGES[i][2]
+    return 1
+
+def display_width(text: str) -> int:
+    """Terminal columns taken by a string (ASCII fast path, table lookup otherwise)."""
+    if text.isascii():
+        return len(text)
+    return sum(map(char_width, text))
+
+# ============================================================================
+# WRAPPING
+# ============================================================================
+
+def wrap_line(line: str, width: int):
+    """
+    Greedy word wrap of one line to `width` columns in a single pass.
+    Words wider than a whole line are broken between characters.
+    Returns (text, columns) pairs so callers can pad without measuring again.
+    """
+    if line.isascii() and len(line) <= width:
+        return [(line, len(line))]
+    words = line.split(" ")
+    widths = [display_width(word) for word in words]
+    line_width = sum(widths) + len(words) - 1
+    if line_width <= width:
+        return [(line, line_width)]
+
+    rows = []
+    current, current_width = [], 0
+    for word, word_width in zip(words, widths):
+        if word_width > width:
+            # Break the long word; its remainder starts the next line.
+            if current:
+                rows.append((" ".join(current), current_width))
+            piece, piece_width = [], 0
+            for char in word:
+                w = char_width(char)
+                if piece_width + w > width:
+                    rows.append(("".join(piece), piece_width))
+                    piece, piece_width = [], 0
+                piece.append(char)
+                piece_width += w
+            current, current_width = ["".join(piece)], piece_width
+            continue
+
+        if current and current_width + 1 + word_width > width:
+            rows.append((" ".join(current), current_width))
+            current, current_width = [word], word_width
+        else:
+            current_width += word_width + (1 if current else 0)
+            current.append(word)
+    if current:
+        rows.append((" ".join(current), current_width))
+    return rows
+
+# ============================================================================
+# BOXES
+# ============================================================================
+
+BOX_WIDTH = 60
+
+TOOL_TITLES = {
+    "finance": " 💰 BUDGET ANALYSIS",
+    "calendar": " 📅 CALENDAR AVAILABILITY",
+    "health": " 🏥 HEALTH & SAFETY GUIDELINES",
+    "weather": " 🌤️  WEATHER FORECAST",
+    "traffic": " 🚗 TRAFFIC INFORMATION",
+    "invite_people": " 👥 INVITATION DETAILS",
+    "whatsapp_message": " 📱 WHATSAPP STATUS",
+    "email_message": " 📧 EMAIL STATUS",
+}
+
+def render_box(title: str, content: str, width: int = BOX_WIDTH) -> str:
+    """Render a titled box around `content`, wrapped to fit, as one string."""
+    inner = width - 2
+    parts = [f"\n╭{'─' * width}╮\n",
+             f"│{title}{' ' * max(0, width - display_width(title))}│\n",
+             f"├{'─' * width}┤\n"]
+    for line in content.split("\n"):
+        for text, columns in wrap_line(line, inner):
+            parts.append(f"│ {text}{' ' * max(0, inner - columns)} │\n")
+    parts.append(f"╰{'─' * width}╯\n")
+    return "".join(parts)
+
+def render_tool_output(tool_name: str, content: str, width: int = BOX_WIDTH) -> str:
+    """Box for a tool result, titled after the tool."""
+    return render_box(TOOL_TITLES.get(tool_name, f" 🔧 {tool_name.upper()} RESULT"), content, width)
+
+def write_box(text: str, stream=None) -> None:
+    """Write a rendered box with a single write call."""
+    stream = stream or sys.stdout
+    stream.write(text)
+    stream.flush()
@@ -0,0 +1,117 @@
+# replanning.py
+
+import re
+import uuid
+from langchain_core.messages import AIMessage
+from data import TOOL_PLANNING_FIELDS
+from tool_prefetch import OUTDOOR_PATTERN, extract_tool_args
+
+# ============================================================================
+# PLAN FACETS
+# ============================================================================
+
+REPLANNER_NAME = "replanner"   # Name of the AI message that carries targeted re-plan tool calls
+
+# Tools to re-run when a modification touches a facet of the plan. Every other
+# *_info field of the previous plan is kept as it is.
+REPLAN_FACETS = {
+    "date": ("calendar", "weather"),
+    "budget": ("finance",),
+    "venue": ("traffic", "weather"),
+}
+
+_MONTHS = (r"jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may \d|june?|july?|aug(?:ust)?"
+           r"|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?")  # "may" only before a day
+FACET_PATTERNS = {
+    "date": re.compile(
+        r"\b(?:date|day|time|reschedul\w*|postpone\w*|earlier|later|tomorrow|weekend|weekday|next week"
+        r"|(?:mon|tues|wednes|thurs|fri|satur|sun)days?|morning|afternoon|evening"
+        rf"|{_MONTHS}|\d{{1,2}}/\d{{1,2}}|\d{{1,2}}(?:st|nd|rd|th))\b"),
+    "budget": re.compile(
+        r"\$\s?\d|\b(?:budget|cost|costs|cheaper|expensive|spend(?:ing)?|price|afford|dollars|usd)\b"),
+    "venue": re.compile(
+        r"\b(?:venue|location|place|address|downtown|restaurant|hotel|hall|club|office|rooftop|park|beach"
+        r"|garden|outdoors?|outside|indoors?|inside|at home)\b"),
+}
+
+def detect_facets(modification: str) -> list:
+    """Plan facets (keys of REPLAN_FACETS) a modification request touches."""
+    text = modification.lower()
+    return [facet for facet, pattern in FACET_PATTERNS.items() if pattern.search(text)]
+
+# Clauses of a modification, and words that carry no change on their own ("please modify the plan:")
+_CLAUSE_SPLIT = re.compile(r"[,;:.!?]|\b(?:and|also|plus|then|but)\b")
+_FILLER = re.compile(r"\b(?:please|kindly|can|could|would|you|we|i|let's|lets|want|to|modify|change|update|revise"
+                     r"|adjust|the|a|an|it|its|this|that|plan|event|party|instead|so|too|as|well)\b")
+
+def covers_modification(modification: str) -> bool:
+    """
+    True when every clause of `modification` touches a known facet, so re-running
+    the facet tools applies the whole change ("move it to June 14th and lower the
+    budget"). A clause asking for anything else ("add a DJ") needs the scheduler.
+    """
+    for clause in _CLAUSE_SPLIT.split(modification.lower()):
+        if detect_facets(clause):
+            continue
+        if _FILLER.sub(" ", clause).strip(" -'\""):
+            return False
+    return True
+
+def tools_for_facets(facets, planning_data: dict, modification: str = "") -> list:
+    """
+    Tools to re-run for `facets`, in REPLAN_FACETS order. Weather is only re-run
+    when the plan already has a forecast or the event is (now) outdoors.
+    """
+    names = []
+    for facet in facets:
+        names += [name for name in REPLAN_FACETS[facet] if name not in names]
+    outdoor = OUTDOOR_PATTERN.search(f"{planning_data.get('user_request', '')} {modification}".lower())
+    if "weather" in names and not (planning_data.get("weather_info") or outdoor):
+        names.remove("weather")
+    return names
+
+# ============================================================================
+# TARGETED RE-PLAN
+# ============================================================================
+
+def replan_message(modification: str, planning_data: dict, tools) -> AIMessage:
+    """
+    AI message calling only the tools affected by `modification`, or None when it
+    touches no known facet (the scheduler then re-plans from scratch). Arguments
+    come from the modification; the query keeps the original request so the tools
+    still see what kind of event it is. response_metadata["replan_complete"] tells
+    whether the tools apply the whole change (see covers_modification); if not,
+    the scheduler handles the rest after them.
+    """
+    facets = detect_facets(modification)
+    names = tools_for_facets(facets, planning_data, modification)
+    tools_by_name = {tool.name: tool for tool in tools}
+    names = [name for name in names if name in tools_by_name]
+    if not names:
+        return None
+
+    args = extract_tool_args(modification)
+    args["query"] = f"{planning_data.get('user_request', '')} (change: {modification})"
+    tool_calls = [{"name": name, "id": f"call_{uuid.uuid4().hex[:12]}",
+                   "args": {key: value for key, value in args.items() if key in tools_by_name[name].args}}
+                  for name in names]
+    kept = [name for name in tools_by_name if name not in names and planning_data.get(TOOL_PLANNING_FIELDS.get(name))]
+    complete = covers_modification(modification)
+    return AIMessage(
+        content=f"🔄 Updating {', '.join(facets)}: re-running {', '.join(names)}"
+                + (f"; keeping {', '.join(kept)}." if kept else ".")
+                + ("" if complete else " The rest of the change goes to the scheduler."),
+        name=REPLANNER_NAME,
+        tool_calls=tool_calls,
+        response_metadata={"replan_complete": complete},
+    )
+
+def is_complete_replan(messages) -> bool:
+    """
+    True when the latest tool calls in `messages` were issued by replan_message()
+    and cover the whole modification, so the plan can go straight back to review.
+    """
+    for msg in reversed(messages):
+        if isinstance(msg, AIMessage) and msg.tool_calls:
+            return msg.name == REPLANNER_NAME and msg.response_metadata.get("replan_complete", False)
+    return False
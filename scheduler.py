@@ -1,21 +1,19 @@
 # scheduler.py
 
 from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
+from langchain_core.runnables import RunnableConfig
 from orchestrator import AgentState
-from data import event_planning_data
+from context_window import compact_history
+from data import get_planning_data
 
-def scheduler_agent(state: AgentState, scheduler_model) -> AgentState:
-    """
-    Enhanced scheduler agent that intelligently selects appropriate tools based on context.
-    This agent focuses on the logistics and planning aspects of the event.
-    """
-    messages = state["messages"]
-    user_request = event_planning_data.get("user_request", "")
-    
-    # Updated system prompt reflecting the removal of the 'invite_people' tool.
-    system_prompt = SystemMessage(content=f"""You are the Scheduler Agent, responsible for the logistical planning of events.
+# ============================================================================
+# PROMPT
+# ============================================================================
 
-Your current task is to plan for the user's request: "{user_request}".
+# The system prompt is identical for every request and every round of the tool
+# loop, so together with the bound tool schema it forms a stable prefix that
+# providers with prompt caching can reuse. Per-request data goes last.
+SCHEDULER_SYSTEM_PROMPT = SystemMessage(content="""You are the Scheduler Agent, responsible for the logistical planning of events.
 
 Your goal is to gather all necessary information to create a comprehensive event plan. You have 5 tools at your disposal:
 - calendar: To check availability and schedule dates.
@@ -30,27 +28,67 @@ Read the docstrings of these tools to understand their specific functions. Selec
 - For an event at a downtown venue, you must add the traffic tool.
 
 Be smart and efficient. After using your tools, the plan will be passed to a human for review before any invitations are drafted or sent.
-Provide arguments for each tool in the correct format. For string-based queries, be descriptive (e.g., "check calendar for weekend availability in late June for a birthday party").""")
+Provide arguments for each tool in the correct format. For string-based queries, be descriptive (e.g., "check calendar for weekend availability in late June for a birthday party").
+
+The event you are planning for is given in the last message.""")
+
+def build_scheduler_messages(state: AgentState, config: RunnableConfig, token_budget: int = None):
+    """
+    Build the prompt for the next scheduler model call: the static system prompt,
+    the history compacted to roughly `token_budget` tokens (see
+    context_window.compact_history), and the user's request last.
+    Returns None when scheduling has already been completed and approved.
+    """
+    messages = state["messages"]
+    event_planning_data = get_planning_data(config)
+    user_request = event_planning_data.get("user_request", "")
     
-    # If scheduling is already marked as complete, pass the turn.
+    # If scheduling is already marked as complete, there is nothing to ask the model.
     if event_planning_data.get("current_step") == "scheduling_complete":
-        return {
-            "messages": [AIMessage(content="Scheduling has already been completed and approved. Passing to communication agent.")],
-            "current_agent": "communication", 
-            "next_action": "communication"
-        }
+        return None
     
-    all_messages = [system_prompt] + list(messages)
+    all_messages = [SCHEDULER_SYSTEM_PROMPT] + compact_history(messages, token_budget)
     if user_request:
         # Append a clear instruction for the model.
         all_messages.append(HumanMessage(content=f"Use your available tools to create a detailed plan for this event: {user_request}"))
     
-    # Invoke the model to get the next step (which could be calling tools).
-    response = scheduler_model.invoke(all_messages)
-    
+    return all_messages
+
+def scheduling_complete_result() -> AgentState:
+    """State update used when scheduling is already complete: pass the turn."""
+    return {
+        "messages": [AIMessage(content="Scheduling has already been completed and approved. Passing to communication agent.")],
+        "current_agent": "communication", 
+        "next_action": "communication"
+    }
+
+def scheduler_result(response) -> AgentState:
+    """State update for a scheduler model response."""
     return {
         "messages": [response],
         "current_agent": "scheduler",
         # The next action is 'tools' if the model decides to call tools, otherwise it proceeds to the next step in the graph (human_review).
         "next_action": "tools" if response.tool_calls else "human_review"
     }
+
+def scheduler_agent(state: AgentState, scheduler_model, config: RunnableConfig, token_budget: int = None) -> AgentState:
+    """
+    Enhanced scheduler agent that intelligently selects appropriate tools based on context.
+    This agent focuses on the logistics and planning aspects of the event.
+    """
+    all_messages = build_scheduler_messages(state, config, token_budget)
+    if all_messages is None:
+        return scheduling_complete_result()
+    
+    # Invoke the model to get the next step (which could be calling tools).
+    response = scheduler_model.invoke(all_messages, config)
+    return scheduler_result(response)
+
+async def ascheduler_agent(state: AgentState, scheduler_model, config: RunnableConfig, token_budget: int = None) -> AgentState:
+    """Async-native scheduler agent: same logic as scheduler_agent, using ainvoke."""
+    all_messages = build_scheduler_messages(state, config, token_budget)
+    if all_messages is None:
+        return scheduling_complete_result()
+    
+    response = await scheduler_model.ainvoke(all_messages, config)
+    return scheduler_result(response)
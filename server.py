@@ -0,0 +1,355 @@
+# server.py
+
+import json
+import time
+import uuid
+import asyncio
+import argparse
+from collections import OrderedDict
+from datetime import datetime, timezone
+from langchain_core.messages import HumanMessage, AIMessage, AIMessageChunk
+from main import create_event_planning_graph, create_checkpointer, make_session_config, is_awaiting_review, warm_up_models
+from tool_prefetch import close_prefetch
+from data import restore_planning_data
+from metrics import MetricsRegistry, MetricsCallbackHandler, serve_prometheus
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 8765
+MAX_IN_FLIGHT = 100      # Graph runs executing at the same time
+MAX_PENDING = 1000       # Requests admitted (running + waiting) before we reject
+MAX_LINE_BYTES = 64 * 1024
+METRICS_PORT = 9464      # Prometheus text endpoint (GET /metrics); 0 disables it
+SESSION_IDLE_TTL_SECONDS = 3600   # Paused sessions idle longer than this are dropped with their checkpoints
+MAX_PAUSED_SESSIONS = 10000       # Beyond this, the longest-paused sessions are dropped first
+
+# ============================================================================
+# PLANNING SERVER
+# ============================================================================
+
+def _bind_session(on_token, session_id: str):
+    """Adapt a protocol-level token callback to the (node, text) form used per session."""
+    if on_token is None:
+        return None
+
+    async def callback(node, text):
+        await on_token(session_id, node, text)
+    return callback
+
+async def _discard_line(reader):
+    """Consume the rest of the current line, newline included, without buffering it."""
+    while True:
+        try:
+            await reader.readuntil(b"\n")
+            return
+        except asyncio.LimitOverrunError as e:
+            await reader.readexactly(e.consumed)
+        except asyncio.IncompleteReadError:
+            return
+
+class PlanningServer:
+    """
+    Multi-tenant server that drives many planning sessions through one compiled
+    event planning graph. Every session runs under its own thread id and planning
+    context, and the human_review interrupt is exposed as a resumable call.
+
+    Protocol: one JSON object per line in, one JSON object per line out.
+        {"op": "plan", "request": "Plan a birthday party at home"}
+        {"op": "review", "session_id": "...", "decision": "proceed"}
+        {"op": "cancel", "session_id": "..."}
+    A session runs one request at a time: review or cancel while its plan/review
+    run is still in flight gets a "session busy" error. Paused sessions expire after
+    `session_ttl` seconds without a review, or earliest-paused first beyond
+    `max_sessions`; their checkpoints are deleted with them, as are those of sessions
+    that complete or fail.
+    An optional "id" field is echoed back so clients can pipeline requests.
+    With "stream": true on plan/review, model tokens are sent as they are generated,
+    before the final response:
+        {"event": "token", "session_id": "...", "node": "scheduler", "text": "..."}
+    """
+
+    def __init__(self, app=None, max_in_flight: int = MAX_IN_FLIGHT, max_pending: int = MAX_PENDING,
+                 session_ttl: float = SESSION_IDLE_TTL_SECONDS, max_sessions: int = MAX_PAUSED_SESSIONS):
+        self.app = app or create_event_planning_graph()
+        self.max_pending = max_pending
+        self.session_ttl = session_ttl
+        self.max_sessions = max_sessions
+        self.sessions = OrderedDict()  # session_id -> graph config of sessions paused at human review, oldest first
+        self._paused_at = {}  # session_id -> time.monotonic() when it paused
+        self._active = set()  # session_ids with a graph run in flight
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._pending = 0
+        self.metrics = MetricsRegistry()
+        self._callbacks = [MetricsCallbackHandler(self.metrics)]
+
+    async def _run_until_pause(self, payload, config, on_token=None):
+        """
+        Run the graph for one session until it ends or reaches human review.
+        `on_token(node, text)` is awaited for every streamed model token.
+        """
+        async with self._slots:
+            if on_token is None:
+                await self.app.ainvoke(payload, config)
+            else:
+                async for chunk, metadata in self.app.astream(payload, config, stream_mode="messages"):
+                    if isinstance(chunk, AIMessageChunk) and isinstance(chunk.content, str) and chunk.content:
+                        await on_token(metadata.get("langgraph_node"), chunk.content)
+            return await self.app.aget_state(config)
+
+    def _session_result(self, session_id: str, config: dict, state) -> dict:
+        """Build the response for a session and track it if it is paused."""
+        planning_data = config["configurable"]["planning_data"]
+        awaiting_review = is_awaiting_review(state)
+
+        if awaiting_review:
+            self.sessions[session_id] = config
+            self.sessions.move_to_end(session_id)
+            self._paused_at[session_id] = time.monotonic()
+        else:
+            self._forget(session_id)
+
+        last_ai = next((msg.content for msg in reversed(state.values.get("messages", [])) if isinstance(msg, AIMessage) and msg.content), "")
+        return {
+            "session_id": session_id,
+            "status": "awaiting_review" if awaiting_review else "completed",
+            "plan": dict(planning_data),
+            "message": last_ai,
+        }
+
+    def _forget(self, session_id: str):
+        """Stop tracking a session; returns its config if it was paused."""
+        self._paused_at.pop(session_id, None)
+        return self.sessions.pop(session_id, None)
+
+    async def _drop_session(self, session_id: str):
+        """Forget a session and delete its checkpoints."""
+        self._forget(session_id)
+        await self.app.checkpointer.adelete_thread(session_id)
+
+    async def _end_run(self, session_id: str, config: dict, result: dict):
+        """
+        After a plan/review run: stop the run's speculative tool calls, and delete a
+        session that did not pause (completed or failed).
+        """
+        if config is not None:
+            close_prefetch(config)
+        if result is None or result["status"] != "awaiting_review":
+            await self._drop_session(session_id)
+
+    async def expire_sessions(self) -> int:
+        """Drop paused sessions idle beyond the TTL or over the cap; returns how many."""
+        now = time.monotonic()
+        expired = []
+        for session_id in self.sessions:  # Oldest pause first
+            over_cap = len(self.sessions) - len(expired) > self.max_sessions
+            if not over_cap and now - self._paused_at[session_id] <= self.session_ttl:
+                break
+            expired.append(session_id)
+        for session_id in expired:
+            await self._drop_session(session_id)
+        return len(expired)
+
+    def _claim(self, session_id: str):
+        """Mark a session as running; a session already running is busy."""
+        if session_id in self._active:
+            raise RuntimeError(f"Session busy: {session_id} already has a request in flight")
+        self._active.add(session_id)
+
+    async def plan(self, request: str, on_token=None, session_id: str = None) -> dict:
+        """Start a new planning session and run it up to the human review point."""
+        session_id = session_id or uuid.uuid4().hex
+        config = make_session_config(session_id, callbacks=self._callbacks)
+        initial_state = {
+            "messages": [HumanMessage(content=request)],
+            "current_agent": "orchestrator",
+            "next_action": "scheduler"
+        }
+        self._claim(session_id)
+        result = None
+        try:
+            state = await self._run_until_pause(initial_state, config, on_token)
+            result = self._session_result(session_id, config, state)
+        finally:
+            self._active.discard(session_id)
+            await self._end_run(session_id, config, result)
+        await self.expire_sessions()
+        return result
+
+    async def review(self, session_id: str, decision: str, on_token=None) -> dict:
+        """Resume a paused session with the user's review decision."""
+        self._claim(session_id)
+        config = result = None
+        try:
+            # Taken out of `sessions` while it runs; _session_result puts it back if it pauses again
+            config = self._forget(session_id) or await self._recover_session(session_id)
+            if config is None:
+                raise KeyError(f"Unknown or completed session: {session_id}")
+
+            await self.app.aupdate_state(config, {"messages": [HumanMessage(content=decision)]})
+            state = await self._run_until_pause(None, config, on_token)
+            result = self._session_result(session_id, config, state)
+        finally:
+            self._active.discard(session_id)
+            await self._end_run(session_id, config, result)
+        await self.expire_sessions()
+        return result
+
+    async def _recover_session(self, session_id: str):
+        """
+        Rebuild the config of a session paused before a restart. Only possible with a
+        durable checkpointer; the planning context is restored from the checkpoint.
+        A session whose checkpoint is older than the TTL has expired and is deleted.
+        """
+        config = make_session_config(session_id, callbacks=self._callbacks)
+        state = await self.app.aget_state(config)
+        if not is_awaiting_review(state):
+            return None
+        paused_for = datetime.now(timezone.utc) - datetime.fromisoformat(state.created_at)
+        if paused_for.total_seconds() > self.session_ttl:
+            await self._drop_session(session_id)
+            return None
+        config["configurable"]["planning_data"] = restore_planning_data(state.values.get("messages", []))
+        return config
+
+    async def cancel(self, session_id: str) -> dict:
+        """Drop a paused session and its checkpoints."""
+        if session_id in self._active:
+            raise RuntimeError(f"Session busy: {session_id} already has a request in flight")
+        if session_id not in self.sessions:
+            raise KeyError(f"Unknown or completed session: {session_id}")
+        await self._drop_session(session_id)
+        return {"session_id": session_id, "status": "cancelled"}
+
+    async def handle_message(self, message: dict, on_token=None) -> dict:
+        """
+        Dispatch one protocol message and always return a response dict.
+        `on_token(session_id, node, text)` receives streamed tokens of plan/review.
+        """
+        op = message.get("op")
+
+        # Backpressure: refuse new work once too many requests are admitted.
+        if self._pending >= self.max_pending:
+            return {"error": "server busy, retry later"}
+
+        self._pending += 1
+        try:
+            if op == "plan":
+                session_id = uuid.uuid4().hex
+                return await self.plan(message["request"], _bind_session(on_token, session_id), session_id)
+            elif op == "review":
+                session_id = message["session_id"]
+                return await self.review(session_id, message.get("decision", "proceed"), _bind_session(on_token, session_id))
+            elif op == "cancel":
+                return await self.cancel(message["session_id"])
+            else:
+                return {"error": f"Unknown op: {op!r}"}
+        except KeyError as e:
+            return {"error": f"Missing or unknown field: {e}"}
+        except Exception as e:
+            return {"error": str(e)}
+        finally:
+            self._pending -= 1
+
+    async def _respond(self, message: dict, writer, write_lock):
+        async def send_token(session_id, node, text):
+            event = {"event": "token", "session_id": session_id, "node": node, "text": text}
+            if "id" in message:
+                event["id"] = message["id"]
+            async with write_lock:
+                writer.write((json.dumps(event) + "\n").encode())
+                await writer.drain()
+
+        response = await self.handle_message(message, send_token if message.get("stream") else None)
+        if "id" in message:
+            response["id"] = message["id"]
+
+        async with write_lock:
+            writer.write((json.dumps(response) + "\n").encode())
+            await writer.drain()
+
+    async def handle_connection(self, reader, writer):
+        """Serve one client connection; requests on it are handled concurrently."""
+        write_lock = asyncio.Lock()
+        tasks = set()
+        try:
+            while True:
+                try:
+                    line = await reader.readuntil(b"\n")
+                except asyncio.IncompleteReadError as e:
+                    line = e.partial  # Last line without a newline, or b"" at EOF
+                except asyncio.LimitOverrunError:
+                    # Read the over-long line to its end so the reply isn't lost to a reset, then close
+                    await _discard_line(reader)
+                    async with write_lock:
+                        writer.write(json.dumps({"error": f"request line exceeds {MAX_LINE_BYTES} bytes"}).encode() + b"\n")
+                        await writer.drain()
+                    break
+                if not line:
+                    break
+
+                try:
+                    message = json.loads(line)
+                except json.JSONDecodeError:
+                    async with write_lock:
+                        writer.write(b'{"error": "invalid JSON"}\n')
+                        await writer.drain()
+                    continue
+
+                task = asyncio.create_task(self._respond(message, writer, write_lock))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        except ConnectionResetError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host: str = SERVER_HOST, port: int = SERVER_PORT):
+        """Accept connections until cancelled."""
+        server = await asyncio.start_server(self.handle_connection, host, port, limit=MAX_LINE_BYTES)
+        print(f"🚀 Event planning server listening on {host}:{port}")
+        async with server:
+            await server.serve_forever()
+
+# ============================================================================
+# ENTRY POINT
+# ============================================================================
+
+def main():
+    """Entry point for the multi-tenant planning server."""
+    parser = argparse.ArgumentParser(description="Multi-tenant event planning server (line-delimited JSON over TCP).")
+    parser.add_argument("--host", default=SERVER_HOST)
+    parser.add_argument("--port", type=int, default=SERVER_PORT)
+    parser.add_argument("--max-in-flight", type=int, default=MAX_IN_FLIGHT)
+    parser.add_argument("--max-pending", type=int, default=MAX_PENDING)
+    parser.add_argument("--metrics-port", type=int, default=METRICS_PORT,
+                        help="port of the Prometheus /metrics endpoint (0 disables it)")
+    parser.add_argument("--checkpoint-db", default=None,
+                        help="SQLite file for durable checkpoints; paused sessions survive restarts")
+    args = parser.parse_args()
+
+    async def run():
+        checkpointer = create_checkpointer("sqlite", args.checkpoint_db) if args.checkpoint_db else None
+        server = PlanningServer(app=create_event_planning_graph(checkpointer=checkpointer),
+                                max_in_flight=args.max_in_flight, max_pending=args.max_pending)
+        await warm_up_models()
+        metrics_task = None
+        if args.metrics_port:
+            metrics_task = asyncio.create_task(serve_prometheus(server.metrics, args.host, args.metrics_port))
+        try:
+            await server.serve(args.host, args.port)
+        finally:
+            if metrics_task is not None:
+                metrics_task.cancel()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        print("\n👋 Server stopped.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+# terminal_io.py
+
+import os
+import sys
+import stat
+import asyncio
+import threading
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+MAX_PENDING_OUTPUT_BYTES = 1 << 20   # Output (in characters) buffered for the terminal before producers wait
+
+# ============================================================================
+# ASYNC TERMINAL
+# ============================================================================
+
+def _pollable(stream) -> bool:
+    """Whether the event loop can watch the stream: a terminal, pipe or socket."""
+    try:
+        mode = os.fstat(stream.fileno()).st_mode
+        return stream.isatty() or stat.S_ISFIFO(mode) or stat.S_ISSOCK(mode)
+    except (OSError, AttributeError, ValueError):
+        return False
+
+def _private_fd(stream, flags: int):
+    """
+    Open the stream's pipe or terminal again as a new descriptor with its own open
+    file description, so the O_NONBLOCK flag set by the pipe transports does not
+    reach stderr or anything else sharing the original description. Returns
+    (fd, shared); falls back to dup() (shared=True) where that is not possible.
+    """
+    fd = stream.fileno()
+    paths = [f"/proc/self/fd/{fd}"]
+    if stream.isatty():
+        paths.append(os.ttyname(fd))
+    for path in paths:
+        try:
+            return os.open(path, flags | os.O_NOCTTY | os.O_CLOEXEC), False
+        except OSError:
+            pass
+    return os.dup(fd), True
+
+def _restore_blocking(fds):
+    for fd in fds:
+        try:
+            os.set_blocking(fd, True)  # Pipe transports leave the descriptor non-blocking
+        except OSError:
+            pass
+
+class AsyncTerminal:
+    """
+    Event-loop-native terminal I/O for the CLI.
+
+    Output: `write()` (and therefore `print()` while the terminal is installed as
+    sys.stdout) only appends to a pending buffer, via call_soon_threadsafe when
+    called from a worker thread; a writer task joins everything pending into one
+    write on a non-blocking pipe transport, so a slow terminal never blocks the
+    event loop. The buffer is bounded: `drain()` waits while more
+    than `max_pending_bytes` are queued, and the stream loop calls it once per event.
+
+    Input: `readline()` awaits a StreamReader on stdin instead of parking a
+    blocking input() call in the default executor.
+
+    Falls back to executor-based reads/writes where stdin/stdout cannot be attached
+    to the loop (regular files, Windows consoles).
+    """
+
+    def __init__(self, max_pending_bytes: int = MAX_PENDING_OUTPUT_BYTES, stdin=None, stdout=None):
+        self.max_pending_bytes = max_pending_bytes
+        self._stdin = stdin or sys.stdin
+        self._stdout = stdout or sys.stdout
+        self._pending = []
+        self._pending_bytes = 0
+        self._reader = None
+        self._read_transport = None
+        self._writer = None
+        self._writer_task = None
+        self._wakeup = None
+        self._drained = None
+        self._loop = None
+        self._loop_thread = None
+        self._blocking_fds = []   # Original descriptors whose file description the transports share
+        self.encoding = "utf-8"
+
+    async def start(self):
+        loop = asyncio.get_running_loop()
+        self._loop = loop
+        self._loop_thread = threading.get_ident()
+        self._wakeup = asyncio.Event()
+        self._drained = asyncio.Event()
+        self._drained.set()
+        self._stdout.flush()
+
+        # Transports get their own descriptors so closing them leaves sys.stdin/stdout open.
+        pipe, shared = None, False
+        try:
+            if not _pollable(self._stdin):
+                raise ValueError("stdin cannot be polled")
+            reader = asyncio.StreamReader()
+            fd, shared = _private_fd(self._stdin, os.O_RDONLY)
+            pipe = os.fdopen(fd, "rb", buffering=0)
+            self._read_transport, _ = await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), pipe)
+            self._reader = reader
+            if shared:
+                self._blocking_fds.append(self._stdin.fileno())
+        except (NotImplementedError, ValueError, OSError, AttributeError):
+            if pipe is not None:
+                pipe.close()
+            if shared:
+                _restore_blocking([self._stdin.fileno()])
+            self._reader = None
+
+        pipe, shared = None, False
+        try:
+            if not _pollable(self._stdout):
+                raise ValueError("stdout cannot be polled")
+            fd, shared = _private_fd(self._stdout, os.O_WRONLY)
+            pipe = os.fdopen(fd, "wb", buffering=0)
+            transport, protocol = await loop.connect_write_pipe(asyncio.streams.FlowControlMixin, pipe)
+            self._writer = asyncio.StreamWriter(transport, protocol, None, loop)
+            if shared:
+                self._blocking_fds.append(self._stdout.fileno())
+        except (NotImplementedError, ValueError, OSError, AttributeError):
+            if pipe is not None:
+                pipe.close()
+            if shared:
+                _restore_blocking([self._stdout.fileno()])
+            self._writer = None
+
+        self._writer_task = asyncio.create_task(self._write_loop())
+        return self
+
+    # --------------------------------------------------------------------- output
+
+    def write(self, text: str) -> int:
+        if text:
+            if threading.get_ident() == self._loop_thread:
+                self._append(text)
+            else:
+                # print() from an executor thread: asyncio.Event is not thread-safe
+                self._loop.call_soon_threadsafe(self._append, text)
+        return len(text)
+
+    def _append(self, text: str):
+        self._pending.append(text)
+        self._pending_bytes += len(text)
+        self._drained.clear()
+        self._wakeup.set()
+
+    def flush(self):
+        pass  # The writer task flushes continuously; see drain()
+
+    def isatty(self) -> bool:
+        return self._stdout.isatty()
+
+    async def _write_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            while self._pending:
+                chunks, self._pending = self._pending, []
+                data = "".join(chunks)
+                self._pending_bytes -= len(data)
+                if self._writer is not None:
+                    self._writer.write(data.encode(self.encoding, errors="replace"))
+                    await self._writer.drain()
+                else:
+                    await loop.run_in_executor(None, self._blocking_write, data)
+            self._drained.set()
+
+    def _blocking_write(self, data: str):
+        self._stdout.write(data)
+        self._stdout.flush()
+
+    async def drain(self, limit: int = None):
+        """Wait until at most `limit` bytes (default: the bound) are waiting for the terminal."""
+        limit = self.max_pending_bytes if limit is None else limit
+        while self._pending_bytes > limit:
+            await self._drained.wait()
+            await asyncio.sleep(0)
+
+    async def flush_all(self):
+        """Wait until everything written so far has been handed to the terminal."""
+        while self._pending or not self._drained.is_set():
+            await self._drained.wait()
+            await asyncio.sleep(0)
+
+    # ---------------------------------------------------------------------- input
+
+    async def readline(self, prompt: str = "") -> str:
+        """Show `prompt` and await one line of input. Raises EOFError at end of input."""
+        self.write(prompt)
+        await self.flush_all()
+        if self._reader is None:
+            return await asyncio.get_running_loop().run_in_executor(None, input)
+        line = await self._reader.readline()
+        if not line:
+            raise EOFError
+        return line.decode(self.encoding, errors="replace").rstrip("\r\n")
+
+    # ------------------------------------------------------------------ lifecycle
+
+    async def close(self):
+        """Flush pending output, stop the writer task and restore blocking descriptors."""
+        if self._writer_task is None:
+            return
+        try:
+            try:
+                await self.flush_all()
+            finally:
+                self._writer_task.cancel()
+                try:
+                    await self._writer_task
+                except asyncio.CancelledError:
+                    pass
+                self._writer_task = None
+                if self._writer is not None:
+                    self._writer.close()
+                if self._read_transport is not None:
+                    self._read_transport.close()
+        finally:
+            _restore_blocking(self._blocking_fds)
+            self._blocking_fds = []
@@ -0,0 +1,8 @@
+# tests/conftest.py
+
+import os
+import sys
+
+# The modules live at the repository root; tests run offline on the scripted fake model.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("EVENT_PLANNER_BACKEND", "fake")
@@ -0,0 +1,34 @@
+# tests/test_agent_callbacks.py
+
+import asyncio
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import HumanMessage
+from main import create_event_planning_graph, make_session_config, scheduler_tools, communication_tools
+from fake_model import FakeChatModel
+
+class ModelRunRecorder(BaseCallbackHandler):
+    """Node name of every chat model run the graph reports."""
+
+    def __init__(self):
+        self.nodes = []
+
+    def on_chat_model_start(self, serialized, messages, *, metadata=None, **kwargs):
+        self.nodes.append((metadata or {}).get("langgraph_node"))
+
+def test_threaded_agents_pass_callbacks_to_their_models():
+    fake = FakeChatModel(latency=0.0)
+    app = create_event_planning_graph(fake.bind_tools(scheduler_tools), fake.bind_tools(communication_tools),
+                                      native_async=False)
+    recorder = ModelRunRecorder()
+    config = make_session_config(callbacks=[recorder])
+
+    async def run():
+        await app.ainvoke({"messages": [HumanMessage(content="Plan a birthday party at home")],
+                           "current_agent": "orchestrator", "next_action": "scheduler"}, config)
+        await app.aupdate_state(config, {"messages": [HumanMessage(content="proceed")]})
+        await app.ainvoke(None, config)
+
+    asyncio.run(run())
+
+    assert "scheduler" in recorder.nodes
+    assert "communication" in recorder.nodes
@@ -0,0 +1,33 @@
+# tests/test_context_window.py
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from context_window import compact_history
+
+def _tool_round(names, call_prefix, size=2000):
+    calls = [{"name": name, "args": {"query": "x"}, "id": f"{call_prefix}_{name}"} for name in names]
+    results = [ToolMessage(content=f"{name} result " + "details " * (size // 8), name=name, tool_call_id=call["id"])
+               for name, call in zip(names, calls)]
+    return [AIMessage(content="", tool_calls=calls)] + results
+
+def test_latest_modification_survives_block_dropping():
+    modification = "modify: move it to a rooftop and add a DJ"
+    review_note = f"🔄 User requested modifications: {modification}. Returning to scheduler for updates."
+    history = (
+        [HumanMessage(content="Plan a birthday party at home for 20 people"),
+         AIMessage(content="Routing to Scheduler Agent.", name="orchestrator")]
+        + _tool_round(["calendar", "finance", "health"], "first")
+        + [AIMessage(content="Here is the plan: " + "summary " * 200),
+           HumanMessage(content=modification),
+           AIMessage(content=review_note)]
+        + _tool_round(["traffic", "weather"], "second", size=3200)
+    )
+
+    compacted = compact_history(history, token_budget=1500)
+
+    contents = [msg.content for msg in compacted]
+    assert "Plan a birthday party at home for 20 people" in contents
+    assert modification in contents
+    assert review_note in contents
+    # The modification still precedes the round that answers it
+    assert contents.index(modification) < contents.index(review_note) < len(compacted) - 3
+    assert [msg.name for msg in compacted[-2:]] == ["traffic", "weather"]
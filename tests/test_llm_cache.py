@@ -0,0 +1,69 @@
+# tests/test_llm_cache.py
+
+import asyncio
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from langchain_core.runnables import Runnable
+import llm_cache
+from llm_cache import LLMResponseCache, CachedChatModel
+
+class CountingModel(Runnable):
+    """Fake chat model that counts its calls and answers with a tool call."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def invoke(self, input, config=None, **kwargs):
+        self.calls += 1
+        return AIMessage(content="", id=f"run-{self.calls}",
+                         tool_calls=[{"name": "calendar", "args": {"query": "birthday"}, "id": f"call_{self.calls}"}])
+
+    async def ainvoke(self, input, config=None, **kwargs):
+        return self.invoke(input, config, **kwargs)
+
+def _prompt(request: str):
+    return [SystemMessage(content="You are the Scheduler Agent."), HumanMessage(content=request)]
+
+def test_hit_skips_the_model_and_expires_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(llm_cache.time, "time", lambda: now[0])
+    model = CountingModel()
+    cache = LLMResponseCache(":memory:", ttl_seconds=60)
+    cached = CachedChatModel(model, cache)
+
+    first = cached.invoke(_prompt("Plan a birthday party  at home"))
+    second = asyncio.run(cached.ainvoke(_prompt("  Plan a birthday party at\nhome ")))
+
+    assert model.calls == 1
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+    assert second.tool_calls[0]["args"] == first.tool_calls[0]["args"]
+    # Replayed messages must not collide with the original in add_messages
+    assert second.id != first.id
+    assert second.tool_calls[0]["id"] != first.tool_calls[0]["id"]
+
+    now[0] += 61
+    cached.invoke(_prompt("Plan a birthday party at home"))
+    assert model.calls == 2
+    assert cache.counters["expired"] == 1
+
+def test_hedged_models_with_different_tools_do_not_share_entries():
+    from langchain_core.tools import tool
+    from fake_model import FakeChatModel
+    from model_router import HedgedChatModel
+
+    @tool
+    def calendar(query: str) -> str:
+        """Check the calendar."""
+        return query
+
+    @tool
+    def invite_people(query: str) -> str:
+        """Draft an invitation."""
+        return query
+
+    fake = FakeChatModel()
+    scheduler = CachedChatModel(HedgedChatModel(fake.bind_tools([calendar]), fake.bind_tools([calendar])),
+                                LLMResponseCache(":memory:"))
+    communication = CachedChatModel(HedgedChatModel(fake.bind_tools([invite_people]), fake.bind_tools([invite_people])),
+                                    scheduler.cache)
+    prompt = _prompt("Plan a birthday party at home")
+    assert scheduler.cache_key(prompt) != communication.cache_key(prompt)
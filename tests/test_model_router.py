@@ -0,0 +1,115 @@
+# tests/test_model_router.py
+
+import time
+import asyncio
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.runnables import Runnable
+from model_router import HedgedChatModel
+
+PROMPT = [HumanMessage(content="Plan a birthday party at home")]
+
+class FakeBackend(Runnable):
+    """Fake chat backend: call i takes delays(i) seconds, answers with its name, or raises `error`."""
+
+    def __init__(self, name: str, delays, error: Exception = None):
+        self.name = name
+        self.delays = delays
+        self.error = error
+        self.started = []      # perf_counter() at the start of each call
+        self.cancelled = 0
+
+    def _delay(self) -> float:
+        delay = self.delays(len(self.started))
+        self.started.append(time.perf_counter())
+        return delay
+
+    def _answer(self):
+        if self.error is not None:
+            raise self.error
+        return AIMessage(content=self.name)
+
+    def invoke(self, input, config=None, **kwargs):
+        time.sleep(self._delay())
+        return self._answer()
+
+    async def ainvoke(self, input, config=None, **kwargs):
+        try:
+            await asyncio.sleep(self._delay())
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return self._answer()
+
+def _call(model):
+    async def run():
+        start = time.perf_counter()
+        response = await model.ainvoke(PROMPT)
+        elapsed = time.perf_counter() - start
+        await asyncio.sleep(0.01)  # Let the losing call see its cancellation
+        return response, start, elapsed
+    return asyncio.run(run())
+
+def test_hedge_fires_after_the_delay_and_the_faster_answer_wins():
+    primary = FakeBackend("primary", lambda i: 1.0)
+    secondary = FakeBackend("secondary", lambda i: 0.02)
+    model = HedgedChatModel(primary, secondary, initial_delay=0.1)
+
+    response, start, elapsed = _call(model)
+    assert response.content == "secondary"
+    assert secondary.started[0] - start >= 0.1
+    assert elapsed < 0.5
+    assert primary.cancelled == 1
+    assert model.counters["hedged"] == 1 and model.counters["secondary_wins"] == 1
+
+def test_primary_answering_first_cancels_the_hedge():
+    primary = FakeBackend("primary", lambda i: 0.15)
+    secondary = FakeBackend("secondary", lambda i: 1.0)
+    model = HedgedChatModel(primary, secondary, initial_delay=0.05)
+
+    response, _, _ = _call(model)
+    assert response.content == "primary"
+    assert len(secondary.started) == 1 and secondary.cancelled == 1
+    assert model.counters["secondary_wins"] == 0
+
+def test_fast_primary_is_not_hedged():
+    primary = FakeBackend("primary", lambda i: 0.01)
+    secondary = FakeBackend("secondary", lambda i: 0.01)
+    model = HedgedChatModel(primary, secondary, initial_delay=0.1)
+
+    assert _call(model)[0].content == "primary"
+    assert secondary.started == [] and model.counters["hedged"] == 0
+
+def test_primary_error_falls_through_to_the_secondary():
+    primary = FakeBackend("primary", lambda i: 0.0, error=RuntimeError("quota exceeded"))
+    secondary = FakeBackend("secondary", lambda i: 0.02)
+    model = HedgedChatModel(primary, secondary, initial_delay=1.0)
+
+    response, _, elapsed = _call(model)
+    assert response.content == "secondary"
+    assert elapsed < 0.5   # Falls back right away instead of waiting for the hedge delay
+    assert model.counters["primary_errors"] == 1
+
+    # The blocking variant does the same
+    assert model.invoke(PROMPT).content == "secondary"
+
+def test_hedging_cuts_the_p99_tail():
+    # One primary call in ten stalls; the secondary is steady but slower than a normal primary call
+    def primary_delays(i):
+        return 0.5 if i % 10 == 9 else 0.01
+
+    def p99(model, calls: int = 50):
+        async def run():
+            async def one():
+                start = time.perf_counter()
+                await model.ainvoke(PROMPT)
+                return time.perf_counter() - start
+            return sorted(await asyncio.gather(*(one() for _ in range(calls))))
+        latencies = asyncio.run(run())
+        return latencies[int(0.99 * (len(latencies) - 1))]
+
+    unhedged = p99(HedgedChatModel(FakeBackend("primary", primary_delays), FakeBackend("secondary", lambda i: 0.03),
+                                   initial_delay=10.0))
+    hedged = p99(HedgedChatModel(FakeBackend("primary", primary_delays), FakeBackend("secondary", lambda i: 0.03),
+                                 initial_delay=0.05))
+    assert unhedged >= 0.5
+    assert hedged < 0.25
@@ -0,0 +1,38 @@
+# tests/test_parallel_tools.py
+
+import time
+import asyncio
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableConfig
+from langchain_core.tools import tool
+from parallel_tools import create_parallel_tool_node
+from data import get_planning_data, new_planning_data
+
+@tool
+def calendar(query: str, config: RunnableConfig) -> str:
+    """Fast tool."""
+    get_planning_data(config)["calendar_info"] = f"calendar: {query}"
+    return "calendar done"
+
+@tool
+def weather(query: str, config: RunnableConfig) -> str:
+    """Sync tool that outlives its timeout."""
+    time.sleep(0.3)
+    get_planning_data(config)["weather_info"] = f"weather: {query}"
+    return "weather done"
+
+def test_timed_out_tool_does_not_write_planning_data():
+    node = create_parallel_tool_node([calendar, weather], timeouts={"weather": 0.05})
+    planning_data = new_planning_data()
+    call = AIMessage(content="", tool_calls=[{"name": "calendar", "args": {"query": "party"}, "id": "call_1"},
+                                             {"name": "weather", "args": {"query": "party"}, "id": "call_2"}])
+
+    async def scenario():
+        result = await node({"messages": [call]}, {"configurable": {"planning_data": planning_data}})
+        await asyncio.sleep(0.5)  # Let the abandoned weather call finish in its thread
+        return result["messages"]
+
+    messages = asyncio.run(scenario())
+    assert [m.status for m in messages] == ["success", "error"]
+    assert planning_data["calendar_info"] == "calendar: party"
+    assert planning_data["weather_info"] == new_planning_data()["weather_info"]
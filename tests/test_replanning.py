@@ -0,0 +1,39 @@
+# tests/test_replanning.py
+
+import asyncio
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from main import create_event_planning_graph, make_session_config, scheduler_tools, communication_tools
+from fake_model import FakeChatModel
+from replanning import covers_modification
+
+def test_covers_modification():
+    assert covers_modification("Please modify the plan: change the budget to $1100")
+    assert covers_modification("Reschedule to Saturday and lower the budget to $800")
+    assert not covers_modification("change the date to June 14th and add a DJ")
+    assert not covers_modification("Change the theme to pirates")
+
+async def _modify(modification: str):
+    fake = FakeChatModel()
+    app = create_event_planning_graph(fake.bind_tools(scheduler_tools), fake.bind_tools(communication_tools))
+    config = make_session_config()
+    await app.ainvoke({"messages": [HumanMessage(content="Plan an outdoor picnic in the park")],
+                       "current_agent": "orchestrator", "next_action": "scheduler"}, config)
+    await app.aupdate_state(config, {"messages": [HumanMessage(content=modification)]})
+    await app.ainvoke(None, config)
+    state = await app.aget_state(config)
+    messages = state.values["messages"]
+    start = max(i for i, msg in enumerate(messages) if isinstance(msg, HumanMessage) and msg.content == modification)
+    return state.next, messages[start + 1:]
+
+def test_covered_change_reruns_only_facet_tools():
+    next_nodes, after = asyncio.run(_modify("change the date to June 14th"))
+    assert next_nodes == ("human_review",)
+    assert [msg.name for msg in after if isinstance(msg, ToolMessage)] == ["calendar", "weather"]
+    # No scheduler model call: the tool results are the last thing before review
+    assert isinstance(after[-1], ToolMessage)
+
+def test_partly_covered_change_reaches_the_scheduler():
+    next_nodes, after = asyncio.run(_modify("change the date to June 14th and add a DJ"))
+    assert next_nodes == ("human_review",)
+    assert [msg.name for msg in after if isinstance(msg, ToolMessage)] == ["calendar", "weather"]
+    assert isinstance(after[-1], AIMessage) and not after[-1].tool_calls and after[-1].name != "replanner"
@@ -0,0 +1,88 @@
+# tests/test_server.py
+
+import json
+import asyncio
+from main import create_event_planning_graph, scheduler_tools, communication_tools
+from fake_model import FakeChatModel
+from server import PlanningServer, MAX_LINE_BYTES
+
+def _server(**kwargs):
+    fake = FakeChatModel(latency=0.05)
+    app = create_event_planning_graph(fake.bind_tools(scheduler_tools), fake.bind_tools(communication_tools))
+    return PlanningServer(app=app, **kwargs)
+
+def test_concurrent_reviews_of_one_session_run_once():
+    async def scenario():
+        server = _server()
+        planned = await server.handle_message({"op": "plan", "request": "Plan a birthday party at home"})
+        resumes = []
+        run_until_pause = server._run_until_pause
+
+        async def counting_run(payload, config, on_token=None):
+            resumes.append(config["configurable"]["thread_id"])
+            return await run_until_pause(payload, config, on_token)
+
+        server._run_until_pause = counting_run
+        review = {"op": "review", "session_id": planned["session_id"], "decision": "proceed"}
+        first, second = await asyncio.gather(server.handle_message(review), server.handle_message(review))
+        return planned["session_id"], first, second, resumes
+
+    session_id, first, second, resumes = asyncio.run(scenario())
+    assert first["status"] == "completed"
+    assert "Session busy" in second["error"]
+    assert resumes == [session_id]
+
+def test_paused_sessions_expire_with_their_checkpoints():
+    async def scenario():
+        server = _server(max_sessions=2)
+        planned = [await server.handle_message({"op": "plan", "request": f"Plan a birthday party at home #{i}"})
+                   for i in range(3)]
+        ids = [result["session_id"] for result in planned]
+        over_cap = list(server.sessions)
+
+        server.session_ttl = 0
+        expired = await server.expire_sessions()
+        states = [await server.app.aget_state({"configurable": {"thread_id": session_id}}) for session_id in ids]
+        review = await server.handle_message({"op": "review", "session_id": ids[-1], "decision": "proceed"})
+        return ids, over_cap, expired, states, review
+
+    ids, over_cap, expired, states, review = asyncio.run(scenario())
+    assert over_cap == ids[1:]   # The earliest-paused session went over the cap
+    assert expired == 2
+    assert all(not state.values for state in states)
+    assert "Unknown or completed session" in review["error"]
+
+def test_overlong_line_gets_an_error_before_close():
+    async def scenario():
+        server = _server()
+        listener = await asyncio.start_server(server.handle_connection, "127.0.0.1", 0, limit=MAX_LINE_BYTES)
+        port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b'{"op": "plan", "request": "' + b"x" * (2 * MAX_LINE_BYTES) + b'"}\n')
+            await writer.drain()
+            response = await asyncio.wait_for(reader.readline(), 5)
+            closed = await asyncio.wait_for(reader.read(), 5)
+            writer.close()
+        return response, closed
+
+    response, closed = asyncio.run(scenario())
+    assert "exceeds" in json.loads(response)["error"]
+    assert closed == b""
+
+def test_finished_sessions_leave_no_checkpoints():
+    async def scenario():
+        server = _server()
+        for i in range(3):
+            planned = await server.handle_message({"op": "plan", "request": f"Plan a birthday party at home #{i}"})
+            assert planned["status"] == "awaiting_review"
+            reviewed = await server.handle_message({"op": "review", "session_id": planned["session_id"],
+                                                    "decision": "proceed"})
+            assert reviewed["status"] == "completed"
+        failed = await server.handle_message({"op": "review", "session_id": "no-such-session", "decision": "proceed"})
+        return server, failed
+
+    server, failed = asyncio.run(scenario())
+    assert "error" in failed
+    assert not server.sessions
+    assert not server.app.checkpointer.storage
@@ -0,0 +1,55 @@
+# tests/test_session_isolation.py
+
+import re
+import asyncio
+from langchain_core.messages import HumanMessage
+from main import create_event_planning_graph, make_session_config, scheduler_tools, communication_tools
+from fake_model import FakeChatModel
+from data import restore_planning_data, TOOL_PLANNING_FIELDS
+
+SESSIONS = 300
+REQUESTS = [
+    "Plan a birthday party at home for 20 people",
+    "Plan an outdoor picnic in the park for the team",
+    "Organize a dinner at a downtown restaurant",
+    "Schedule a quarterly planning meeting",
+    "Plan a wedding reception for 120 guests",
+]
+TAG = re.compile(r"\[session \d+\]")
+
+async def _run_sessions():
+    # Randomized latency so the sessions' model calls and tool rounds interleave
+    fake = FakeChatModel(latency=0.02, latency_distribution="uniform")
+    app = create_event_planning_graph(fake.bind_tools(scheduler_tools), fake.bind_tools(communication_tools))
+
+    async def session(i):
+        request = f"{REQUESTS[i % len(REQUESTS)]} [session {i}]"
+        config = make_session_config()
+        await app.ainvoke({"messages": [HumanMessage(content=request)], "current_agent": "orchestrator",
+                           "next_action": "scheduler"}, config)
+        await app.aupdate_state(config, {"messages": [HumanMessage(content="proceed")]})
+        await app.ainvoke(None, config)
+        state = await app.aget_state(config)
+        return request, config["configurable"]["planning_data"], state.values["messages"]
+
+    return await asyncio.gather(*(session(i) for i in range(SESSIONS)))
+
+def test_concurrent_sessions_keep_their_own_planning_data():
+    results = asyncio.run(_run_sessions())
+    assert len({id(planning_data) for _, planning_data, _ in results}) == SESSIONS
+
+    for request, planning_data, messages in results:
+        tag = TAG.search(request).group()
+        assert planning_data["user_request"] == request
+        assert planning_data["current_step"] == "scheduling_complete"
+
+        # Every tool field holds exactly what this session's own tool calls returned
+        own = restore_planning_data(messages)
+        for field in TOOL_PLANNING_FIELDS.values():
+            assert planning_data[field] == own[field], field
+        assert planning_data["calendar_info"] and planning_data["invitation_info"]
+
+        # Results that quote the request quote this session's request only
+        for field in TOOL_PLANNING_FIELDS.values():
+            assert set(TAG.findall(planning_data[field])) <= {tag}, field
+        assert tag in planning_data["calendar_info"]
@@ -0,0 +1,114 @@
+# tests/test_terminal_io.py
+
+import os
+import time
+import asyncio
+import threading
+from terminal_io import AsyncTerminal
+
+CHUNK = "x" * 65535 + "\n"     # One multi-kilobyte tool output box
+CHUNKS = 64                     # 4 MiB in total
+MAX_PENDING = 256 * 1024
+
+def _slow_consumer(fd: int, received: list):
+    """Drain the pipe in small reads with pauses, like a slow terminal."""
+    with os.fdopen(fd, "rb", buffering=0) as pipe:
+        while True:
+            data = pipe.read(16 * 1024)
+            if not data:
+                return
+            received.append(data)
+            time.sleep(0.002)
+
+async def _produce(stdin, stdout) -> dict:
+    terminal = await AsyncTerminal(max_pending_bytes=MAX_PENDING, stdin=stdin, stdout=stdout).start()
+    lags, done = [], asyncio.Event()
+
+    async def ticker():
+        while not done.is_set():
+            scheduled = time.perf_counter()
+            await asyncio.sleep(0.005)
+            lags.append(time.perf_counter() - scheduled - 0.005)
+
+    tick = asyncio.create_task(ticker())
+    max_pending = 0
+    start = time.perf_counter()
+    for _ in range(CHUNKS):
+        terminal.write(CHUNK)
+        max_pending = max(max_pending, terminal._pending_bytes)
+        await terminal.drain()
+    await terminal.close()
+    elapsed = time.perf_counter() - start
+    done.set()
+    await tick
+    return {"max_lag_s": max(lags), "max_pending": max_pending, "elapsed_s": elapsed}
+
+def test_slow_consumer_keeps_the_loop_responsive_and_gets_all_output():
+    out_read, out_write = os.pipe()
+    in_read, in_write = os.pipe()
+    received = []
+    consumer = threading.Thread(target=_slow_consumer, args=(out_read, received))
+    consumer.start()
+    with os.fdopen(out_write, "w") as stdout, os.fdopen(in_read, "r") as stdin:
+        result = asyncio.run(_produce(stdin, stdout))
+    os.close(in_write)
+    consumer.join(timeout=30)
+
+    assert b"".join(received) == (CHUNK * CHUNKS).encode()
+    # The consumer was the bottleneck, yet the loop kept ticking and the buffer stayed bounded
+    assert result["elapsed_s"] > 0.1
+    assert result["max_lag_s"] < 0.1
+    assert result["max_pending"] <= MAX_PENDING + len(CHUNK)
+
+def test_stderr_sharing_stdout_stays_blocking():
+    # A terminal opened once by the shell: stdin, stdout and stderr share one file description
+    master, slave = os.openpty()
+    stderr_fd = os.dup(slave)
+    stdin, stdout = os.fdopen(os.dup(slave), "r"), os.fdopen(os.dup(slave), "w")
+
+    async def session():
+        terminal = await AsyncTerminal(stdin=stdin, stdout=stdout).start()
+        try:
+            terminal.write("plan ready\n")
+            await terminal.flush_all()
+            return os.get_blocking(stderr_fd), os.get_blocking(stdout.fileno())
+        finally:
+            await terminal.close()
+
+    try:
+        during = asyncio.run(session())
+        assert during == (True, True)
+        assert os.get_blocking(stderr_fd) and os.get_blocking(stdin.fileno())
+        assert b"plan ready" in os.read(master, 1024)
+    finally:
+        stdin.close()
+        stdout.close()
+        for fd in (stderr_fd, slave, master):
+            os.close(fd)
+
+def test_writes_from_worker_threads_are_delivered():
+    out_read, out_write = os.pipe()
+    in_read, in_write = os.pipe()
+    received = []
+    consumer = threading.Thread(target=_slow_consumer, args=(out_read, received))
+    consumer.start()
+    lines = [f"tool output {i}\n" for i in range(200)]
+
+    async def session(stdin, stdout):
+        terminal = await AsyncTerminal(stdin=stdin, stdout=stdout).start()
+
+        def worker(batch):
+            for line in batch:
+                terminal.write(line)
+
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(None, worker, lines[i::4]) for i in range(4)))
+        await asyncio.sleep(0)  # Let the calls scheduled by the threads run
+        await terminal.close()
+
+    with os.fdopen(out_write, "w") as stdout, os.fdopen(in_read, "r") as stdin:
+        asyncio.run(session(stdin, stdout))
+    os.close(in_write)
+    consumer.join(timeout=30)
+
+    assert sorted(b"".join(received).decode().splitlines(keepends=True)) == sorted(lines)
@@ -0,0 +1,83 @@
+# tests/test_tool_cache.py
+
+import pytest
+from langchain_core.runnables import RunnableConfig
+from langchain_core.tools import tool
+import tool_cache
+from tool_cache import ToolResultCache, configure_tool_cache, memoized_tool, DEFAULT_MAX_ENTRIES
+from data import get_planning_data, new_planning_data
+
+CALLS = []
+
+@tool(response_format="content_and_artifact")
+@memoized_tool
+def finance(query: str, budget: float = 0, config: RunnableConfig = None) -> str:
+    """Counting stand-in for the finance tool."""
+    CALLS.append(query)
+    result = f"budget for {query}: {budget}"
+    get_planning_data(config)["finance_info"] = result
+    return result
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    CALLS.clear()
+    yield
+    configure_tool_cache()
+
+def _call(query: str, budget: float = 0, planning_data: dict = None):
+    message = finance.invoke({"name": "finance", "args": {"query": query, "budget": budget}, "id": "call_1",
+                              "type": "tool_call"}, {"configurable": {"planning_data": planning_data}})
+    return message.content, message.artifact["cache"]
+
+def test_hits_misses_and_counters_in_the_artifact():
+    configure_tool_cache(ttls={"finance": 60})
+    planning_data = new_planning_data()
+    _, first = _call("Birthday  Party", 500)
+    content, second = _call("birthday party", 500.0, planning_data)   # Same key once normalized
+    _, other = _call("birthday party", 800)
+
+    assert CALLS == ["Birthday  Party", "birthday party"]
+    assert first["hit"] is False and first["misses"] == 1
+    assert second["hit"] is True and second["hits"] == 1 and second["hit_rate"] == 0.5
+    assert other["hit"] is False and other["misses"] == 2
+    assert planning_data["finance_info"] == content   # A hit still writes the planning field
+
+def test_ttl_expiry(monkeypatch):
+    cache = configure_tool_cache(ttls={"finance": 10})
+    now = [1000.0]
+    monkeypatch.setattr(tool_cache.time, "monotonic", lambda: now[0])
+    _call("party")
+    now[0] += 5
+    assert _call("party")[1]["hit"] is True
+    now[0] += 11
+    assert _call("party")[1]["hit"] is False
+    assert CALLS == ["party", "party"]
+    assert cache.tool_stats("finance")["expired"] == 1
+
+def test_lru_eviction():
+    cache = ToolResultCache(max_entries=2, ttls={"finance": 60})
+    for key in ("a", "b"):
+        cache.put("finance", f'["finance", "{key}"]', key)
+    assert cache.get("finance", '["finance", "a"]')[0] == "a"   # "b" is now the least recently used
+    cache.put("finance", '["finance", "c"]', "c")
+
+    assert cache.get("finance", '["finance", "b"]') is None
+    assert cache.get("finance", '["finance", "a"]')[0] == "a"
+    assert cache.get("finance", '["finance", "c"]')[0] == "c"
+    assert cache.tool_stats("finance")["evictions"] == 1
+    assert cache.stats()["entries"] == 2
+
+def test_ttl_zero_opts_out():
+    configure_tool_cache(ttls={"finance": 0})
+    _, first = _call("party")
+    _, second = _call("party")
+    assert CALLS == ["party", "party"]
+    assert first == second == {"hit": False, "enabled": False}
+
+def test_calendar_is_never_shared_between_sessions():
+    from tools import calendar
+    configure_tool_cache(DEFAULT_MAX_ENTRIES)
+    artifacts = [calendar.invoke({"name": "calendar", "args": {"query": "birthday party"}, "id": f"call_{i}",
+                                  "type": "tool_call"}, {"configurable": {"planning_data": new_planning_data()}}).artifact
+                 for i in range(2)]
+    assert [artifact["cache"]["hit"] for artifact in artifacts] == [False, False]
@@ -0,0 +1,85 @@
+# tests/test_tool_prefetch.py
+
+import asyncio
+from langchain_core.messages import HumanMessage
+from langchain_core.runnables import RunnableLambda
+from langchain_core.tools import tool
+import tool_prefetch
+from main import create_event_planning_graph, make_session_config, communication_tools
+from fake_model import FakeChatModel, FAKE_SCRIPTS
+from batch import plan_request
+
+REQUEST = "Plan a birthday party at home for 20 people"
+
+@tool
+async def calendar(query: str) -> str:
+    """Slow calendar lookup."""
+    await asyncio.sleep(5)
+    return query
+
+@tool
+async def finance(query: str) -> str:
+    """Slow budget estimate."""
+    await asyncio.sleep(5)
+    return query
+
+@tool
+async def health(query: str) -> str:
+    """Slow health guidelines."""
+    await asyncio.sleep(5)
+    return query
+
+SLOW_TOOLS = [calendar, finance, health]
+
+def _graph(scheduler_model):
+    fake = FakeChatModel()
+    return create_event_planning_graph(scheduler_model, fake.bind_tools(communication_tools),
+                                       tool_prefetch=True, scheduler_tool_list=SLOW_TOOLS)
+
+async def _all_cancelled(prefetcher) -> bool:
+    """Checked inside the loop: asyncio.run() cancels leftover tasks when it returns."""
+    tasks = [task for _, task in prefetcher._pending.values()]
+    await asyncio.wait(tasks, timeout=1)   # The slow tools would need 5 s
+    return bool(tasks) and all(task.cancelled() for task in tasks)
+
+def test_scheduler_turn_without_tool_calls_cancels_prefetches():
+    # The scheduler answers in text right away, so the tool node never runs
+    no_tools = FakeChatModel(scripts={event_type: [] for event_type in FAKE_SCRIPTS})
+    app = _graph(no_tools.bind_tools(SLOW_TOOLS))
+
+    async def run():
+        config = make_session_config()
+        await app.ainvoke({"messages": [HumanMessage(content=REQUEST)], "current_agent": "orchestrator",
+                           "next_action": "scheduler"}, config)
+        prefetcher = tool_prefetch.get_prefetcher(config)
+        return prefetcher, await _all_cancelled(prefetcher)
+
+    prefetcher, cancelled = asyncio.run(run())
+    assert prefetcher.counters["prefetched"] == 3
+    assert not prefetcher.open
+    assert cancelled
+
+def test_failed_batch_session_cancels_prefetches(monkeypatch):
+    started = []
+    original_start = tool_prefetch.ToolPrefetcher.start
+
+    def recording_start(self, request):
+        started.append(self)
+        return original_start(self, request)
+
+    monkeypatch.setattr(tool_prefetch.ToolPrefetcher, "start", recording_start)
+
+    def failing_scheduler(messages):
+        raise RuntimeError("model backend unavailable")
+
+    app = _graph(RunnableLambda(failing_scheduler))
+
+    async def run():
+        try:
+            await plan_request(app, {"request": REQUEST})
+        except RuntimeError:
+            pass
+        return await _all_cancelled(started[0])
+
+    assert asyncio.run(run())
+    assert len(started) == 1
@@ -0,0 +1,160 @@
+# tool_cache.py
+
+import json
+import time
+import inspect
+import functools
+import threading
+from collections import OrderedDict
+from data import get_planning_data, TOOL_PLANNING_FIELDS
+
+# ============================================================================
+# IN-PROCESS RESULT STORE
+# ============================================================================
+
+DEFAULT_MAX_ENTRIES = 1024
+# Seconds a result stays valid, per tool: forecasts and traffic change quickly,
+# budget and health guidelines hardly at all. 0 (or no entry) never caches. The
+# cache is shared across sessions, so calendar (one user's availability) is never cached.
+DEFAULT_TOOL_TTLS = {
+    "calendar": 0,
+    "finance": 3600.0,
+    "health": 24 * 3600.0,
+    "weather": 600.0,
+    "traffic": 120.0,
+}
+
+class ToolResultCache:
+    """
+    In-process memo of tool results with per-tool TTLs and LRU eviction.
+
+    Entries are keyed on the tool name and its normalized arguments. A result
+    older than the tool's TTL is a miss; beyond `max_entries` the least recently
+    used entry is evicted. Hit/miss counters are kept per tool and reported by
+    stats(). Tools run in executor threads, so every access takes a lock.
+
+    Args:
+        max_entries: Maximum number of cached results across all tools.
+        ttls: TTL in seconds by tool name; a tool with no TTL (or 0) is never cached.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttls: dict = None):
+        self.max_entries = max_entries
+        self.ttls = dict(DEFAULT_TOOL_TTLS if ttls is None else ttls)
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()   # key -> (result, created)
+        self.counters = {}              # tool name -> {"hits", "misses", "expired", "evictions"}
+
+    def _counter(self, name: str) -> dict:
+        return self.counters.setdefault(name, {"hits": 0, "misses": 0, "expired": 0, "evictions": 0})
+
+    def enabled(self, name: str) -> bool:
+        return bool(self.ttls.get(name))
+
+    def get(self, name: str, key: str):
+        """Return (result, age_s) for `key`, or None on a miss (counted either way)."""
+        now = time.monotonic()
+        with self._lock:
+            counter = self._counter(name)
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[1] > self.ttls.get(name, 0):
+                del self._entries[key]
+                counter["expired"] += 1
+                entry = None
+            if entry is None:
+                counter["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            counter["hits"] += 1
+            return entry[0], now - entry[1]
+
+    def put(self, name: str, key: str, result) -> None:
+        with self._lock:
+            self._entries[key] = (result, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                self._counter(json.loads(evicted)[0])["evictions"] += 1
+
+    def clear(self, name: str = None) -> None:
+        """Drop every cached result, or only those of tool `name`."""
+        with self._lock:
+            for key in [key for key in self._entries if name is None or json.loads(key)[0] == name]:
+                del self._entries[key]
+
+    def tool_stats(self, name: str) -> dict:
+        """Counters and hit rate of one tool."""
+        with self._lock:
+            counter = dict(self._counter(name))
+        lookups = counter["hits"] + counter["misses"]
+        return {**counter, "hit_rate": round(counter["hits"] / lookups, 4) if lookups else 0.0}
+
+    def stats(self) -> dict:
+        """Per-tool counters plus totals: {"tools": {name: {...}}, "hits", "misses", "hit_rate", "entries"}."""
+        tools = {name: self.tool_stats(name) for name in sorted(self.counters)}
+        hits = sum(s["hits"] for s in tools.values())
+        misses = sum(s["misses"] for s in tools.values())
+        return {"tools": tools, "hits": hits, "misses": misses,
+                "hit_rate": hits / (hits + misses) if hits + misses else 0.0, "entries": len(self._entries)}
+
+_tool_cache = ToolResultCache()
+
+def get_tool_cache() -> ToolResultCache:
+    """The process-wide cache shared by every memoized tool."""
+    return _tool_cache
+
+def configure_tool_cache(max_entries: int = DEFAULT_MAX_ENTRIES, ttls: dict = None) -> ToolResultCache:
+    """Replace the shared cache, e.g. with the limits from main.py's configuration."""
+    global _tool_cache
+    _tool_cache = ToolResultCache(max_entries, ttls)
+    return _tool_cache
+
+# ============================================================================
+# MEMOIZING DECORATOR
+# ============================================================================
+
+def _normalize(value):
+    """Argument value as compared in the cache key: strings case-folded with whitespace collapsed."""
+    if isinstance(value, str):
+        return " ".join(value.casefold().split())
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+def memoized_tool(func):
+    """
+    Memoize a tool function in the shared ToolResultCache. Put it under @tool with
+    response_format="content_and_artifact": the function's result is the content,
+    and the artifact reports the lookup ({"cache": {"hit", "age_s", "hits",
+    "misses", "hit_rate", ...}}) so hit rates are visible next to each output.
+
+    The key is the tool name plus the normalized arguments with defaults filled
+    in; the injected `config` is not part of it. A hit still writes the tool's
+    planning field (TOOL_PLANNING_FIELDS), as the function itself would have.
+    Tools whose output must always be fresh opt out with a TTL of 0.
+    """
+    name = func.__name__
+    signature = inspect.signature(func)
+    field = TOOL_PLANNING_FIELDS.get(name)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        cache = get_tool_cache()
+        if not cache.enabled(name):
+            return func(*args, **kwargs), {"cache": {"hit": False, "enabled": False}}
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        config = bound.arguments.get("config")
+        key = json.dumps([name, {arg: _normalize(value) for arg, value in bound.arguments.items() if arg != "config"}],
+                         sort_keys=True, default=str)
+        cached = cache.get(name, key)
+        if cached is not None:
+            result, age_s = cached
+            if field:
+                get_planning_data(config)[field] = result
+            return result, {"cache": {"hit": True, "age_s": round(age_s, 3), **cache.tool_stats(name)}}
+        result = func(*args, **kwargs)
+        cache.put(name, key, result)
+        return result, {"cache": {"hit": False, **cache.tool_stats(name)}}
+
+    return wrapper
@@ -0,0 +1,202 @@
+# tool_prefetch.py
+
+import re
+import time
+import asyncio
+from langchain_core.messages import ToolMessage
+from langchain_core.runnables.config import get_async_callback_manager_for_config
+from data import new_planning_data
+
+# ============================================================================
+# PREDICTION
+# ============================================================================
+
+# Tools the scheduler prompt asks for, by what the request mentions (see SCHEDULER_SYSTEM_PROMPT):
+# every event gets calendar; events with guests and food get finance and health;
+# outdoor events add weather and events at a venue add traffic.
+MEETING_PATTERN = re.compile(r"\b(?:meeting|standup|stand-up|sync|call|review|interview)\b")
+OUTDOOR_PATTERN = re.compile(r"\b(?:outdoor|outside|picnic|park|beach|garden|festival|barbecue|bbq|camping|rooftop|wedding)\b")
+VENUE_PATTERN = re.compile(r"\b(?:downtown|venue|restaurant|city|hotel|conference|office|hall|club|reception)\b")
+
+MONTHS = ["january", "february", "march", "april", "may", "june", "july", "august", "september",
+          "october", "november", "december"]
+_MONTH_NAMES = "|".join(MONTHS + [month[:3] for month in MONTHS])
+_NUMERIC_DATE = re.compile(r"\b(\d{1,2})/(\d{1,2})\b")                                    # 5/6 -> month 5, day 6
+_MONTH_DAY = re.compile(rf"\b({_MONTH_NAMES})\.?\s+(\d{{1,2}})(?:st|nd|rd|th)?\b")       # May 6th
+_DAY_MONTH = re.compile(rf"\b(\d{{1,2}})(?:st|nd|rd|th)?\s+(?:of\s+)?({_MONTH_NAMES})\b")  # 6th of May
+_AMOUNT = re.compile(r"\$\s?(\d[\d,]*)|\b(\d[\d,]*)\s*(?:dollars|usd)\b|\bbudget (?:of |is )?\$?(\d[\d,]*)")
+
+def predict_tools(request: str) -> list:
+    """Scheduler tools the model is likely to call first for `request`."""
+    text = request.lower()
+    tools = ["calendar"] if MEETING_PATTERN.search(text) else ["calendar", "finance", "health"]
+    if OUTDOOR_PATTERN.search(text):
+        tools.append("weather")
+    if VENUE_PATTERN.search(text):
+        tools.append("traffic")
+    return tools
+
+def _month_number(name: str) -> int:
+    return [month[:3] for month in MONTHS].index(name[:3]) + 1
+
+def extract_tool_args(request: str) -> dict:
+    """
+    Arguments a model would pass for the request, by argument name: the request as
+    `query`, plus `date`/`month` and `amount` when the request states them.
+    """
+    text = request.lower()
+    args = {"query": request}
+    numeric, month_day, day_month = _NUMERIC_DATE.search(text), _MONTH_DAY.search(text), _DAY_MONTH.search(text)
+    if numeric and 1 <= int(numeric[1]) <= 12:
+        args["month"], args["date"] = int(numeric[1]), int(numeric[2])
+    elif month_day:
+        args["month"], args["date"] = _month_number(month_day[1]), int(month_day[2])
+    elif day_month:
+        args["month"], args["date"] = _month_number(day_month[2]), int(day_month[1])
+    amount = _AMOUNT.search(text)
+    if amount:
+        args["amount"] = int(next(group for group in amount.groups() if group).replace(",", ""))
+    return args
+
+# ============================================================================
+# SPECULATIVE EXECUTION
+# ============================================================================
+
+DESCRIPTIVE_ARGS = ("query",)   # Free-text descriptions of the event; not compared when matching
+
+class ToolPrefetcher:
+    """
+    Speculative tool results for one planning session.
+
+    `start()` runs the predicted tools concurrently with the first scheduler model
+    call. Each run gets a scratch planning_data, so a prediction the model never
+    confirms leaves the session untouched. `serve()` hands a model's tool call the
+    prefetched result when the tool and its structured arguments match (free-text
+    DESCRIPTIVE_ARGS describe the same request and are not compared), then copies
+    the tool's planning_data writes into the session.
+
+    Only the first tool batch after `start()` is served; `close()` ends the window
+    so a later re-planning round never gets results computed for the old request.
+    It is also called when the first scheduler turn calls no tools and when the
+    session ends (close_prefetch), so unserved runs are always cancelled.
+    """
+
+    def __init__(self, tools):
+        self.tools_by_name = {tool.name: tool for tool in tools}
+        self._pending = {}   # tool name -> (args, task)
+        self.open = False
+        self.counters = {"prefetched": 0, "hits": 0, "misses": 0, "failed": 0}
+        self.saved_s = 0.0
+
+    def start(self, request: str):
+        """Start the predicted tools for `request` in the background."""
+        args = extract_tool_args(request)
+        self.open = True
+        for name in predict_tools(request):
+            tool = self.tools_by_name.get(name)
+            if tool is None:
+                continue
+            call_args = {key: value for key, value in args.items() if key in tool.args}
+            self._pending[name] = (call_args, asyncio.create_task(self._run(tool, call_args)))
+            self.counters["prefetched"] += 1
+
+    @staticmethod
+    async def _run(tool, args: dict):
+        planning_data = new_planning_data()
+        started_at = time.perf_counter()
+        # No callbacks: speculative runs are not part of the session's trace until served.
+        content = await tool.ainvoke(args, {"configurable": {"planning_data": planning_data}, "callbacks": []})
+        return content, planning_data, time.perf_counter() - started_at
+
+    def _normalized(self, tool, args: dict) -> dict:
+        return {key: args.get(key, schema.get("default")) for key, schema in tool.args.items()
+                if key not in DESCRIPTIVE_ARGS}
+
+    def _take(self, tool_call: dict):
+        """Pop the prefetch matching `tool_call`, or None."""
+        entry = self._pending.get(tool_call["name"])
+        tool = self.tools_by_name.get(tool_call["name"])
+        if not self.open or entry is None:
+            return None
+        args, task = entry
+        if self._normalized(tool, args) != self._normalized(tool, tool_call["args"]):
+            return None
+        del self._pending[tool_call["name"]]
+        return task
+
+    async def serve(self, tool_call: dict, config) -> ToolMessage:
+        """The prefetched result for `tool_call` as a ToolMessage, or None to run the tool."""
+        task = self._take(tool_call)
+        if task is None:
+            self.counters["misses"] += 1
+            return None
+        waited_at = time.perf_counter()
+        try:
+            content, scratch, duration_s = await task
+        except Exception:
+            self.counters["failed"] += 1
+            return None
+        waited_s = time.perf_counter() - waited_at
+        self.counters["hits"] += 1
+        self.saved_s += max(0.0, duration_s - waited_s)
+
+        # Apply the tool's planning_data writes to the session
+        planning_data = config["configurable"]["planning_data"]
+        blank = new_planning_data()
+        planning_data.update({key: value for key, value in scratch.items() if value != blank.get(key)})
+
+        message = ToolMessage(content=content, name=tool_call["name"], tool_call_id=tool_call["id"])
+        message.response_metadata["timing"] = {"queue_wait_s": 0.0, "duration_s": round(waited_s, 6), "prefetched": True}
+
+        # Report it like a tool run so event streams and metrics still see the call
+        manager = get_async_callback_manager_for_config(config)
+        manager.add_tags(["prefetched"])
+        run = await manager.on_tool_start({"name": tool_call["name"]}, str(tool_call["args"]), name=tool_call["name"],
+                                          inputs=tool_call["args"])
+        await run.on_tool_end(message)
+        return message
+
+    def close(self):
+        """End the serving window; unserved prefetches are counted as wasted."""
+        self.open = False
+        for _, task in self._pending.values():
+            task.cancel()
+
+    def stats(self) -> dict:
+        hits = self.counters["hits"]
+        calls = hits + self.counters["misses"] + self.counters["failed"]
+        return {**self.counters,
+                "wasted": self.counters["prefetched"] - hits - self.counters["failed"],
+                "hit_rate": hits / calls if calls else 0.0,
+                "saved_ms": round(self.saved_s * 1000, 3)}
+
+# ============================================================================
+# SESSION HOOKS
+# ============================================================================
+
+# make_session_config() gives every session an empty "tool_prefetch" slot; nodes of the
+# same session share it, so the orchestrator can start what the scheduler's tool node serves.
+
+def start_prefetch(config, request: str, tools) -> ToolPrefetcher:
+    """Start speculative tool runs for a session routed to the scheduler."""
+    slot = config["configurable"].get("tool_prefetch")
+    if slot is None:
+        return None
+    prefetcher = slot["prefetcher"] = ToolPrefetcher(tools)
+    prefetcher.start(request)
+    return prefetcher
+
+def get_prefetcher(config) -> ToolPrefetcher:
+    slot = (config or {}).get("configurable", {}).get("tool_prefetch")
+    return slot.get("prefetcher") if slot else None
+
+def close_prefetch(config) -> None:
+    """Cancel a session's unserved speculative runs, e.g. at session teardown."""
+    prefetcher = get_prefetcher(config)
+    if prefetcher is not None:
+        prefetcher.close()
+
+def prefetch_stats(config) -> dict:
+    """Hit rate and latency saved by speculative tool runs in a session (None if none ran)."""
+    prefetcher = get_prefetcher(config)
+    return prefetcher.stats() if prefetcher else None
@@ -2,16 +2,19 @@
 
 import random
 from datetime import datetime
+from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import tool
-from data import event_planning_data, WEATHER_DATA
+from data import get_planning_data, get_weather_data
+from tool_cache import memoized_tool
 from typing import Optional
 
 # ============================================================================
 # ENHANCED SCHEDULER AGENT TOOLS (6 tools)
 # ============================================================================
 
-@tool
-def calendar(query: str, date: Optional[int] = None, month: Optional[int] = None, periodic_event: bool = False) -> str:
+@tool(response_format="content_and_artifact")
+@memoized_tool
+def calendar(query: str, config: RunnableConfig, date: Optional[int] = None, month: Optional[int] = None, periodic_event: bool = False) -> str:
     """
     Check calendar events and availability for specific dates and times.
     
@@ -56,7 +59,7 @@ def calendar(query: str, date: Optional[int] = None, month: Optional[int] = None
         else:
             result += f"Available time slots found. No major conflicts detected."
     
-    event_planning_data["calendar_info"] = result
+    get_planning_data(config)["calendar_info"] = result
     return result
 
 def create_budget_breakdown(event_type: str, budget: float, guest_count: int, query: str) -> str:
@@ -121,8 +124,9 @@ def get_minimum_budget(event_type: str, guest_count: int) -> float:
     per_person_cost = base_costs.get(event_type, 20)
     return per_person_cost * guest_count
 
-@tool
-def finance(query: str, amount: int = 500) -> str:
+@tool(response_format="content_and_artifact")
+@memoized_tool
+def finance(query: str, config: RunnableConfig, amount: int = 500) -> str:
     """
     Analyze budget requirements and provide cost estimates for events.
     
@@ -169,11 +173,12 @@ def finance(query: str, amount: int = 500) -> str:
     
     # Now it's safe to use +=
     result += create_budget_breakdown(event_type, budget_amount, guest_count, query)
-    event_planning_data["finance_info"] = result
+    get_planning_data(config)["finance_info"] = result
     return result
 
-@tool
-def health(query: str) -> str:
+@tool(response_format="content_and_artifact")
+@memoized_tool
+def health(query: str, config: RunnableConfig) -> str:
     """
     Check health and safety considerations, dietary restrictions, and accessibility needs.
     
@@ -201,11 +206,12 @@ def health(query: str) -> str:
     else:
         result = "🏥 General Health & Safety Guidelines:\n- Ensure venue accessibility.\n- Have emergency contact information."
     
-    event_planning_data["health_info"] = result
+    get_planning_data(config)["health_info"] = result
     return result
 
-@tool
-def weather(query: str, date: Optional[int] = None, month: Optional[int] = None) -> str:
+@tool(response_format="content_and_artifact")
+@memoized_tool
+def weather(query: str, config: RunnableConfig, date: Optional[int] = None, month: Optional[int] = None) -> str:
     """
     Get weather forecasts and climate considerations for event planning.
     
@@ -229,6 +235,7 @@ def weather(query: str, date: Optional[int] = None, month: Optional[int] = None)
         str: A detailed description of weather considerations and climate needs.
     """
     query_lower = query.lower()
+    WEATHER_DATA = get_weather_data()
     
     # FIX: The logic is now mutually exclusive using if/elif. This prevents
     # a general query like "outdoor party" from overwriting a specific date forecast.
@@ -255,11 +262,12 @@ def weather(query: str, date: Optional[int] = None, month: Optional[int] = None)
     else:
         result = random.choice(WEATHER_DATA["general_forecasts"])
         
-    event_planning_data["weather_info"] = result
+    get_planning_data(config)["weather_info"] = result
     return result
 
-@tool
-def traffic(query: str) -> str:
+@tool(response_format="content_and_artifact")
+@memoized_tool
+def traffic(query: str, config: RunnableConfig) -> str:
     """
     Analyze transportation, parking, and accessibility for event venues.
     
@@ -282,11 +290,11 @@ def traffic(query: str) -> str:
     else:
         result = f"🚗 Traffic analysis for: {query}. Check venue accessibility and parking options."
         
-    event_planning_data["traffic_info"] = result
+    get_planning_data(config)["traffic_info"] = result
     return result
 
 @tool
-def invite_people(query: str) -> str:
+def invite_people(query: str, config: RunnableConfig) -> str:
     """
     Generate invitation content and manage guest lists based on event type and formality.
     
@@ -326,7 +334,7 @@ Venue: [Event Location]
 
 RSVP by [Date]"""
         
-    event_planning_data["invitation_info"] = result
+    get_planning_data(config)["invitation_info"] = result
     return result
 
 # ============================================================================
@@ -334,7 +342,7 @@ RSVP by [Date]"""
 # ============================================================================
 
 @tool
-def whatsapp_message(message: str, contacts: str = "auto_detect") -> str:
+def whatsapp_message(message: str, config: RunnableConfig, contacts: str = "auto_detect") -> str:
     """
     Send WhatsApp messages to specified contact groups.
     
@@ -359,11 +367,11 @@ To: {contacts}
 Message Preview: {message[:100]}...
 Status: ✅ Delivered to all contacts"""
     
-    event_planning_data["whatsapp_status"] = result
+    get_planning_data(config)["whatsapp_status"] = result
     return result
 
 @tool
-def email_message(message: str, contacts: str = "auto_detect") -> str:
+def email_message(message: str, config: RunnableConfig, contacts: str = "auto_detect") -> str:
     """
     Send formal email invitations to specified email contact lists.
     
@@ -389,5 +397,5 @@ Subject: Event Invitation
 Message: {message[:100]}...
 Status: ✅ Sent to all recipients"""
     
-    event_planning_data["email_status"] = result
+    get_planning_data(config)["email_status"] = result
     return result